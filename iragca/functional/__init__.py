@@ -1,3 +1,24 @@
-from .pipeline import Pipeline, Step
+from .cache import CacheInfo, StepCache, stable_hash
+from .checkpoint import CheckpointStore
+from .graph import Graph, Node, branch, merge, parallel
+from .pipeline import Pipeline, Step, identity
+from .profiling import StepHook, StepProfiler
+from .stages import StagedStream
 
-__all__ = ["Pipeline", "Step"]
+__all__ = [
+    "CacheInfo",
+    "CheckpointStore",
+    "Graph",
+    "Node",
+    "Pipeline",
+    "StagedStream",
+    "Step",
+    "StepCache",
+    "StepHook",
+    "StepProfiler",
+    "branch",
+    "identity",
+    "merge",
+    "parallel",
+    "stable_hash",
+]
@@ -0,0 +1,107 @@
+import asyncio
+from collections import deque
+import inspect
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+
+def is_async(step: Any) -> bool:
+    """
+    Return whether calling ``step`` returns a coroutine.
+
+    Detects coroutine functions, `Step` objects and `functools.partial` objects
+    wrapping them, and objects with an ``async def __call__``.
+    """
+    func = step
+    while callable(getattr(func, "func", None)):
+        func = func.func
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def plan(steps: list) -> list[tuple[Any, bool, bool]]:
+    """
+    Return ``(step, batched, is_async)`` for every step, detected once per run.
+    """
+    return [(step, getattr(step, "batched", False), is_async(step)) for step in steps]
+
+
+async def run(plan: list, value: Any, offload: bool = False) -> Any:
+    """
+    Run one value through a plan made by `plan`, awaiting coroutine steps.
+
+    Synchronous steps run on the event loop, or in the default thread pool with
+    ``offload=True``. Awaitables returned by synchronous steps are awaited too.
+    """
+    for step, batched, awaited in plan:
+        if batched:
+            value = [value]
+        if awaited:
+            value = await step(value)
+        elif offload:
+            value = await asyncio.to_thread(step, value)
+        else:
+            value = step(value)
+        if not awaited and inspect.isawaitable(value):
+            value = await value
+        if batched:
+            value = value[0]
+    return value
+
+
+async def amap(
+    plan: list,
+    iterable: AsyncIterable | Iterable,
+    concurrency: int = 1,
+    ordered: bool = True,
+    offload: bool = False,
+) -> AsyncIterator:
+    """
+    Run a plan over every item of a (async) iterable with up to ``concurrency`` items in flight.
+
+    The first ``concurrency`` items are scheduled right away. After that, a new
+    item is pulled only once the consumer has taken a result, so at most
+    ``concurrency`` items are scheduled or waiting to be consumed, and a slow
+    consumer or slow steps hold back the producer. Unfinished items are
+    cancelled when the generator is closed or a step raises.
+    """
+    items = _aiter(iterable)
+    pending = deque()
+    exhausted = False
+
+    async def fill():
+        nonlocal exhausted
+        while not exhausted and len(pending) < concurrency:
+            try:
+                item = await items.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            pending.append(asyncio.ensure_future(run(plan, item, offload)))
+
+    try:
+        await fill()
+        while pending:
+            if ordered:
+                result = await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = done.pop()
+                pending.remove(task)
+                result = task.result()
+            yield result
+            await fill()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _aiter(iterable: AsyncIterable | Iterable) -> AsyncIterator:
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
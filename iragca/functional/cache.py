@@ -0,0 +1,268 @@
+from collections import OrderedDict, namedtuple
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from types import CodeType, FunctionType
+from typing import Any, Callable
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "disk_hits", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class StepCache:
+    """
+    Memoize the results of a pipeline step, in memory and optionally on disk.
+
+    Results are keyed by `stable_hash` of the step's function, its bound
+    arguments and the input value, so keys are the same across processes and
+    restarts. The memory tier is an LRU of at most ``maxsize`` entries. The disk
+    tier stores one pickle per key in ``directory``, so a rerun in a new process
+    can skip work that is already done. Entries older than ``ttl`` seconds are
+    treated as missing in both tiers.
+
+    Used through `Step`: ``Step(func, cache=True)`` or
+    ``Step(func, cache=StepCache(...))``. Safe to share between threads.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of results kept in memory. With ``None``, unbounded.
+    ttl : float, optional
+        Lifetime of a result in seconds. With ``None``, results never expire.
+    directory : str or Path, optional
+        Directory of the disk tier. Created if needed. Without it, results are
+        only kept in memory.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from memory or disk.
+    misses : int
+        Lookups that had to call the step.
+    disk_hits : int
+        Hits answered from disk.
+
+    Examples
+    --------
+    >>> cache = StepCache(maxsize=10_000, ttl=3600, directory=".cache/tokenize")
+    >>> tokens = Step(tokenize, vocab, cache=cache)
+    >>> pipeline = Pipeline([load, tokens])
+    >>> pipeline.cache_info()
+    {Step(tokenize, cache=True): CacheInfo(hits=0, misses=0, disk_hits=0, maxsize=10000, currsize=0)}
+    >>> pipeline.cache_info()[tokens].hits
+    0
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        ttl: float | None = None,
+        directory: str | Path | None = None,
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def call(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the result stored under ``key``, or compute, store and return it.
+
+        Concurrent misses on the same key may both compute; the last result wins.
+        """
+        value = self._get(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            self.misses += 1
+        value = compute()
+        self._put(key, value)
+        return value
+
+    def info(self) -> CacheInfo:
+        """
+        Return the hit and miss counters and the number of results in memory.
+        """
+        return CacheInfo(self.hits, self.misses, self.disk_hits, self.maxsize, len(self._entries))
+
+    def clear(self, disk: bool = False):
+        """
+        Drop the results kept in memory, and with ``disk=True`` the disk tier too.
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk and self.directory is not None:
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+    def _get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or now < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        if self.directory is None:
+            return _MISSING
+        try:
+            with open(self.directory / f"{key}.pkl", "rb") as file:
+                expires, value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        if expires is not None and now >= expires:
+            return _MISSING
+        self._remember(key, expires, value)
+        with self._lock:
+            self.hits += 1
+            self.disk_hits += 1
+        return value
+
+    def _put(self, key: str, value: Any):
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        self._remember(key, expires, value)
+        if self.directory is None:
+            return
+        # Write to a temporary file first so readers never see a partial pickle
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump((expires, value), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.directory / f"{key}.pkl")
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def _remember(self, key: str, expires: float | None, value: Any):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def __getstate__(self) -> dict:
+        # Worker processes get the settings and the disk tier, not the memory tier
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_entries"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<StepCache(maxsize={self.maxsize}, ttl={self.ttl}, directory={self.directory})>"
+
+
+def stable_hash(value: Any) -> str:
+    """
+    Return a hex digest of ``value`` that is the same across processes and runs.
+
+    Unlike `hash`, the digest does not depend on hash randomization or object
+    identity. Containers are hashed by content (dicts and sets regardless of
+    order), NumPy arrays by dtype, shape and bytes, and functions by module,
+    qualified name, bytecode, constants, defaults and closure, so editing a
+    function changes its digest. A container or function that refers back to
+    itself, such as a recursive nested function, hashes the reference by its
+    depth. Other objects are hashed through their pickle.
+
+    Raises
+    ------
+    TypeError
+        If ``value`` contains an object that cannot be pickled.
+    """
+    return _digest(value, {})
+
+
+def _digest(value: Any, ancestors: dict) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, value, ancestors)
+    return digest.hexdigest()
+
+
+def _feed(digest, value: Any, ancestors: dict):
+    kind = type(value)
+    if value is None or kind in (bool, int, float, complex):
+        digest.update(f"{kind.__name__}:{value!r};".encode())
+    elif kind is str:
+        encoded = value.encode("utf-8", "surrogatepass")
+        digest.update(b"str:" + struct.pack("<Q", len(encoded)) + encoded)
+    elif kind is bytes or kind is bytearray:
+        digest.update(b"bytes:" + struct.pack("<Q", len(value)) + bytes(value))
+    elif kind in (tuple, list, dict, set, frozenset, FunctionType):
+        # Objects being hashed further up map to their depth, to cut cycles
+        depth = ancestors.get(id(value))
+        if depth is not None:
+            digest.update(f"ref:{depth};".encode())
+            return
+        ancestors[id(value)] = len(ancestors)
+        try:
+            _feed_nested(digest, value, kind, ancestors)
+        finally:
+            del ancestors[id(value)]
+    elif kind is CodeType:
+        digest.update(b"code:" + value.co_code)
+        _feed(digest, value.co_names, ancestors)
+        _feed(digest, value.co_consts, ancestors)
+    elif kind.__module__ == "numpy" and kind.__name__ == "ndarray":
+        digest.update(f"ndarray:{value.dtype.str}:{value.shape};".encode())
+        if value.dtype.hasobject:
+            _feed(digest, value.tolist(), ancestors)
+        else:
+            # Hash the buffer in place instead of copying it with tobytes
+            contiguous = value if value.flags.c_contiguous else value.copy(order="C")
+            digest.update(memoryview(contiguous.reshape(-1).view("uint8")))
+    else:
+        try:
+            payload = pickle.dumps(value, protocol=4)
+        except Exception as error:
+            raise TypeError(f"Cannot hash {kind.__name__} object for caching.") from error
+        digest.update(f"pickle:{kind.__module__}.{kind.__qualname__};".encode())
+        digest.update(payload)
+
+
+def _feed_nested(digest, value: Any, kind: type, ancestors: dict):
+    if kind is tuple or kind is list:
+        digest.update(f"{kind.__name__}:{len(value)}(".encode())
+        for item in value:
+            _feed(digest, item, ancestors)
+        digest.update(b")")
+    elif kind is dict:
+        items = sorted(
+            (_digest(key, ancestors), _digest(item, ancestors)) for key, item in value.items()
+        )
+        digest.update(f"dict:{len(items)}{items!r};".encode())
+    elif kind is set or kind is frozenset:
+        items = sorted(_digest(item, ancestors) for item in value)
+        digest.update(f"set:{len(items)}{items!r};".encode())
+    else:
+        digest.update(f"function:{value.__module__}.{value.__qualname__};".encode())
+        _feed(digest, value.__code__, ancestors)
+        _feed(digest, value.__defaults__, ancestors)
+        _feed(digest, value.__kwdefaults__, ancestors)
+        cells = value.__closure__ or ()
+        _feed(digest, tuple(cell.cell_contents for cell in cells), ancestors)
@@ -0,0 +1,148 @@
+import os
+from pathlib import Path
+import pickle
+import struct
+import tempfile
+from typing import Any, BinaryIO
+
+MAGIC = b"IRGCKPT1"
+
+_HEADER = struct.Struct("<8sIQ")
+_LENGTH = struct.Struct("<Q")
+
+
+class CheckpointStore:
+    """
+    Directory of pipeline intermediates, one file per key.
+
+    Values are pickled with protocol 5. Large buffers that support out-of-band
+    pickling, such as NumPy arrays, are written straight from memory after the
+    pickle stream instead of being copied into it. On load the file is read
+    once into a single buffer and the arrays are rebuilt as views of it.
+
+    Files are written to a temporary name and renamed, so an interrupted run
+    never leaves a partial checkpoint behind. Used by `Pipeline.run`.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory of the checkpoints. Created if needed.
+
+    Attributes
+    ----------
+    saved : int
+        Checkpoints written by this store.
+    loaded : int
+        Checkpoints read by this store.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.saved = 0
+        self.loaded = 0
+
+    def path(self, key: str) -> Path:
+        """
+        Return the file of the checkpoint stored under ``key``.
+        """
+        return self.directory / f"{key}.ckpt"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def save(self, key: str, value: Any):
+        """
+        Store ``value`` under ``key``, replacing any previous checkpoint.
+        """
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                dump(value, file)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self.saved += 1
+
+    def load(self, key: str) -> Any:
+        """
+        Return the value stored under ``key``.
+
+        Raises
+        ------
+        KeyError
+            If there is no checkpoint under ``key``.
+        ValueError
+            If the checkpoint file is corrupt or truncated.
+        """
+        try:
+            with open(self.path(key), "rb") as file:
+                value = load(file)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        self.loaded += 1
+        return value
+
+    def clear(self):
+        """
+        Delete every checkpoint in the directory.
+        """
+        for path in self.directory.glob("*.ckpt"):
+            path.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<CheckpointStore({str(self.directory)!r})>"
+
+
+def dump(value: Any, file: BinaryIO):
+    """
+    Write ``value`` to a binary file with pickle protocol 5 and out-of-band buffers.
+
+    The layout is a header (magic, number of buffers, length of the pickle),
+    the length of every buffer, the pickle stream and then the raw buffers.
+    """
+    buffers = []
+    stream = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    file.write(_HEADER.pack(MAGIC, len(views), len(stream)))
+    file.write(b"".join(_LENGTH.pack(view.nbytes) for view in views))
+    file.write(stream)
+    for view in views:
+        file.write(view)
+
+
+def load(file: BinaryIO) -> Any:
+    """
+    Read a value written by `dump`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a checkpoint or is truncated.
+    """
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Checkpoint is truncated.")
+    magic, count, size = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a checkpoint file.")
+    lengths = file.read(_LENGTH.size * count)
+    if len(lengths) < _LENGTH.size * count:
+        raise ValueError("Checkpoint is truncated.")
+    lengths = [length for (length,) in _LENGTH.iter_unpack(lengths)]
+
+    # Read the rest once; the buffers are views of this block
+    data = bytearray(size + sum(lengths))
+    if file.readinto(data) != len(data):
+        raise ValueError("Checkpoint is truncated.")
+    view = memoryview(data)
+    buffers = []
+    offset = size
+    for length in lengths:
+        buffers.append(view[offset : offset + length])
+        offset += length
+    try:
+        return pickle.loads(view[:size], buffers=buffers)
+    except (pickle.UnpicklingError, EOFError) as error:
+        raise ValueError("Checkpoint is corrupt.") from error
@@ -0,0 +1,147 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+import os
+import pickle
+from typing import Any, Iterable, Iterator
+
+EXECUTORS = ("thread", "process")
+
+# Compiled pipeline installed in each worker process by `_initialize`
+_worker_run = None
+
+
+def parallel_map(
+    pipeline,
+    iterable: Iterable,
+    executor: str,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    ordered: bool = True,
+    batch_size: int | None = None,
+) -> Iterator:
+    """
+    Run ``pipeline.map`` over chunks of ``iterable`` in a thread or process pool.
+
+    The input is consumed lazily: at most ``2 * workers`` chunks are in flight at
+    any time, so memory stays bounded. The pipeline is compiled once, not per
+    chunk. For process pools it is pickled once and compiled in each worker by
+    the pool initializer, instead of being sent with every chunk.
+
+    See `Pipeline.map` for the parameters.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}; expected one of {EXECUTORS}.")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    workers = workers or os.cpu_count() or 1
+    if executor == "thread":
+        make_pool = partial(ThreadPoolExecutor, workers)
+        task = pipeline._chunk_runner(batch_size)
+        chunksize = chunksize or 1
+    else:
+        # Pickle eagerly so that unpicklable steps fail at the call site
+        make_pool = partial(
+            ProcessPoolExecutor,
+            workers,
+            initializer=_initialize,
+            initargs=(dumps(pipeline), batch_size),
+        )
+        task = _run_worker
+        chunksize = chunksize or 64
+
+    chunks = _chunks(iterable, chunksize)
+    stream = _ordered if ordered else _unordered
+    return stream(make_pool, task, chunks, 2 * workers)
+
+
+def dumps(pipeline) -> bytes:
+    """
+    Pickle a pipeline for worker processes.
+
+    Steps, including the arguments bound with `Step`, are pickled with the
+    standard library. If that fails (e.g. for lambdas or local functions),
+    ``cloudpickle`` is used when installed.
+
+    Raises
+    ------
+    TypeError
+        If the pipeline cannot be pickled. The message names the first step that
+        cannot be pickled.
+    """
+    try:
+        return pickle.dumps(pipeline, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        try:
+            import cloudpickle
+        except ImportError:
+            raise TypeError(
+                f"Pipeline cannot be sent to worker processes: {_unpicklable(pipeline)!r} is not "
+                "picklable. Use module-level functions, install cloudpickle, or use "
+                "executor='thread'."
+            ) from error
+        return cloudpickle.dumps(pipeline, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpicklable(pipeline) -> Any:
+    for step in pipeline.steps:
+        try:
+            pickle.dumps(step)
+        except Exception:
+            return step
+    return pipeline
+
+
+def _initialize(payload: bytes, batch_size: int | None = None):
+    global _worker_run
+    _worker_run = pickle.loads(payload)._chunk_runner(batch_size)
+
+
+def _run_worker(chunk: list) -> list:
+    return _worker_run(chunk)
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _ordered(make_pool, task, chunks: Iterator[list], limit: int) -> Iterator:
+    pool = make_pool()
+    pending = deque()
+    try:
+        for chunk in islice(chunks, limit):
+            pending.append(pool.submit(task, chunk))
+        while pending:
+            results = pending.popleft().result()
+            for chunk in islice(chunks, 1):
+                pending.append(pool.submit(task, chunk))
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def _unordered(make_pool, task, chunks: Iterator[list], limit: int) -> Iterator:
+    pool = make_pool()
+    pending = set()
+    try:
+        for chunk in islice(chunks, limit):
+            pending.add(pool.submit(task, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results = future.result()
+                for chunk in islice(chunks, 1):
+                    pending.add(pool.submit(task, chunk))
+                yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
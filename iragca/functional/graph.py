@@ -0,0 +1,423 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+from typing import Any, Callable
+
+
+class Node:
+    """
+    A node of a `Graph`: a callable applied to the results of its input nodes.
+
+    Created with `Graph.input` and `Graph.add`.
+    """
+
+    __slots__ = ("graph", "index", "func", "inputs", "name")
+
+    def __init__(
+        self, graph: "Graph", index: int, func: Callable | None, inputs: tuple, name: str
+    ):
+        self.graph = graph
+        self.index = index
+        self.func = func
+        self.inputs = inputs
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<Node {self.name!r}>"
+
+
+class Graph:
+    """
+    A pipeline shaped as a directed acyclic graph, with independent nodes run concurrently.
+
+    Every node applies a callable to the results of its input nodes. Calling the
+    graph feeds the value to the input node and evaluates the nodes needed for
+    the outputs once each, so a node shared by several downstream nodes is
+    computed only once. Nodes whose inputs are ready run concurrently on a
+    thread pool; when a single node is ready it runs on the calling thread.
+
+    A graph is a callable of one value, so it can be used as a step of a
+    `Pipeline`, and ``|`` chains it with other steps. See `parallel`, `merge`
+    and `branch` for the common shapes.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Size of the thread pool, created on first use. Defaults to the
+        `concurrent.futures.ThreadPoolExecutor` default.
+
+    Examples
+    --------
+    >>> graph = Graph()
+    >>> text = graph.input()
+    >>> tokens = graph.add(tokenize, text)
+    >>> counts = graph.add(count_words, tokens)
+    >>> embedding = graph.add(embed, tokens)
+    >>> graph.output(counts=counts, embedding=embedding)
+    >>> graph("The quick brown fox")
+    {'counts': ..., 'embedding': ...}
+    """
+
+    def __init__(self, workers: int | None = None):
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.nodes = []
+        self._outputs = None
+        self._schedule = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def input(self) -> Node:
+        """
+        Return the node holding the value the graph is called with.
+        """
+        if not self.nodes:
+            self.nodes.append(Node(self, 0, None, (), "input"))
+        return self.nodes[0]
+
+    def add(self, func: Callable, *inputs: Node, name: str | None = None) -> Node:
+        """
+        Add a node that calls ``func`` with the results of ``inputs``, in order.
+
+        Parameters
+        ----------
+        func : Callable
+            Function of as many arguments as there are inputs, such as a `Step`
+            or a `Pipeline` for a single input.
+        *inputs : Node
+            Nodes of this graph. Defaults to the input node.
+        name : str, optional
+            Name shown in the representation. Defaults to the function name.
+
+        Returns
+        -------
+        Node
+            The new node, to use as an input of later nodes or as an output.
+
+        Raises
+        ------
+        TypeError
+            If ``func`` is not callable.
+        ValueError
+            If an input belongs to another graph.
+        """
+        if not callable(func):
+            raise TypeError("func must be callable")
+        inputs = inputs or (self.input(),)
+        for node in inputs:
+            if node.graph is not self:
+                raise ValueError(f"{node!r} belongs to another graph.")
+        if name is None:
+            name = getattr(func, "__name__", None) or repr(func)
+        node = Node(self, len(self.nodes), func, inputs, name)
+        self.nodes.append(node)
+        self._schedule = None
+        return node
+
+    def output(self, *nodes: Node | tuple[Node, ...], **named: Node) -> "Graph":
+        """
+        Choose what calling the graph returns.
+
+        One node returns its result, several return a tuple, and keyword
+        arguments return a dict. A single tuple of nodes returns a tuple even if
+        it holds one node. Defaults to the last node added.
+
+        Returns
+        -------
+        Graph
+            The graph instance (enables chaining).
+        """
+        if nodes and named:
+            raise ValueError("Pass outputs either by position or by name, not both.")
+        single = len(nodes) == 1 and not isinstance(nodes[0], tuple)
+        if len(nodes) == 1 and not single:
+            nodes = nodes[0]
+        for node in (*nodes, *named.values()):
+            if node.graph is not self:
+                raise ValueError(f"{node!r} belongs to another graph.")
+        self._outputs = named if named else nodes[0] if single else nodes
+        self._schedule = None
+        return self
+
+    def __call__(self, value: Any) -> Any:
+        """
+        Evaluate the graph on ``value``.
+
+        Raises
+        ------
+        ValueError
+            If the graph has no nodes besides its input.
+        """
+        schedule = self._plan()
+        children, indegree, outputs = schedule
+        results = [None] * len(self.nodes)
+        remaining = indegree.copy()
+        ready = deque()
+
+        def finish(index: int, result: Any):
+            results[index] = result
+            for child in children[index]:
+                remaining[child] -= 1
+                if not remaining[child]:
+                    ready.append(child)
+
+        finish(0, value)
+        running = {}
+        try:
+            while ready or running:
+                # Hand all but one ready node to the pool and run the last one here
+                while len(ready) > 1:
+                    index = ready.popleft()
+                    running[self._executor().submit(self._evaluate, index, results)] = index
+                if ready:
+                    index = ready.popleft()
+                    finish(index, self._evaluate(index, results))
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), future.result())
+        finally:
+            for future in running:
+                future.cancel()
+
+        if isinstance(outputs, dict):
+            return {key: results[index] for key, index in outputs.items()}
+        if isinstance(outputs, tuple):
+            return tuple(results[index] for index in outputs)
+        return results[outputs]
+
+    def close(self):
+        """
+        Shut the thread pool down. It is created again if the graph is called.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def __or__(self, other: Callable):
+        from .pipeline import Pipeline
+
+        return Pipeline([self]) | other
+
+    def __ror__(self, other: Callable):
+        from .pipeline import Pipeline
+
+        return Pipeline([other, self])
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_pool"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        lines = []
+        for node in self.nodes[1:]:
+            inputs = ", ".join(source.name for source in node.inputs)
+            lines.append(f"  {node.name} ⬅ {inputs}")
+        return "Graph(\n" + "\n".join(lines) + "\n)"
+
+    def __repr__(self) -> str:
+        return f"<Graph({len(self.nodes) - 1 if self.nodes else 0} nodes)>"
+
+    def _evaluate(self, index: int, results: list) -> Any:
+        node = self.nodes[index]
+        return node.func(*[results[source.index] for source in node.inputs])
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="graph")
+        return self._pool
+
+    def _plan(self) -> tuple:
+        """
+        Return the children and in-degree of every node needed for the outputs, computed once.
+        """
+        if self._schedule is not None:
+            return self._schedule
+        if len(self.nodes) < 2:
+            raise ValueError("The graph has no nodes besides its input.")
+
+        outputs = self._outputs if self._outputs is not None else self.nodes[-1]
+        if isinstance(outputs, dict):
+            targets, outputs = list(outputs.values()), {k: n.index for k, n in outputs.items()}
+        elif isinstance(outputs, tuple):
+            targets, outputs = list(outputs), tuple(node.index for node in outputs)
+        else:
+            targets, outputs = [outputs], outputs.index
+
+        # Only schedule the ancestors of the outputs
+        needed = set()
+        stack = [node.index for node in targets]
+        while stack:
+            index = stack.pop()
+            if index not in needed:
+                needed.add(index)
+                stack.extend(source.index for source in self.nodes[index].inputs)
+        needed.add(0)
+
+        children = [[] for _ in self.nodes]
+        indegree = [0] * len(self.nodes)
+        for index in sorted(needed):
+            for source in self.nodes[index].inputs:
+                children[source.index].append(index)
+                indegree[index] += 1
+        self._schedule = (children, indegree, outputs)
+        return self._schedule
+
+
+def parallel(*branches: Callable, workers: int | None = None, **named: Callable) -> Graph:
+    """
+    Fan one input out to several branches that run concurrently.
+
+    Each branch is a callable of one value, usually a `Step` or a `Pipeline`.
+    Pipelines are split into their steps, and steps shared by the start of
+    several branches (the same objects, in the same order) are computed once.
+
+    Parameters
+    ----------
+    *branches : Callable
+        Branches whose results are returned as a tuple.
+    workers : int, optional
+        Size of the thread pool, as in `Graph`.
+    **named : Callable
+        Branches whose results are returned as a dict.
+
+    Returns
+    -------
+    Graph
+        A graph returning a tuple or dict of the branch results. Chain it with
+        `merge` to combine them.
+
+    Examples
+    --------
+    >>> clean = Step(normalize, form="NFKC")
+    >>> features = parallel(
+    ...     words=Pipeline([clean, tokenize, count_words]),
+    ...     chars=Pipeline([clean, count_chars]),
+    ... ) | merge(lambda words, chars: {**words, **chars})
+    """
+    from .pipeline import Pipeline, _flatten
+
+    if branches and named:
+        raise ValueError("Pass branches either by position or by name, not both.")
+    if not branches and not named:
+        raise ValueError("parallel needs at least one branch.")
+
+    graph = Graph(workers)
+    source = graph.input()
+    prefixes = {}
+    ends = []
+    for branch in (*branches, *named.values()):
+        steps = list(_flatten(branch.steps)) if isinstance(branch, Pipeline) else [branch]
+        node, key = source, ()
+        for step in steps:
+            # Branches starting with the same step objects share their nodes
+            key += (id(step),)
+            if key not in prefixes:
+                prefixes[key] = graph.add(step, node)
+            node = prefixes[key]
+        ends.append(node)
+
+    if named:
+        return graph.output(**dict(zip(named, ends)))
+    return graph.output(tuple(ends))
+
+
+def merge(func: Callable) -> Callable[[tuple | dict], Any]:
+    """
+    Combine the results of `parallel` with one function.
+
+    A tuple is passed to ``func`` as positional arguments and a dict as keyword
+    arguments.
+
+    Returns
+    -------
+    Callable
+        A picklable step of one value.
+
+    Raises
+    ------
+    TypeError
+        If ``func`` is not callable.
+
+    Examples
+    --------
+    >>> total = parallel(sum, len) | merge(lambda total, count: total / count)
+    >>> total([1, 2, 3])
+    2.0
+    """
+    if not callable(func):
+        raise TypeError("func must be callable")
+    return _Merge(func)
+
+
+def branch(
+    predicate: Callable[[Any], bool], then: Callable, otherwise: Callable | None = None
+) -> Callable[[Any], Any]:
+    """
+    Route each value to one of two steps depending on a predicate.
+
+    Values for which ``predicate`` is false go to ``otherwise``, or are passed
+    through unchanged without it.
+
+    Returns
+    -------
+    Callable
+        A picklable step of one value.
+
+    Raises
+    ------
+    TypeError
+        If ``predicate``, ``then`` or ``otherwise`` is not callable.
+
+    Examples
+    --------
+    >>> load = branch(lambda path: path.endswith(".gz"), read_gzip, otherwise=read_text)
+    >>> pipeline = Pipeline([load, parse])
+    """
+    if not callable(predicate) or not callable(then):
+        raise TypeError("predicate and then must be callable")
+    if otherwise is not None and not callable(otherwise):
+        raise TypeError("otherwise must be callable")
+    return _Branch(predicate, then, otherwise)
+
+
+class _Merge:
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable):
+        self.func = func
+
+    def __call__(self, values: tuple | dict) -> Any:
+        if isinstance(values, dict):
+            return self.func(**values)
+        return self.func(*values)
+
+    def __repr__(self) -> str:
+        return f"merge({getattr(self.func, '__name__', repr(self.func))})"
+
+
+class _Branch:
+    __slots__ = ("predicate", "then", "otherwise")
+
+    def __init__(self, predicate: Callable, then: Callable, otherwise: Callable | None):
+        self.predicate = predicate
+        self.then = then
+        self.otherwise = otherwise
+
+    def __call__(self, value: Any) -> Any:
+        if self.predicate(value):
+            return self.then(value)
+        return self.otherwise(value) if self.otherwise is not None else value
+
+    def __repr__(self) -> str:
+        return f"branch({self.then!r}, otherwise={self.otherwise!r})"
@@ -1,4 +1,15 @@
-from typing import Any, Callable, Union
+import inspect
+from itertools import islice
+import keyword
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Literal, Union
+
+from . import aio
+from .cache import CacheInfo, StepCache, stable_hash
+from .checkpoint import CheckpointStore
+from .executors import parallel_map
+from .profiling import StepHook, StepProfiler, _step_name
+from .stages import StagedStream, check_stages
 
 
 class Step:
@@ -12,12 +23,35 @@ class Step:
     *args
         Positional arguments to pass to `func` when called.
     **kwargs
-        Keyword arguments to pass to `func` when called.
+        Keyword arguments to pass to `func` when called. ``description``,
+        ``batched``, ``cache`` and ``checkpoint`` are reserved for the step itself.
+
+    Attributes
+    ----------
+    description : str or None
+        Free-form description shown in the representation.
+    batched : bool
+        Whether `func` is batch-aware: it takes a list of values (or the
+        array returned by the previous batch-aware step) and returns one
+        result per value. See `Pipeline.map`.
+    is_async : bool
+        Whether `func` is a coroutine function. Calling such a step returns a
+        coroutine; use `Pipeline.acall` or `Pipeline.amap` to await it.
+    cache : StepCache or None
+        Memoizes results when given ``cache=True`` (a default `StepCache`) or
+        a `StepCache`. Results are keyed by a stable hash of the input and of the
+        function and bound arguments, which are hashed once, on first use: do
+        not mutate bound arguments of a cached step afterwards.
+    checkpoint : bool
+        Whether `Pipeline.run` saves the output of this step so that a later run
+        can resume after it.
 
     Raises
     ------
     TypeError
         If `func` is not callable.
+    ValueError
+        If caching is requested for a coroutine function.
 
     Notes
     -----
@@ -36,6 +70,20 @@ class Step:
     >>> step2(5)
     35
 
+    >>> async def fetch(x, url):
+    ...     ...
+    >>> step3 = Step(fetch, url="http://localhost:8000")
+    >>> step3.is_async
+    True
+
+    >>> step4 = Step(expensive_parse, schema, cache=StepCache(ttl=3600, directory=".cache"))
+    >>> step4.cache_info()
+    CacheInfo(hits=0, misses=0, disk_hits=0, maxsize=1024, currsize=0)
+
+    >>> step5 = Step(np.sqrt, batched=True)
+    >>> list(Pipeline([step5]).map([1.0, 4.0, 9.0], batch_size=2))
+    [1.0, 2.0, 3.0]
+
     Methods
     -------
     __call__(value: Any) -> Any
@@ -53,15 +101,47 @@ class Step:
         self.args = args
         self.kwargs = kwargs
         self.description = kwargs.pop("description", None)
+        self.batched = kwargs.pop("batched", False)
+        self.is_async = aio.is_async(func)
+        cache = kwargs.pop("cache", None)
+        self.cache = StepCache() if cache is True else cache or None
+        if self.cache is not None and self.is_async:
+            raise ValueError("Caching coroutine steps is not supported.")
+        self.checkpoint = kwargs.pop("checkpoint", False)
+        self._key = None
 
     def __call__(self, value: Any) -> Any:
-        return self.func(value, *self.args, **self.kwargs)
+        if self.cache is None:
+            return self.func(value, *self.args, **self.kwargs)
+        return self.cache.call(
+            self._cache_key(value), lambda: self.func(value, *self.args, **self.kwargs)
+        )
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Return the hit and miss counters of the step's cache, or None if it is not cached.
+        """
+        return self.cache.info() if self.cache is not None else None
+
+    def _cache_key(self, value: Any) -> str:
+        return stable_hash((self._fingerprint(), value))
+
+    def _fingerprint(self) -> str:
+        # Hash of the function and bound arguments, computed once
+        if self._key is None:
+            self._key = stable_hash(_signature(self))
+        return self._key
 
     def __repr__(self) -> str:
         func_name = getattr(self.func, "__name__", repr(self.func))
+        options = ", batched=True" if self.batched else ""
+        if self.cache is not None:
+            options += ", cache=True"
+        if self.checkpoint:
+            options += ", checkpoint=True"
         if self.description:
-            return f"Step({func_name}, description={self.description!r})"
-        return f"Step({func_name})"
+            options += f", description={self.description!r}"
+        return f"Step({func_name}{options})"
 
     __name__ = property(lambda self: self.func.__name__)
     __str__ = __repr__
@@ -93,6 +173,75 @@ class Pipeline:
 
     def __init__(self, steps: list[Union[Callable[[Any], Any], Step]]):
         self.steps = steps
+        self._hooks = []
+
+    @property
+    def steps(self) -> list:
+        """
+        list
+            The steps of the pipeline. Pipelines built with ``|`` or ``+`` only
+            record what they extend and build this list on first access.
+        """
+        if self._steps is None:
+            self._steps = self._materialize()
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: list):
+        self._steps = steps
+        self._chain = None
+
+    def _extend(self, tail: list) -> "Pipeline":
+        """
+        Return a pipeline with ``tail`` appended, in constant time.
+
+        The new pipeline records an immutable chain of this pipeline's steps and
+        the tail instead of copying the step list at every operator, so chaining
+        ``n`` steps with ``|`` takes ``O(n)`` time overall.
+        """
+        chain = self._snapshot()
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline._steps = None
+        pipeline._chain = (chain, tuple(tail), chain[2] + len(tail))
+        pipeline._hooks = []
+        return pipeline
+
+    def _snapshot(self) -> tuple:
+        """
+        Return the steps as an immutable chain of ``(parent, tail, size)`` links.
+
+        Pipelines not yet materialized share their chain in constant time; a step
+        list, which can be edited in place, is copied.
+        """
+        if self._steps is None:
+            return self._chain
+        return (None, tuple(self._steps), len(self._steps))
+
+    def _size(self) -> int:
+        if self._steps is not None:
+            return len(self._steps)
+        return self._chain[2]
+
+    def _materialize(self) -> list:
+        # Walk back to the first link, then replay the tails
+        tails = []
+        link = self._chain
+        while link is not None:
+            link, tail, _ = link
+            tails.append(tail)
+        steps = []
+        for tail in reversed(tails):
+            steps.extend(tail)
+        self._chain = None
+        return steps
+
+    def __getstate__(self) -> dict:
+        # Hooks stay in this process
+        return {"steps": self.steps}
+
+    def __setstate__(self, state: dict):
+        self.steps = state["steps"]
+        self._hooks = []
 
     def __call__(self, input: Any) -> Any:
         """
@@ -107,12 +256,502 @@ class Pipeline:
         -------
         Any
             The final output after applying all steps sequentially.
+
+        Notes
+        -----
+        Batch-aware steps (``Step(..., batched=True)``) receive a list holding
+        the single value. Coroutine steps are not awaited; use `acall`.
         """
         value = input
-        for step in self.steps:
-            value = step(value)
+        for step in self._hooked_steps() if self._hooks else self.steps:
+            if isinstance(step, Step) and step.batched:
+                value = step([value])[0]
+            else:
+                value = step(value)
+        return value
+
+    def run(
+        self,
+        input: Any,
+        checkpoints: str | Path | CheckpointStore | None = None,
+        key: str | None = None,
+    ) -> Any:
+        """
+        Execute the pipeline, saving and resuming from checkpoints.
+
+        The output of every step marked with ``Step(..., checkpoint=True)`` is
+        saved to ``checkpoints``. Each checkpoint is keyed by a hash chain over
+        the input and every step up to it, including their functions and bound
+        arguments, so changing a step invalidates the checkpoints after it but
+        not those before. A rerun loads the latest valid checkpoint and only runs
+        the steps after it.
+
+        Parameters
+        ----------
+        input : Any
+            The initial value to be processed.
+        checkpoints : str, Path or CheckpointStore, optional
+            Directory of the checkpoints. Without it, the same as calling the
+            pipeline.
+        key : str, optional
+            Identity of the input, such as a dataset version. Defaults to a
+            stable hash of ``input``, which reads all of it.
+
+        Returns
+        -------
+        Any
+            The final output after applying all steps sequentially.
+
+        Raises
+        ------
+        TypeError
+            If the input (without ``key``) or a step cannot be hashed.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([
+        ...     Step(load_corpus, checkpoint=True),
+        ...     Step(tokenize, vocab, checkpoint=True),
+        ...     train_model,
+        ... ])
+        >>> model = pipeline.run("data/corpus.jsonl", checkpoints=".checkpoints")
+        """
+        if checkpoints is None:
+            return self(input)
+        store = (
+            checkpoints
+            if isinstance(checkpoints, CheckpointStore)
+            else CheckpointStore(checkpoints)
+        )
+
+        steps = list(_flatten(self.steps))
+        chain = stable_hash(("input", key if key is not None else input))
+        keys = []
+        for step in steps:
+            # Hashed afresh, not through the memoized cache key, so that
+            # arguments edited in place invalidate the later checkpoints
+            chain = stable_hash((chain, stable_hash(_signature(step))))
+            keys.append(chain)
+
+        start, value = 0, input
+        for index in reversed(range(len(steps))):
+            step = steps[index]
+            if not (isinstance(step, Step) and step.checkpoint) or keys[index] not in store:
+                continue
+            try:
+                value = store.load(keys[index])
+            except Exception:
+                # Unreadable checkpoints (corrupt, or of a class that moved) are skipped
+                continue
+            start = index + 1
+            break
+
+        for index, step in enumerate(self._run_steps()[start:], start):
+            if isinstance(step, Step) and step.batched:
+                value = step([value])[0]
+            else:
+                value = step(value)
+            if isinstance(steps[index], Step) and steps[index].checkpoint:
+                store.save(keys[index], value)
         return value
 
+    def map(
+        self,
+        iterable: Iterable,
+        batch_size: int | None = None,
+        executor: Literal["thread", "process"] | None = None,
+        workers: int | None = None,
+        chunksize: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator:
+        """
+        Lazily run the pipeline over every item of an iterable.
+
+        Items are pulled from ``iterable`` only as results are consumed, so memory
+        stays flat however large the input is. With ``executor``, chunks of items
+        run in parallel on a `concurrent.futures` pool; at most ``2 * workers``
+        chunks are in flight at a time.
+
+        Parameters
+        ----------
+        iterable : Iterable
+            Input values.
+        batch_size : int, optional
+            Pull items in batches of this size. Batch-aware steps
+            (``Step(..., batched=True)``) are called once per batch with a list of
+            values, or with whatever the previous batch-aware step returned (e.g. a
+            NumPy array), and must return one result per value. Other steps are
+            still called once per value. Without ``batch_size``, items are streamed
+            one at a time.
+        executor : {"thread", "process"}, optional
+            Run chunks on a thread pool (for I/O-bound steps) or a process pool
+            (for CPU-bound steps). For processes, the pipeline, including the
+            arguments bound with `Step`, is pickled once and installed in each
+            worker; lambdas and local functions need ``cloudpickle``.
+        workers : int, optional
+            Pool size. Defaults to the number of CPUs.
+        chunksize : int, optional
+            Number of items sent to a worker at a time. Defaults to 1 for threads
+            and 64 for processes. Larger chunks amortize the cost of sending
+            items to processes.
+        ordered : bool, optional
+            Yield results in input order. With False, each chunk's results are
+            yielded as soon as it finishes.
+
+        Returns
+        -------
+        Iterator
+            Results in input order.
+
+        Raises
+        ------
+        ValueError
+            If ``batch_size``, ``workers`` or ``chunksize`` is less than 1 or
+            ``executor`` is unknown. While iterating, if a batch-aware step returns
+            a different number of results than it received.
+        TypeError
+            With ``executor="process"``, if a step cannot be pickled.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([
+        ...     Step(np.asarray, batched=True),
+        ...     Step(np.log1p, batched=True),
+        ...     float,
+        ... ])
+        >>> for value in pipeline.map(read_values(), batch_size=4096):
+        ...     ...
+
+        >>> features = Pipeline([read_file, parse, extract_features])
+        >>> for row in features.map(paths, executor="process", workers=8, ordered=False):
+        ...     ...
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if executor is not None:
+            return parallel_map(self, iterable, executor, workers, chunksize, ordered, batch_size)
+        if batch_size is None:
+            return map(_compile(self._run_steps()), iterable)
+        return self._stream_batches(iterable, self._plan(), batch_size)
+
+    def stream(
+        self,
+        iterable: Iterable,
+        stages: list[int] | None = None,
+        workers: int | list[int] = 1,
+        executor: Literal["thread", "process"] | list[str] = "thread",
+        maxsize: int = 64,
+        ordered: bool = True,
+    ) -> StagedStream:
+        """
+        Run the pipeline as an assembly line, with every stage working on a different item.
+
+        The flattened steps are split into stages of consecutive steps. Each stage
+        has its own workers and passes results to the next through a queue of at
+        most ``maxsize`` items. A full queue blocks the stage before it, back to
+        the input, so a fast producer cannot run ahead of a slow stage.
+
+        Parameters
+        ----------
+        iterable : Iterable
+            Input values, read by a background thread.
+        stages : list of int, optional
+            Number of consecutive steps in each stage. Defaults to one stage
+            per step.
+        workers : int or list of int, optional
+            Worker count of every stage, or of each stage.
+        executor : {"thread", "process"} or list of them, optional
+            Where each stage runs its steps: on its worker threads, or on a
+            process pool of ``workers`` processes (for CPU-bound steps, which
+            must be picklable as in `map`).
+        maxsize : int, optional
+            Capacity of each queue between stages.
+        ordered : bool, optional
+            Yield results in input order. With False, results are yielded as
+            soon as the last stage finishes them.
+
+        Returns
+        -------
+        StagedStream
+            Iterator of the results, with `StagedStream.stats` and
+            `StagedStream.report` for the queue depth and utilization of
+            every stage.
+
+        Raises
+        ------
+        ValueError
+            If ``stages`` does not add up to the number of steps, a per-stage
+            list has the wrong length, or a count is less than 1.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([download, decode, Step(resize, 224), save])
+        >>> with pipeline.stream(urls, stages=[1, 2, 1], workers=[16, 4, 2],
+        ...                      executor=["thread", "process", "thread"]) as results:
+        ...     for path in results:
+        ...         ...
+        ...     print(results.report())
+        """
+        plain = list(_flatten(self.steps)) or [identity]
+        steps = self._run_steps() or [identity]
+        sizes, workers, executors = check_stages(len(plain), stages, workers, executor, maxsize)
+        layout = []
+        start = 0
+        for size in sizes:
+            group = plain[start : start + size]
+            name = " | ".join(_step_name(step) for step in group)
+            layout.append((name, _compile(steps[start : start + size]), Pipeline(group)))
+            start += size
+        return StagedStream(iterable, layout, workers, executors, maxsize, ordered)
+
+    async def acall(self, input: Any, offload: bool = False) -> Any:
+        """
+        Execute the pipeline on the provided input, awaiting coroutine steps.
+
+        Coroutine functions, and `Step` objects wrapping them, are awaited. So is
+        any awaitable returned by a synchronous step.
+
+        Parameters
+        ----------
+        input : Any
+            The initial value to be processed.
+        offload : bool, optional
+            Run synchronous steps in the event loop's default thread pool with
+            `asyncio.to_thread`, so blocking steps do not stall other tasks.
+
+        Returns
+        -------
+        Any
+            The final output after applying all steps sequentially.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([str.strip, Step(query_model, url=url), parse])
+        >>> await pipeline.acall(" prompt ")
+        """
+        return await aio.run(aio.plan(self._run_steps()), input, offload)
+
+    def amap(
+        self,
+        iterable: AsyncIterable | Iterable,
+        concurrency: int = 1,
+        ordered: bool = True,
+        offload: bool = False,
+    ) -> AsyncIterator:
+        """
+        Run the pipeline over every item of an (async) iterable, with bounded concurrency.
+
+        Up to ``concurrency`` items are processed at once, each as its own task
+        running `acall`. The first ``concurrency`` items are started right away;
+        after that a new item is pulled from ``iterable`` only once the consumer
+        has taken a result, which applies backpressure to the producer.
+
+        Parameters
+        ----------
+        iterable : AsyncIterable or Iterable
+            Input values.
+        concurrency : int, optional
+            Maximum number of items in flight.
+        ordered : bool, optional
+            Yield results in input order. With False, results are yielded as soon
+            as they are ready.
+        offload : bool, optional
+            Run synchronous steps in a thread, as in `acall`.
+
+        Returns
+        -------
+        AsyncIterator
+            Results of the pipeline.
+
+        Raises
+        ------
+        ValueError
+            If ``concurrency`` is less than 1.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([Step(lookup, db=db), Step(query_model, url=url)])
+        >>> async for result in pipeline.amap(read_requests(), concurrency=32):
+        ...     ...
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        plan = aio.plan(self._run_steps())
+        return aio.amap(plan, iterable, concurrency, ordered, offload)
+
+    def compile(self) -> Callable[[Any], Any]:
+        """
+        Return an optimized callable equivalent to the pipeline.
+
+        Nested pipelines are flattened and identity steps (`identity`, or a
+        function that just returns its argument) are dropped. The remaining steps
+        are fused into one generated function with the arguments bound by `Step`
+        passed directly, so a call costs one Python frame plus one call per step.
+
+        Returns
+        -------
+        Callable[[Any], Any]
+            A function of one value. If any step is a coroutine function, an
+            ``async`` function that awaits those steps.
+
+        Notes
+        -----
+        The compiled function is a snapshot: steps added to the pipeline later
+        are not included.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([str.strip, identity, Pipeline([str.lower, Step(str.split, ",")])])
+        >>> split = pipeline.compile()
+        >>> split(" A,B ")
+        ['a', 'b']
+        """
+        steps = self._run_steps()
+        return _compile(steps, asynchronous=any(aio.is_async(step) for step in steps))
+
+    def cache_info(self) -> dict:
+        """
+        Return the cache counters of every cached step, including nested ones.
+
+        Returns
+        -------
+        dict of Step to CacheInfo
+            Hits, misses, disk hits and memory size of each step's cache.
+        """
+        return {
+            step: step.cache_info()
+            for step in _flatten(self.steps)
+            if isinstance(step, Step) and step.cache is not None
+        }
+
+    def add_hook(self, hook: StepHook) -> "Pipeline":
+        """
+        Register a hook called before and after every step.
+
+        Hooks apply to every way of running the pipeline in this process:
+        calls, `map` (including thread pools), `acall`, `amap` and `compile`
+        (for functions compiled while the hook is registered). They are not sent
+        to process pools. Without hooks, steps run without any per-step overhead.
+
+        Parameters
+        ----------
+        hook : StepHook
+            Object with ``before_step`` and ``after_step`` methods.
+
+        Returns
+        -------
+        Pipeline
+            The pipeline instance (enables chaining).
+        """
+        self._hooks.append(hook)
+        return self
+
+    def remove_hook(self, hook: StepHook):
+        """
+        Unregister a hook added with `add_hook`.
+        """
+        self._hooks.remove(hook)
+
+    def profile(
+        self, sizes: bool = False, memory: bool = False, samples: int = 10_000
+    ) -> StepProfiler:
+        """
+        Start profiling every step of the pipeline.
+
+        Registers a `StepProfiler` as a hook. Use it as a context manager, or call
+        its ``close`` method, to stop profiling.
+
+        Parameters
+        ----------
+        sizes : bool, optional
+            Also record the size of the input and output of each step.
+        memory : bool, optional
+            Also record allocations of each step with `tracemalloc`.
+        samples : int, optional
+            Number of recent latencies kept per step for the p95.
+
+        Returns
+        -------
+        StepProfiler
+            Call count, total, mean and p95 latency per step, as a report with
+            ``str(profiler)`` or as data with ``profiler.to_dict()``.
+
+        Examples
+        --------
+        >>> with pipeline.profile() as profiler:
+        ...     results = list(pipeline.map(data))
+        >>> print(profiler)
+        """
+        profiler = StepProfiler(sizes=sizes, memory=memory, samples=samples)
+        profiler._pipeline = self
+        self.add_hook(profiler)
+        return profiler
+
+    def _run_steps(self) -> list:
+        """
+        Return the flattened steps, wrapped to call the hooks if there are any.
+        """
+        if self._hooks:
+            return self._hooked_steps()
+        return list(_flatten(self.steps))
+
+    def _hooked_steps(self) -> list:
+        hooks = tuple(self._hooks)
+        steps = []
+        for index, step in enumerate(_flatten(self.steps)):
+            hooked = _AsyncHooked if aio.is_async(step) else _Hooked
+            batched = isinstance(step, Step) and step.batched
+            steps.append(Step(hooked(index, step, hooks), batched=batched))
+        return steps
+
+    def _plan(self) -> list[tuple[bool, Any]]:
+        """
+        Split the (flattened) steps into batch-aware steps and fused runs of per-value steps.
+        """
+        plan, group = [], []
+        for step in self._run_steps():
+            if isinstance(step, Step) and step.batched:
+                if group:
+                    plan.append((False, _compile(group)))
+                    group = []
+                plan.append((True, step))
+            else:
+                group.append(step)
+        if group:
+            plan.append((False, _compile(group)))
+        return plan
+
+    def _chunk_runner(self, batch_size: int | None = None) -> Callable[[list], list]:
+        """
+        Compile the steps once and return a function running them over a chunk of items.
+
+        Used by the executors so that every chunk reuses the same compiled code.
+        """
+        if batch_size is None:
+            compiled = _compile(self._run_steps())
+            return lambda chunk: list(map(compiled, chunk))
+        plan = self._plan()
+        return lambda chunk: list(self._stream_batches(chunk, plan, batch_size))
+
+    @staticmethod
+    def _stream_batches(iterable: Iterable, plan: list, batch_size: int) -> Iterator:
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            size = len(batch)
+            for batched, step in plan:
+                if batched:
+                    batch = step(batch)
+                    if len(batch) != size:
+                        raise ValueError(
+                            f"{step!r} returned {len(batch)} results for a batch of {size}."
+                        )
+                else:
+                    batch = list(map(step, batch))
+            yield from batch
+
     def __or__(self, other: Union[Callable, "Pipeline"]) -> "Pipeline":
         """
         Combine this pipeline with another callable or pipeline using the `|` operator.
@@ -126,11 +765,18 @@ class Pipeline:
         Returns
         -------
         Pipeline
-            A new pipeline with combined steps.
+            A new pipeline with combined steps. Later changes to either operand
+            do not affect it.
+
+        Notes
+        -----
+        Chaining takes constant time for a callable: the new pipeline refers to
+        this one instead of copying its steps, so building a pipeline of ``n``
+        steps with ``|`` takes ``O(n)`` time.
         """
         if isinstance(other, Pipeline):
-            return Pipeline(self.steps + other.steps)
-        return Pipeline(self.steps + [other])
+            return self._extend(list(other.steps))
+        return self._extend([other])
 
     __add__ = __or__
 
@@ -165,5 +811,142 @@ class Pipeline:
         return f"Pipeline(\n{arrows}\n)"
 
     def __repr__(self) -> str:
-        num_steps = len(self.steps)
+        num_steps = self._size()
         return f"<Pipeline({num_steps} steps)>"
+
+
+def _flatten(steps: list) -> Iterator:
+    for step in steps:
+        if isinstance(step, Pipeline):
+            yield from _flatten(step.steps)
+        else:
+            yield step
+
+
+class _Hooked:
+    """
+    Call a step between the ``before_step`` and ``after_step`` of hooks.
+    """
+
+    __slots__ = ("index", "step", "hooks")
+
+    def __init__(self, index: int, step: Any, hooks: tuple):
+        self.index = index
+        self.step = step
+        self.hooks = hooks
+
+    def __call__(self, value: Any) -> Any:
+        for hook in self.hooks:
+            hook.before_step(self.index, self.step, value)
+        result = self.step(value)
+        for hook in self.hooks:
+            hook.after_step(self.index, self.step, value, result)
+        return result
+
+    def __repr__(self) -> str:
+        return repr(self.step)
+
+
+class _AsyncHooked(_Hooked):
+    __slots__ = ()
+
+    async def __call__(self, value: Any) -> Any:
+        for hook in self.hooks:
+            hook.before_step(self.index, self.step, value)
+        result = await self.step(value)
+        for hook in self.hooks:
+            hook.after_step(self.index, self.step, value, result)
+        return result
+
+
+def identity(value: Any) -> Any:
+    """
+    Return ``value`` unchanged.
+
+    Useful as a placeholder step; `Pipeline.compile` drops it.
+    """
+    return value
+
+
+def _signature(step: Any) -> Any:
+    """
+    Describe a step by content, for `stable_hash`.
+    """
+    if isinstance(step, Step):
+        return ("Step", _signature(step.func), step.args, step.kwargs, step.batched)
+    if isinstance(step, Pipeline):
+        return ("Pipeline", [_signature(inner) for inner in _flatten(step.steps)])
+    return step
+
+
+def _is_identity(step: Any) -> bool:
+    if isinstance(step, Step):
+        if step.args or step.kwargs or step.batched or step.cache is not None:
+            return False
+        step = step.func
+    if step is identity:
+        return True
+    # Catch equivalent functions such as ``lambda x: x``
+    code = getattr(step, "__code__", None)
+    return (
+        code is not None
+        and code.co_code == identity.__code__.co_code
+        and code.co_argcount == 1
+        and not code.co_kwonlyargcount
+        and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        and not getattr(step, "__defaults__", None)
+    )
+
+
+def _compile(steps: list, asynchronous: bool = False) -> Callable[[Any], Any]:
+    """
+    Generate one function that applies ``steps`` in sequence.
+
+    Functions and bound `Step` arguments become closure variables of the
+    generated function, so each step costs a single direct call.
+    """
+    steps = [step for step in steps if not _is_identity(step)]
+    bindings = {}
+    lines = []
+    for index, step in enumerate(steps):
+        func, args, kwargs, batched = step, (), {}, False
+        if isinstance(step, Step):
+            batched = step.batched
+            # Cached steps are called through the step to reach the cache
+            if step.cache is None:
+                func, args, kwargs = step.func, step.args, step.kwargs
+
+        name = f"f{index}"
+        bindings[name] = func
+        arguments = ["[value]" if batched else "value"]
+        for position, arg in enumerate(args):
+            bindings[f"a{index}_{position}"] = arg
+            arguments.append(f"a{index}_{position}")
+        if all(key.isidentifier() and not keyword.iskeyword(key) for key in kwargs):
+            for key, arg in kwargs.items():
+                bindings[f"k{index}_{key}"] = arg
+                arguments.append(f"{key}=k{index}_{key}")
+        elif kwargs:
+            bindings[f"k{index}"] = kwargs
+            arguments.append(f"**k{index}")
+
+        call = f"{name}({', '.join(arguments)})"
+        if asynchronous and aio.is_async(step):
+            call = f"(await {call})"
+        lines.append(f"        value = {call}{'[0]' if batched else ''}")
+
+    prefix = "async def" if asynchronous else "def"
+    source = "\n".join(
+        [
+            f"def factory({', '.join(bindings)}):",
+            f"    {prefix} compiled(value):",
+            *lines,
+            "        return value",
+            "    return compiled",
+        ]
+    )
+    namespace = {}
+    exec(source, namespace)
+    compiled = namespace["factory"](**bindings)
+    compiled.steps = steps
+    return compiled
@@ -0,0 +1,259 @@
+from collections import deque
+import contextvars
+import math
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+
+class StepHook:
+    """
+    Base class for callbacks around every step of a `Pipeline`.
+
+    Register with `Pipeline.add_hook`. Hooks see the flattened steps: ``index``
+    is the position of the step once nested pipelines are inlined. Batch-aware
+    steps are seen once per batch, with the batch as ``value``. Pipelines
+    without hooks run without any per-step overhead.
+
+    Override either method; the defaults do nothing.
+    """
+
+    def before_step(self, index: int, step: Any, value: Any):
+        """
+        Called before ``step`` runs on ``value``.
+        """
+
+    def after_step(self, index: int, step: Any, value: Any, result: Any):
+        """
+        Called after ``step`` returned ``result`` for ``value``. Not called if the step raised.
+        """
+
+
+class _StepStats:
+    __slots__ = ("name", "calls", "total", "samples", "in_bytes", "out_bytes", "allocated", "peak")
+
+    def __init__(self, name: str, samples: int):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=samples)
+        self.in_bytes = 0
+        self.out_bytes = 0
+        self.allocated = 0
+        self.peak = 0
+
+
+class StepProfiler(StepHook):
+    """
+    Profile every step of a pipeline: call count, total, mean and p95 latency.
+
+    Usually created with `Pipeline.profile`. The p95 latency is computed over
+    the last ``samples`` calls of each step.
+
+    Parameters
+    ----------
+    sizes : bool, optional
+        Also record the mean size in bytes of the input and output of each step:
+        ``nbytes`` for arrays, `sys.getsizeof` otherwise (shallow).
+    memory : bool, optional
+        Also record the mean net allocation and the largest peak allocation of
+        each step with `tracemalloc`, which is started if needed. Slows every
+        allocation down while enabled, and is process-wide: with threads, steps
+        running concurrently are mixed up.
+    samples : int, optional
+        Number of recent latencies kept per step for the p95.
+
+    Examples
+    --------
+    >>> with pipeline.profile(sizes=True) as profiler:
+    ...     results = list(pipeline.map(data))
+    >>> print(profiler)
+    Pipeline(
+      Step(parse)     calls=1000  total=12.4ms  mean=12.4us  p95=15.1us   2.1%
+        ⬇
+      Step(tokenize)  calls=1000  total=571ms   mean=571us   p95=802us   97.9%
+    )
+    """
+
+    def __init__(self, sizes: bool = False, memory: bool = False, samples: int = 10_000):
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        self.sizes = sizes
+        self.memory = memory
+        self.samples = samples
+        self.stats = {}
+        # Start times of the steps running in the current thread or asyncio
+        # task, so coroutines interleaved on one thread by `amap` do not mix up
+        self._starts = contextvars.ContextVar(f"starts_{id(self)}", default={})
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._pipeline = None
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def before_step(self, index: int, step: Any, value: Any):
+        if self.memory:
+            tracemalloc.reset_peak()
+            start = (time.perf_counter(), tracemalloc.get_traced_memory()[0])
+        else:
+            start = (time.perf_counter(), 0)
+        # Copy rather than mutate: tasks inherit the dict of the context they were created in
+        self._starts.set({**self._starts.get(), index: start})
+
+    def after_step(self, index: int, step: Any, value: Any, result: Any):
+        now = time.perf_counter()
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+        starts = dict(self._starts.get())
+        started, before = starts.pop(index)
+        self._starts.set(starts)
+        elapsed = now - started
+
+        with self._lock:
+            stats = self.stats.get(index)
+            if stats is None:
+                stats = self.stats[index] = _StepStats(_step_name(step), self.samples)
+            stats.calls += 1
+            stats.total += elapsed
+            stats.samples.append(elapsed)
+            if self.sizes:
+                stats.in_bytes += _size(value)
+                stats.out_bytes += _size(result)
+            if self.memory:
+                stats.allocated += current - before
+                stats.peak = max(stats.peak, peak - before)
+
+    def to_dict(self) -> dict:
+        """
+        Return the statistics as plain data.
+
+        Returns
+        -------
+        dict
+            ``"total"``, the seconds spent in all steps, and ``"steps"``, one dict
+            per profiled step in pipeline order with ``index``, ``step``,
+            ``calls``, ``total``, ``mean``, ``p95`` and ``share`` (fraction of
+            the total), plus ``in_bytes`` and ``out_bytes`` (means) with
+            ``sizes=True``, and ``allocated`` (mean) and ``peak`` (max) with
+            ``memory=True``.
+        """
+        with self._lock:
+            total = sum(step.total for step in self.stats.values())
+            steps = []
+            for index in sorted(self.stats):
+                step = self.stats[index]
+                row = {
+                    "index": index,
+                    "step": step.name,
+                    "calls": step.calls,
+                    "total": step.total,
+                    "mean": step.total / step.calls,
+                    "p95": _percentile(step.samples, 0.95),
+                    "share": step.total / total if total else 0.0,
+                }
+                if self.sizes:
+                    row["in_bytes"] = step.in_bytes / step.calls
+                    row["out_bytes"] = step.out_bytes / step.calls
+                if self.memory:
+                    row["allocated"] = step.allocated / step.calls
+                    row["peak"] = step.peak
+                steps.append(row)
+        return {"total": total, "steps": steps}
+
+    def report(self) -> str:
+        """
+        Render the statistics in the arrow layout of ``str(Pipeline)``, one step per line.
+        """
+        steps = self.to_dict()["steps"]
+        if not steps:
+            return "Pipeline(\n)"
+        rows = []
+        for step in steps:
+            columns = [
+                f"calls={step['calls']}",
+                f"total={_seconds(step['total'])}",
+                f"mean={_seconds(step['mean'])}",
+                f"p95={_seconds(step['p95'])}",
+            ]
+            if self.sizes:
+                columns.append(f"in={_bytes(step['in_bytes'])}")
+                columns.append(f"out={_bytes(step['out_bytes'])}")
+            if self.memory:
+                columns.append(f"alloc={_bytes(step['allocated'])}")
+                columns.append(f"peak={_bytes(step['peak'])}")
+            columns.append(f"{step['share']:6.1%}")
+            rows.append([step["step"], *columns])
+
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        lines = [
+            "  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in rows
+        ]
+        return "Pipeline(\n" + "\n    ⬇\n".join(lines) + "\n)"
+
+    def reset(self):
+        """
+        Drop the statistics collected so far.
+        """
+        with self._lock:
+            self.stats.clear()
+
+    def close(self):
+        """
+        Detach from the pipeline created by `Pipeline.profile` and stop `tracemalloc` if this profiler started it.
+        """
+        if self._pipeline is not None:
+            self._pipeline.remove_hook(self)
+            self._pipeline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "StepProfiler":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self) -> str:
+        return self.report()
+
+
+def _step_name(step: Any) -> str:
+    """
+    Short name of a step: the qualified name of functions, without enclosing functions.
+    """
+    name = getattr(step, "__qualname__", None)
+    if name is None:
+        return repr(step)
+    return name.rsplit("<locals>.", 1)[-1]
+
+
+def _size(value: Any) -> int:
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+def _percentile(samples, q: float) -> float:
+    # Nearest-rank percentile
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def _seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3g}{unit}"
+    return f"{value / 1e-9:.3g}ns"
+
+
+def _bytes(value: float) -> str:
+    for unit, scale in (("GiB", 2**30), ("MiB", 2**20), ("KiB", 2**10)):
+        if abs(value) >= scale:
+            return f"{value / scale:.3g}{unit}"
+    return f"{value:.0f}B"
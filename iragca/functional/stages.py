@@ -0,0 +1,325 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+from .executors import EXECUTORS, _initialize, _run_worker, dumps
+
+_DONE = object()
+
+# Seconds between checks of the stop flag while blocked on a queue
+_POLL = 0.05
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Stage:
+    __slots__ = (
+        "name",
+        "run",
+        "workers",
+        "executor",
+        "inbox",
+        "pool",
+        "items",
+        "busy",
+        "depth_total",
+        "depth_max",
+        "active",
+        "lock",
+    )
+
+    def __init__(self, name: str, run: Callable, workers: int, executor: str, inbox: queue.Queue):
+        self.name = name
+        self.run = run
+        self.workers = workers
+        self.executor = executor
+        self.inbox = inbox
+        self.pool = None
+        self.items = 0
+        self.busy = 0.0
+        self.depth_total = 0
+        self.depth_max = 0
+        self.active = workers
+        self.lock = threading.Lock()
+
+
+class StagedStream:
+    """
+    Iterator over the results of a pipeline run as an assembly line of stages.
+
+    Created by `Pipeline.stream`. Every stage runs its steps on its own worker
+    threads and passes results to the next stage through a bounded queue, so
+    all stages work on different items at the same time. A stage with the
+    ``"process"`` executor hands each item to its own process pool, whose
+    workers compile the stage's steps once when they start. When a
+    queue is full the stage before it blocks, and the input is only read when
+    the first queue has room, so memory stays bounded however fast the input
+    is.
+
+    Use `stats` or `report` to find the bottleneck: the stage with a full
+    input queue and busy workers is the slowest one.
+
+    The worker threads stop when the iterator is exhausted, closed, or used as
+    a context manager and exited, or when a step raises; the error is raised
+    from ``next``.
+    """
+
+    def __init__(
+        self,
+        source: Iterable,
+        stages: list[tuple[str, Callable, Any]],
+        workers: list[int],
+        executors: list[str],
+        maxsize: int,
+        ordered: bool,
+    ):
+        self.ordered = ordered
+        self.maxsize = maxsize
+        self._stop = threading.Event()
+        self._queues = [queue.Queue(maxsize) for _ in range(len(stages) + 1)]
+        self._stages = []
+        for index, ((name, run, pipeline), count, executor) in enumerate(
+            zip(stages, workers, executors)
+        ):
+            stage = _Stage(name, run, count, executor, self._queues[index])
+            if executor == "process":
+                # Workers get the stage's steps as a pipeline, as in `Pipeline.map`
+                stage.pool = ProcessPoolExecutor(
+                    count, initializer=_initialize, initargs=(dumps(pipeline),)
+                )
+                stage.run = partial(_submit, stage.pool)
+            self._stages.append(stage)
+
+        # Bounds the items between the input and the consumer, including the
+        # ones waiting to be reordered
+        self._slots = threading.Semaphore(maxsize * (len(stages) + 1) + sum(workers))
+        self._threads = [threading.Thread(target=self._feed, args=(iter(source),), daemon=True)]
+        for index, stage in enumerate(self._stages):
+            for _ in range(stage.workers):
+                thread = threading.Thread(target=self._work, args=(index,), daemon=True)
+                self._threads.append(thread)
+        self._started = time.perf_counter()
+        for thread in self._threads:
+            thread.start()
+        self._results = self._collect()
+
+    def __iter__(self) -> "StagedStream":
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._results)
+
+    def close(self):
+        """
+        Stop every worker and release the process pools.
+        """
+        self._results.close()
+        self._shutdown()
+
+    def __enter__(self) -> "StagedStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def stats(self) -> list[dict]:
+        """
+        Return the state of every stage.
+
+        Returns
+        -------
+        list of dict
+            One dict per stage with ``stage`` (its steps), ``workers``,
+            ``executor``, ``items`` processed, ``depth`` (items waiting in its
+            input queue now), ``mean_depth`` and ``max_depth`` (seen by its
+            workers when taking an item), ``capacity`` of the queue and
+            ``utilization`` (busy time over the elapsed time of all its workers).
+        """
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        rows = []
+        for stage in self._stages:
+            with stage.lock:
+                items, busy = stage.items, stage.busy
+                total, highest = stage.depth_total, stage.depth_max
+            rows.append(
+                {
+                    "stage": stage.name,
+                    "workers": stage.workers,
+                    "executor": stage.executor,
+                    "items": items,
+                    "depth": stage.inbox.qsize(),
+                    "mean_depth": total / items if items else 0.0,
+                    "max_depth": highest,
+                    "capacity": self.maxsize,
+                    "utilization": min(busy / (elapsed * stage.workers), 1.0),
+                }
+            )
+        return rows
+
+    def report(self) -> str:
+        """
+        Render `stats` in the arrow layout of ``str(Pipeline)``, one stage per line.
+        """
+        rows = [
+            [
+                row["stage"],
+                f"workers={row['workers']}",
+                f"items={row['items']}",
+                f"queue={row['depth']}/{row['capacity']}",
+                f"mean={row['mean_depth']:.1f}",
+                f"max={row['max_depth']}",
+                f"busy={row['utilization']:.0%}",
+            ]
+            for row in self.stats()
+        ]
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        lines = [
+            "  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in rows
+        ]
+        return "Pipeline(\n" + "\n    ⬇\n".join(lines) + "\n)"
+
+    def _feed(self, items: Iterator):
+        first = self._queues[0]
+        try:
+            for sequence, item in enumerate(items):
+                if not self._acquire():
+                    return
+                if not self._put(first, (sequence, item)):
+                    return
+        except BaseException as error:
+            self._put(self._queues[-1], (None, _Failure(error)))
+            return
+        for _ in range(self._stages[0].workers):
+            self._put(first, _DONE)
+
+    def _work(self, index: int):
+        stage = self._stages[index]
+        outbox = self._queues[index + 1]
+        while True:
+            depth = stage.inbox.qsize()
+            message = self._get(stage.inbox)
+            if message is None:
+                return
+            if message is _DONE:
+                break
+            sequence, value = message
+            started = time.perf_counter()
+            try:
+                result = stage.run(value)
+            except BaseException as error:
+                self._put(self._queues[-1], (sequence, _Failure(error)))
+                return
+            with stage.lock:
+                stage.items += 1
+                stage.busy += time.perf_counter() - started
+                stage.depth_total += depth
+                stage.depth_max = max(stage.depth_max, depth)
+            if not self._put(outbox, (sequence, result)):
+                return
+
+        # The last worker of a stage to finish tells every worker of the next one
+        with stage.lock:
+            stage.active -= 1
+            last = not stage.active
+        if last:
+            following = self._stages[index + 1].workers if index + 1 < len(self._stages) else 1
+            for _ in range(following):
+                self._put(outbox, _DONE)
+
+    def _collect(self) -> Iterator:
+        results = self._queues[-1]
+        pending = {}
+        expected = 0
+        try:
+            while True:
+                message = self._get(results)
+                if message is None or message is _DONE:
+                    break
+                sequence, value = message
+                if isinstance(value, _Failure):
+                    raise value.error
+                if not self.ordered:
+                    self._slots.release()
+                    yield value
+                    continue
+                pending[sequence] = value
+                while expected in pending:
+                    value = pending.pop(expected)
+                    expected += 1
+                    self._slots.release()
+                    yield value
+        finally:
+            self._shutdown()
+
+    def _shutdown(self):
+        self._stop.set()
+        for stage in self._stages:
+            if stage.pool is not None:
+                stage.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire(self) -> bool:
+        while not self._slots.acquire(timeout=_POLL):
+            if self._stop.is_set():
+                return False
+        return not self._stop.is_set()
+
+    def _put(self, target: queue.Queue, message: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(message, timeout=_POLL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=_POLL)
+            except queue.Empty:
+                pass
+        return None
+
+
+def _submit(pool: ProcessPoolExecutor, value: Any) -> Any:
+    # Runs on the worker's compiled stage installed by `_initialize`
+    return pool.submit(_run_worker, [value]).result()[0]
+
+
+def check_stages(count: int, stages: list[int] | None, workers, executor, maxsize: int) -> tuple:
+    """
+    Validate the stage layout of `Pipeline.stream` and expand per-stage settings.
+
+    Returns
+    -------
+    tuple
+        The number of steps in each stage, and the worker count and executor of
+        each stage.
+    """
+    if stages is None:
+        stages = [1] * count
+    if any(size < 1 for size in stages) or sum(stages) != count:
+        raise ValueError(
+            f"stages must be positive step counts adding up to the {count} steps of the pipeline."
+        )
+    workers = [workers] * len(stages) if isinstance(workers, int) else list(workers)
+    executors = [executor] * len(stages) if isinstance(executor, str) else list(executor)
+    if len(workers) != len(stages) or len(executors) != len(stages):
+        raise ValueError("Pass one worker count and executor per stage.")
+    if any(count < 1 for count in workers):
+        raise ValueError("workers must be at least 1")
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    for name in executors:
+        if name not in EXECUTORS:
+            raise ValueError(f"Unknown executor {name!r}; expected one of {EXECUTORS}.")
+    return stages, workers, executors
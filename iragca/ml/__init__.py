@@ -1,3 +1,25 @@
+from .collection import RunCollection
+from .collector import MetricCollector, MetricProducer
+from .instrumentation import Instrumentation
+from .liveplot import LivePlot
+from .retention import LTTB, EveryNth, MultiResolution, Reservoir, RetentionPolicy
 from .runlogger import RunLogger
+from .stats import MetricStats
+from .views import HistoryView, MetricView
 
-__all__ = ["RunLogger"]
+__all__ = [
+    "RunLogger",
+    "MetricStats",
+    "RunCollection",
+    "MetricView",
+    "HistoryView",
+    "MetricCollector",
+    "MetricProducer",
+    "Instrumentation",
+    "LivePlot",
+    "RetentionPolicy",
+    "EveryNth",
+    "Reservoir",
+    "MultiResolution",
+    "LTTB",
+]
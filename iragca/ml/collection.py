@@ -0,0 +1,324 @@
+from .columns import np
+
+SUMMARIES = ("last", "min", "max", "mean", "count", "last_step", "min_step", "max_step")
+
+
+class RunCollection:
+    """
+    Many runs in one columnar store, with per-run hyperparameters and summaries.
+
+    Histories of all runs are appended to shared step and metric columns, one
+    contiguous segment per run. A summary of every metric is computed once when
+    a run is added: its final value and step, minimum and maximum with their
+    steps, mean and number of values. Cross-run queries such as `best` and
+    `filter` then work on arrays with one entry per run instead of rescanning
+    every history. Requires numpy.
+
+    Examples
+    --------
+    >>> runs = RunCollection()
+    >>> for params, logger in sweep:
+    ...     runs.add(logger, params=params)
+    >>> runs.best("val_loss", k=3, by="min", where={"optimizer": "adam"})
+    [('run-17', 0.213), ('run-4', 0.219), ('run-40', 0.224)]
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("RunCollection requires numpy to be installed.")
+        self.names = []
+        self._index = {}
+        self._offsets = [0]
+        self._capacity = 1024
+        self._size = 0
+        self._steps = np.empty(self._capacity, dtype="int64")
+        self._columns = {}
+        self._params = {}
+        self._summaries = {}
+        self._cache = {}
+
+    def add(self, logger, name: str | None = None, params: dict | None = None) -> str:
+        """
+        Copy a run's history into the collection and summarize its metrics.
+
+        Parameters
+        ----------
+        logger : RunLogger
+            Run to add.
+        name : str, optional
+            Unique run name. Defaults to ``"run-<index>"``.
+        params : dict, optional
+            Hyperparameters of the run. Runs without a parameter get ``None``.
+
+        Returns
+        -------
+        str
+            The run name.
+
+        Raises
+        ------
+        ValueError
+            If a run with the same name was already added.
+        """
+        run = len(self.names)
+        name = f"run-{run}" if name is None else name
+        if name in self._index:
+            raise ValueError(f"Run {name!r} already exists.")
+
+        steps = np.asarray(logger.column("step"))
+        start, stop = self._size, self._size + len(steps)
+        self._reserve(stop)
+        self._steps[start:stop] = steps
+        for metric in logger.metrics:
+            values = np.asarray(logger.column(metric), dtype="float64")
+            column = self._columns.get(metric)
+            if column is None:
+                column = self._columns[metric] = np.full(self._capacity, np.nan)
+            column[start:stop] = values
+            self._summarize(metric, run, steps, values)
+        self._size = stop
+        self._offsets.append(stop)
+
+        for key, value in (params or {}).items():
+            self._params.setdefault(key, [None] * run)
+        for key, values in self._params.items():
+            values.append((params or {}).get(key))
+
+        self.names.append(name)
+        self._index[name] = run
+        self._cache.clear()
+        return name
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @property
+    def metrics(self) -> list[str]:
+        """
+        List[str]
+            Metrics logged by at least one run.
+        """
+        return list(self._columns)
+
+    def params(self, name: str) -> dict:
+        """
+        Return the hyperparameters of a run.
+        """
+        run = self._index[name]
+        return {key: values[run] for key, values in self._params.items()}
+
+    def history(self, name: str) -> dict:
+        """
+        Return the history of a run as NumPy views of the shared columns.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            ``"step"`` and one array per metric of the collection, with ``NaN``
+            where the run did not log a value.
+        """
+        run = self._index[name]
+        start, stop = self._offsets[run], self._offsets[run + 1]
+        history = {"step": self._steps[start:stop]}
+        for metric, column in self._columns.items():
+            history[metric] = column[start:stop]
+        return history
+
+    def summary(self, metric: str, stat: str = "last"):
+        """
+        Return one summary statistic of a metric for every run.
+
+        Parameters
+        ----------
+        metric : str
+            Metric name.
+        stat : {"last", "min", "max", "mean", "count", "last_step", "min_step", "max_step"}
+            Statistic computed when the runs were added. ``"last"`` is the value
+            at the largest step where the metric was logged.
+
+        Returns
+        -------
+        numpy.ndarray
+            One value per run, in insertion order; ``NaN`` for runs that never
+            logged the metric.
+
+        Raises
+        ------
+        KeyError
+            If no run logged the metric.
+        ValueError
+            If ``stat`` is unknown.
+        """
+        if stat not in SUMMARIES:
+            raise ValueError(f"Unknown statistic {stat!r}; expected one of {SUMMARIES}.")
+        key = ("summary", metric, stat)
+        if key not in self._cache:
+            summaries = self._summaries[metric]
+            values = summaries[stat] + [np.nan] * (len(self.names) - len(summaries[stat]))
+            self._cache[key] = np.asarray(values, dtype="float64")
+        return self._cache[key]
+
+    def at_step(self, metric: str, step: int):
+        """
+        Return the value of a metric at ``step`` for every run.
+
+        Each run's steps are sorted, so the row of ``step`` is found with one
+        binary search per run instead of a scan of every history. The rows are
+        cached per step until the next `add`.
+
+        Returns
+        -------
+        numpy.ndarray
+            One value per run; ``NaN`` for runs without a value at that step.
+        """
+        key = ("rows", step)
+        if key not in self._cache:
+            steps = self._steps
+            runs, rows = [], []
+            for run, (start, stop) in enumerate(zip(self._offsets, self._offsets[1:])):
+                row = start + int(np.searchsorted(steps[start:stop], step))
+                if row < stop and steps[row] == step:
+                    runs.append(run)
+                    rows.append(row)
+            self._cache[key] = (np.asarray(runs, dtype="intp"), np.asarray(rows, dtype="intp"))
+        runs, rows = self._cache[key]
+        values = np.full(len(self.names), np.nan)
+        values[runs] = self._columns[metric][rows]
+        return values
+
+    def mask(self, where: dict | None = None):
+        """
+        Return a boolean array selecting the runs whose hyperparameters match ``where``.
+
+        Each condition compares one hyperparameter across all runs at once:
+
+        - a scalar selects runs with an equal value;
+        - a list, tuple or set selects runs whose value is one of its items;
+        - a callable receives the array of values and returns a boolean array,
+          e.g. ``{"lr": lambda lr: lr < 1e-3}``.
+
+        Raises
+        ------
+        KeyError
+            If no run has one of the hyperparameters.
+        """
+        selected = np.ones(len(self.names), dtype=bool)
+        for key, condition in (where or {}).items():
+            values = self._param_array(key)
+            if callable(condition):
+                with np.errstate(invalid="ignore"):
+                    matched = np.asarray(condition(values), dtype=bool)
+            elif isinstance(condition, (list, tuple, set, frozenset)):
+                matched = np.isin(values, list(condition))
+            else:
+                matched = values == condition
+            selected &= matched
+        return selected
+
+    def filter(self, **where) -> list[str]:
+        """
+        Return the names of the runs whose hyperparameters match, as in `mask`.
+
+        Examples
+        --------
+        >>> runs.filter(optimizer="adam", lr=lambda lr: lr <= 1e-3)
+        ['run-3', 'run-17']
+        """
+        return [self.names[run] for run in np.flatnonzero(self.mask(where))]
+
+    def best(
+        self,
+        metric: str,
+        k: int = 1,
+        by: str = "last",
+        mode: str = "min",
+        step: int | None = None,
+        where: dict | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Return the ``k`` best runs according to one metric.
+
+        Parameters
+        ----------
+        metric : str
+            Metric to rank by.
+        k : int, optional
+            Number of runs to return.
+        by : str, optional
+            Summary statistic to rank, as in `summary`. Ignored if ``step`` is given.
+        mode : {"min", "max"}, optional
+            Whether lower or higher values are better.
+        step : int, optional
+            Rank by the value logged at this step instead of a summary.
+        where : dict, optional
+            Only consider runs matching these hyperparameters, as in `mask`.
+
+        Returns
+        -------
+        list of (str, float)
+            Run names and values, best first. Runs without a value are skipped.
+        """
+        if mode not in ("min", "max"):
+            raise ValueError(f"Unknown mode {mode!r}; expected 'min' or 'max'.")
+        values = self.at_step(metric, step) if step is not None else self.summary(metric, by)
+        candidates = np.flatnonzero(self.mask(where) & ~np.isnan(values))
+        scores = values[candidates] if mode == "min" else -values[candidates]
+        k = min(k, len(candidates))
+        if k <= 0:
+            return []
+        top = np.argpartition(scores, k - 1)[:k]
+        top = top[np.argsort(scores[top], kind="stable")]
+        return [(self.names[run], float(values[run])) for run in candidates[top]]
+
+    def _summarize(self, metric: str, run: int, steps, values):
+        summaries = self._summaries.get(metric)
+        if summaries is None:
+            summaries = self._summaries[metric] = {stat: [] for stat in SUMMARIES}
+        for stat_values in summaries.values():
+            stat_values.extend([np.nan] * (run - len(stat_values)))
+
+        present = np.flatnonzero(~np.isnan(values))
+        if not len(present):
+            for stat_values in summaries.values():
+                stat_values.append(np.nan)
+            return
+
+        kept = values[present]
+        low, high = int(kept.argmin()), int(kept.argmax())
+        summaries["last"].append(float(kept[-1]))
+        summaries["last_step"].append(int(steps[present[-1]]))
+        summaries["min"].append(float(kept[low]))
+        summaries["min_step"].append(int(steps[present[low]]))
+        summaries["max"].append(float(kept[high]))
+        summaries["max_step"].append(int(steps[present[high]]))
+        summaries["mean"].append(float(kept.mean()))
+        summaries["count"].append(len(kept))
+
+    def _param_array(self, key: str):
+        cache_key = ("param", key)
+        if cache_key not in self._cache:
+            values = self._params[key]
+            array = np.asarray(values)
+            if array.dtype == object or array.ndim != 1:
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+            self._cache[cache_key] = array
+        return self._cache[cache_key]
+
+    def _reserve(self, size: int):
+        if size <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+        steps = np.empty(capacity, dtype="int64")
+        steps[: self._size] = self._steps[: self._size]
+        self._steps = steps
+        for metric, column in self._columns.items():
+            grown = np.full(capacity, np.nan)
+            grown[: self._size] = column[: self._size]
+            self._columns[metric] = grown
+        self._capacity = capacity
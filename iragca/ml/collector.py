@@ -0,0 +1,281 @@
+import itertools
+import math
+import multiprocessing
+import queue
+import threading
+import time
+
+_STOP = "stop"
+_FLUSH = "flush"
+
+REDUCERS = {
+    "mean": lambda values: math.fsum(values) / len(values),
+    "sum": math.fsum,
+    "last": lambda values: values[-1],
+    "min": min,
+    "max": max,
+}
+
+
+class MetricProducer:
+    """
+    Handle used by one worker thread or process to send metrics to a `MetricCollector`.
+
+    Records are buffered locally and sent to the collector in batches, so
+    `log_metrics` costs a list append on the hot path. Producers are picklable
+    and can be passed to ``multiprocessing.Process`` targets.
+
+    Parameters
+    ----------
+    channel : queue.SimpleQueue or multiprocessing.Queue
+        Queue shared with the collector.
+    worker_id : int
+        Identifier assigned by the collector.
+    batch_size : int
+        Number of records buffered before they are sent.
+    """
+
+    def __init__(self, channel, worker_id: int, batch_size: int):
+        self._channel = channel
+        self.worker_id = worker_id
+        self.batch_size = batch_size
+        self._buffer = []
+        self._closed = False
+
+    def log_metrics(self, log_data: dict, step: int):
+        """
+        Record metrics for ``step``. Same signature as `RunLogger.log_metrics`.
+        """
+        self._buffer.append((step, dict(log_data)))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Send buffered records to the collector.
+        """
+        if self._buffer:
+            self._channel.put((self.worker_id, self._buffer))
+            self._buffer = []
+
+    def close(self):
+        """
+        Flush and tell the collector that this worker is done.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._channel.put((self.worker_id, None))
+        self._closed = True
+
+    def __enter__(self) -> "MetricProducer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_buffer"] = []
+        return state
+
+
+class MetricCollector:
+    """
+    Aggregate metrics from many threads or processes into one `RunLogger`.
+
+    Each worker gets a `MetricProducer` from `producer` and logs through it.
+    A background thread drains the shared queue, groups values by step and
+    metric, reduces values reported by several workers (or several times) for
+    the same step, and writes finished steps to the logger in batches with
+    `RunLogger.log_metrics_many`.
+
+    A step is finished once every open producer has reported a later step, or
+    when the collector is flushed or closed.
+
+    Parameters
+    ----------
+    logger : RunLogger
+        Logger receiving the reduced metrics. Only the collector thread writes to it.
+    reduce : {"mean", "sum", "last", "min", "max"} or callable, optional
+        How values for the same step and metric are combined. A callable
+        receives the list of values.
+    mode : {"thread", "process"}, optional
+        ``"process"`` uses a ``multiprocessing`` queue so producers can be sent
+        to other processes.
+    batch_size : int, optional
+        Number of records each producer buffers before sending them.
+    flush_interval : float, optional
+        Maximum number of seconds the collector thread waits before writing
+        finished steps to the logger.
+    context : multiprocessing context, optional
+        Context used to create the queue in ``"process"`` mode.
+
+    Examples
+    --------
+    >>> logger = RunLogger(max_steps=1000)
+    >>> with MetricCollector(logger, reduce="mean", mode="process") as collector:
+    ...     workers = [Process(target=train, args=(collector.producer(),)) for _ in range(4)]
+    ...     for worker in workers:
+    ...         worker.start()
+    ...     for worker in workers:
+    ...         worker.join()
+    >>> logger.loss  # averaged across the four workers
+    """
+
+    def __init__(
+        self,
+        logger,
+        reduce="mean",
+        mode: str = "thread",
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        context=None,
+    ):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown mode {mode!r}; expected 'thread' or 'process'.")
+        if not callable(reduce) and reduce not in REDUCERS:
+            raise ValueError(f"Unknown reduce {reduce!r}; expected one of {sorted(REDUCERS)}.")
+
+        self.logger = logger
+        self.reduce = REDUCERS[reduce] if isinstance(reduce, str) else reduce
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        if mode == "process":
+            self._channel = (context or multiprocessing).Queue()
+        else:
+            self._channel = queue.SimpleQueue()
+
+        self._ids = itertools.count()
+        self._tokens = itertools.count()
+        self._lock = threading.Lock()
+        self._progress = {}
+        self._pending = {}
+        self._flushed = {}
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="MetricCollector", daemon=True)
+        self._thread.start()
+
+    def producer(self) -> MetricProducer:
+        """
+        Create a producer for one worker thread or process.
+        """
+        worker_id = next(self._ids)
+        with self._lock:
+            self._progress[worker_id] = None
+        return MetricProducer(self._channel, worker_id, self.batch_size)
+
+    def flush(self, timeout: float | None = None):
+        """
+        Write every step received so far to the logger, finished or not.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for the collector thread.
+        """
+        token = next(self._tokens)
+        event = self._flushed[token] = threading.Event()
+        self._channel.put((_FLUSH, token))
+        event.wait(timeout)
+        self._raise_error()
+
+    def close(self, timeout: float | None = None):
+        """
+        Drain the queue, write all remaining steps and stop the collector thread.
+
+        In ``"process"`` mode, join the worker processes first so that their
+        records have reached the queue.
+        """
+        if self._thread.is_alive():
+            self._channel.put((_STOP, None))
+            self._thread.join(timeout)
+        self._raise_error()
+
+    def __enter__(self) -> "MetricCollector":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("MetricCollector failed to write to the logger.") from error
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        running = True
+        while running:
+            try:
+                worker_id, records = self._channel.get(
+                    timeout=max(deadline - time.monotonic(), 0.0)
+                )
+            except queue.Empty:
+                worker_id = None
+
+            try:
+                if worker_id == _STOP:
+                    running = False
+                    self._write(everything=True)
+                elif worker_id == _FLUSH:
+                    self._write(everything=True)
+                    self._flushed.pop(records).set()
+                elif worker_id is not None:
+                    self._receive(worker_id, records)
+
+                if time.monotonic() >= deadline:
+                    self._write()
+                    deadline = time.monotonic() + self.flush_interval
+            except Exception as error:  # surfaced by flush() and close()
+                self._error = error
+                for event in self._flushed.values():
+                    event.set()
+
+    def _receive(self, worker_id: int, records):
+        with self._lock:
+            if records is None:
+                self._progress.pop(worker_id, None)
+                return
+
+            pending = self._pending
+            for step, log_data in records:
+                values = pending.get(step)
+                if values is None:
+                    values = pending[step] = {}
+                for key, value in log_data.items():
+                    if value is not None:
+                        values.setdefault(key, []).append(value)
+
+            latest = self._progress.get(worker_id)
+            last_step = records[-1][0]
+            self._progress[worker_id] = last_step if latest is None else max(latest, last_step)
+
+    def _write(self, everything: bool = False):
+        with self._lock:
+            if not self._pending:
+                return
+            if everything or not self._progress:
+                ready = sorted(self._pending)
+            else:
+                progress = self._progress.values()
+                if None in progress:
+                    return
+                watermark = min(progress)
+                ready = sorted(step for step in self._pending if step < watermark)
+            batch = [(step, self._pending.pop(step)) for step in ready]
+
+        if not batch:
+            return
+
+        steps = [step for step, _ in batch]
+        columns = {}
+        for row, (_, values) in enumerate(batch):
+            for key, reported in values.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * len(batch)
+                column[row] = self.reduce(reported)
+        self.logger.log_metrics_many(steps, columns)
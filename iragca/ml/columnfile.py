@@ -0,0 +1,153 @@
+from array import array
+import mmap
+from pathlib import Path
+import struct
+import sys
+
+from .columns import ColumnStore, np, resolve_backend
+
+MAGIC = b"IRGCOL\x00\x01"
+VERSION = 1
+
+# magic, version, itemsize, number of metrics, number of rows, max_steps, data offset
+_HEADER = struct.Struct("<8sHHIQQQ")
+_NAME_LENGTH = struct.Struct("<H")
+
+_TYPECODES = {4: "f", 8: "d"}
+_ITEMSIZES = {"float32": 4, "float64": 8}
+
+
+def write_columns(path, store: ColumnStore, max_steps: int, dtype: str = "float64"):
+    """
+    Write a column store to the binary column format.
+
+    The file holds a fixed header, the metric names, then the step column
+    (int64) and one column per metric, each starting on an 8-byte boundary.
+    All numbers are little-endian.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Destination file. Overwritten if it exists.
+    store : ColumnStore
+        Store to write.
+    max_steps : int
+        Stored in the header and restored by `read_columns`.
+    dtype : {"float64", "float32"}, optional
+        Precision of the metric columns.
+
+    Raises
+    ------
+    ValueError
+        If ``dtype`` is not supported.
+    """
+    if dtype not in _ITEMSIZES:
+        raise ValueError(f"Unsupported dtype {dtype!r}; expected 'float64' or 'float32'.")
+    itemsize = _ITEMSIZES[dtype]
+    names = store.names
+    rows = len(store)
+
+    encoded = [name.encode() for name in names]
+    table = b"".join(_NAME_LENGTH.pack(len(name)) + name for name in encoded)
+    data_offset = _align(_HEADER.size + len(table))
+
+    with open(path, "wb") as file:
+        file.write(
+            _HEADER.pack(MAGIC, VERSION, itemsize, len(names), rows, max_steps, data_offset)
+        )
+        file.write(table)
+        _pad(file)
+        file.write(_encode(store.steps(), "q"))
+        for name in names:
+            file.write(_encode(store.column(name), _TYPECODES[itemsize]))
+            _pad(file)
+
+
+def read_columns(path, backend: str = "auto") -> tuple[ColumnStore, int]:
+    """
+    Memory-map a file written by `write_columns`.
+
+    Columns are exposed directly from the mapping, so opening a file costs
+    the same regardless of its size and pages are only read when touched.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        File to open.
+    backend : {"auto", "numpy", "array"}, optional
+        Backend of the returned store. Columns are read-only NumPy arrays for
+        ``"numpy"`` and read-only memoryviews for ``"array"``.
+
+    Returns
+    -------
+    tuple of (ColumnStore, int)
+        The store, which copies its columns on the first write, and the
+        ``max_steps`` value from the header.
+
+    Raises
+    ------
+    ValueError
+        If ``path`` is not a column file.
+    """
+    path = Path(path)
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:8] != MAGIC:
+            raise ValueError(f"{str(path)!r} is not a RunLogger column file.")
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    _, version, itemsize, n_metrics, rows, max_steps, offset = _HEADER.unpack(header)
+    if version != VERSION or itemsize not in _TYPECODES:
+        raise ValueError(f"Unsupported column file version {version} or itemsize {itemsize}.")
+
+    names = []
+    position = _HEADER.size
+    for _ in range(n_metrics):
+        (length,) = _NAME_LENGTH.unpack_from(data, position)
+        position += _NAME_LENGTH.size
+        names.append(bytes(data[position : position + length]).decode())
+        position += length
+
+    backend = resolve_backend(backend)
+    steps = _column(data, backend, "q", offset, rows)
+    offset = _align(offset + rows * 8)
+
+    columns = {}
+    for name in names:
+        columns[name] = _column(data, backend, _TYPECODES[itemsize], offset, rows)
+        offset = _align(offset + rows * itemsize)
+
+    return ColumnStore.from_buffers(steps, columns, backend=backend), max_steps
+
+
+def _column(data: mmap.mmap, backend: str, typecode: str, offset: int, rows: int):
+    itemsize = 8 if typecode in "qd" else 4
+    if backend == "numpy":
+        return np.frombuffer(data, dtype=f"<{typecode}", count=rows, offset=offset)
+
+    view = memoryview(data)[offset : offset + rows * itemsize]
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+
+    swapped = array(typecode, bytes(view))
+    swapped.byteswap()
+    return memoryview(swapped)
+
+
+def _encode(values, typecode: str):
+    if np is not None and isinstance(values, np.ndarray):
+        return values.astype(f"<{typecode}", copy=False)
+
+    if values.format != typecode or sys.byteorder != "little":
+        values = array(typecode, values)
+        if sys.byteorder != "little":
+            values.byteswap()
+    return values
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _pad(file):
+    file.write(b"\0" * (_align(file.tell()) - file.tell()))
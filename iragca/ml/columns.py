@@ -0,0 +1,454 @@
+from array import array
+import bisect
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+NAN = math.nan
+
+_NUMPY_DTYPES = {"d": "float64", "f": "float32", "q": "int64"}
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Resolve a backend name to ``"numpy"`` or ``"array"``.
+
+    Raises
+    ------
+    ValueError
+        If ``backend`` is not one of ``"auto"``, ``"numpy"`` or ``"array"``.
+    ImportError
+        If ``"numpy"`` is requested but NumPy is not installed.
+    """
+    if backend == "auto":
+        return "numpy" if np is not None else "array"
+    if backend not in ("numpy", "array"):
+        raise ValueError(f"Unknown backend {backend!r}; expected 'auto', 'numpy' or 'array'.")
+    if backend == "numpy" and np is None:
+        raise ImportError("The 'numpy' backend requires numpy to be installed.")
+    return backend
+
+
+def _is_increasing(values) -> bool:
+    if np is not None and isinstance(values, np.ndarray):
+        return bool(np.all(values[1:] > values[:-1]))
+    return all(a < b for a, b in zip(values, values[1:]))
+
+
+class ColumnStore:
+    """
+    Columnar storage for scalar metrics keyed by step.
+
+    Every metric lives in one contiguous float buffer and all metrics share a
+    single step column, so a row is simply an index into these buffers.
+    Missing values are stored as ``NaN``.
+
+    Rows are kept in ascending step order as they are appended, so the step
+    column doubles as an ordered step index. Appending a step larger than the
+    last one is O(1); an out-of-order step is located with a binary search and
+    inserted in place.
+
+    Buffers are preallocated and grown by doubling. A buffer is never resized
+    in place, which means views handed out by `column` stay valid while more
+    data is appended. Stores built with `from_buffers` wrap read-only buffers
+    (e.g. a memory-mapped file) and copy them on the first write.
+
+    Parameters
+    ----------
+    backend : {"auto", "numpy", "array"}, optional
+        Buffer implementation. ``"auto"`` uses NumPy when it is installed and
+        falls back to the standard library `array` module otherwise.
+    capacity : int, optional
+        Number of rows to preallocate.
+
+    Examples
+    --------
+    >>> store = ColumnStore(backend="array")
+    >>> store.append(0, {"loss": 1.0})
+    True
+    >>> store.append(1, {"loss": 0.5, "acc": 0.7})
+    True
+    >>> store.to_list("acc")
+    [None, 0.7]
+    """
+
+    def __init__(self, backend: str = "auto", capacity: int = 1024):
+        self.backend = resolve_backend(backend)
+        self.version = 0
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._steps = self._allocate("q", self._capacity, 0)
+        self._columns = {}
+        self._readonly = False
+
+    @classmethod
+    def from_buffers(cls, steps, columns: dict, backend: str = "auto") -> "ColumnStore":
+        """
+        Wrap existing buffers without copying them.
+
+        Parameters
+        ----------
+        steps : memoryview or numpy.ndarray
+            Step column, sorted in ascending order.
+        columns : dict
+            Mapping of metric names to buffers of the same length as ``steps``.
+            float32 buffers are accepted and upcast to float64 on the first write.
+        backend : {"auto", "numpy", "array"}, optional
+            Must match the buffer type: NumPy arrays for ``"numpy"``, memoryviews
+            for ``"array"``.
+
+        Returns
+        -------
+        ColumnStore
+            A store that reads directly from the buffers.
+        """
+        store = cls(backend=backend, capacity=1)
+        store._steps = steps
+        store._columns = dict(columns)
+        store._size = store._capacity = len(steps)
+        store._readonly = True
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    @property
+    def names(self) -> list[str]:
+        """
+        List[str]
+            Metric names in the order they were first logged.
+        """
+        return list(self._columns)
+
+    def append(self, step: int, values: dict) -> bool:
+        """
+        Write ``values`` into the row for ``step``, creating the row if needed.
+
+        Parameters
+        ----------
+        step : int
+            Step the values belong to.
+        values : dict
+            Mapping of metric names to numeric values. ``None`` is stored as ``NaN``.
+
+        Returns
+        -------
+        bool
+            True if a new row was created, False if an existing row was updated.
+        """
+        if self._readonly:
+            self._grow()
+
+        size = self._size
+        created = True
+        if not size or step > self._steps[size - 1]:
+            # Fast path: steps arriving in increasing order
+            row = size
+        elif step == self._steps[size - 1]:
+            row = size - 1
+            created = False
+        else:
+            row = self._locate(step)
+            created = row == size or self._steps[row] != step
+
+        if created:
+            self._insert_row(row, step)
+
+        columns = self._columns
+        for name, value in values.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = self._allocate("d", self._capacity, NAN)
+            column[row] = NAN if value is None else value
+
+        self.version += 1
+        return created
+
+    def extend(self, steps, columns: dict) -> int:
+        """
+        Append whole columns at once.
+
+        When ``steps`` are strictly increasing and all come after `last_step`,
+        the columns are copied into the buffers with one slice assignment each.
+        Otherwise rows are written one by one, merging into existing steps:
+        missing values leave the values already stored at a step untouched.
+
+        Parameters
+        ----------
+        steps : sequence of int
+            Steps of the new rows. NumPy arrays are used without conversion.
+        columns : dict
+            Mapping of metric names to sequences of the same length as ``steps``.
+            ``None`` and ``NaN`` mark missing values.
+
+        Returns
+        -------
+        int
+            Number of rows created.
+
+        Raises
+        ------
+        ValueError
+            If a column does not have the same length as ``steps``.
+        """
+        steps = self._to_buffer(steps, "q")
+        count = len(steps)
+        columns = {name: self._to_buffer(values, "d") for name, values in columns.items()}
+        for name, values in columns.items():
+            if len(values) != count:
+                raise ValueError(
+                    f"Column {name!r} has {len(values)} values but there are {count} steps."
+                )
+        if not count:
+            return 0
+
+        size = self._size
+        if not (_is_increasing(steps) and (not size or steps[0] > self._steps[size - 1])):
+            created = 0
+            names = list(columns)
+            for row, step in enumerate(steps.tolist()):
+                values = {}
+                for name in names:
+                    value = columns[name][row]
+                    if value == value:
+                        values[name] = value
+                created += self.append(step, values)
+            return created
+
+        if self._readonly or size + count > self._capacity:
+            capacity = max(self._capacity, 1)
+            while capacity < size + count:
+                capacity *= 2
+            self._grow(capacity)
+
+        stop = size + count
+        self._steps[size:stop] = steps
+        for name, values in columns.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = self._allocate("d", self._capacity, NAN)
+            column[size:stop] = values
+        self._size = stop
+        self.version += 1
+        return count
+
+    @property
+    def last_step(self):
+        """
+        int or None
+            Largest recorded step, or None if the store is empty.
+        """
+        return int(self._steps[self._size - 1]) if self._size else None
+
+    def steps(self):
+        """
+        Return the step column in ascending step order.
+
+        Returns
+        -------
+        memoryview or numpy.ndarray
+            A zero-copy view of the step buffer.
+        """
+        return self._view(self._steps, self._size)
+
+    def column(self, name: str):
+        """
+        Return the values of a metric in ascending step order.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+
+        Returns
+        -------
+        memoryview or numpy.ndarray
+            A zero-copy view of the metric buffer. Missing values are ``NaN``.
+
+        Raises
+        ------
+        KeyError
+            If the metric has never been logged.
+        """
+        return self._view(self._columns[name], self._size)
+
+    def to_list(self, name: str) -> list:
+        """
+        Return a metric as a list of Python floats, with ``None`` for missing values.
+        """
+        return [None if value != value else value for value in self.column(name).tolist()]
+
+    def row(self, step: int):
+        """
+        Return the non-missing values logged at ``step``, or None if the step is unknown.
+        """
+        row = self.index(step)
+        if row is None:
+            return None
+        return self._row_values(row)
+
+    def rows(self, chunk: int = 4096):
+        """
+        Iterate over ``(step, values)`` pairs in ascending step order.
+
+        Rows are converted to Python objects ``chunk`` rows at a time.
+        """
+        for start in range(0, self._size, chunk):
+            stop = min(start + chunk, self._size)
+            steps = self._steps[start:stop].tolist()
+            columns = [
+                (name, column[start:stop].tolist()) for name, column in self._columns.items()
+            ]
+            for row, step in enumerate(steps):
+                values = {}
+                for name, column in columns:
+                    value = column[row]
+                    if value == value:
+                        values[name] = value
+                yield step, values
+
+    def index(self, step: int):
+        """
+        Return the row index of ``step``, or None if the step is unknown.
+        """
+        row = self._locate(step)
+        if row == self._size or self._steps[row] != step:
+            return None
+        return row
+
+    def locate(self, step: int) -> int:
+        """
+        Return the index of the first row whose step is not less than ``step``.
+        """
+        return self._locate(step)
+
+    def write_row(self, row: int, step: int, values: dict):
+        """
+        Overwrite an existing row. Metrics missing from ``values`` become ``NaN``.
+
+        The caller is responsible for keeping the step column sorted.
+        """
+        if self._readonly:
+            self._grow()
+        self._steps[row] = step
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[row] = NAN if value is None else value
+        self.version += 1
+
+    def delete_rows(self, start: int, stop: int):
+        """
+        Remove rows ``start`` to ``stop`` (exclusive), shifting later rows down.
+        """
+        if self._readonly:
+            self._grow()
+        size = self._size
+        removed = stop - start
+        if removed <= 0:
+            return
+
+        remaining = size - removed
+        self._steps[start:remaining] = self._steps[stop:size]
+        for column in self._columns.values():
+            column[start:remaining] = column[stop:size]
+            column[remaining:size] = self._allocate("d", removed, NAN)
+        self._size = remaining
+        self.version += 1
+
+    def keep_rows(self, rows):
+        """
+        Keep only the given rows, which must be sorted in ascending order.
+        """
+        if self._readonly:
+            self._grow()
+        rows = list(rows)
+        size = self._size
+        kept = len(rows)
+
+        self._steps[:kept] = self._gather(self._steps, rows)
+        for column in self._columns.values():
+            column[:kept] = self._gather(column, rows)
+            column[kept:size] = self._allocate("d", size - kept, NAN)
+        self._size = kept
+        self.version += 1
+
+    def _to_buffer(self, values, typecode: str):
+        if self.backend == "numpy":
+            return np.asarray(values, dtype=_NUMPY_DTYPES[typecode])
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+        if typecode == "d":
+            return array(typecode, (NAN if value is None else value for value in values))
+        return array(typecode, values)
+
+    def _gather(self, buffer, rows: list):
+        if self.backend == "numpy":
+            return buffer[rows]
+        return array(buffer.typecode, [buffer[row] for row in rows])
+
+    def _row_values(self, row: int) -> dict:
+        values = {}
+        for name, column in self._columns.items():
+            value = column[row]
+            if value == value:
+                values[name] = float(value)
+        return values
+
+    def _locate(self, step: int) -> int:
+        """Index of the first row whose step is not less than ``step``."""
+        if self.backend == "numpy":
+            return int(np.searchsorted(self._steps[: self._size], step))
+        return bisect.bisect_left(self._steps, step, 0, self._size)
+
+    def _insert_row(self, row: int, step: int):
+        if self._size == self._capacity:
+            self._grow()
+
+        size = self._size
+        if row < size:
+            # Shift the tail one slot to the right in every buffer
+            self._steps[row + 1 : size + 1] = self._steps[row:size]
+            for column in self._columns.values():
+                column[row + 1 : size + 1] = column[row:size]
+                column[row] = NAN
+
+        self._steps[row] = step
+        self._size = size + 1
+
+    def _view(self, buffer, size: int):
+        if self.backend == "numpy":
+            return buffer[:size]
+        return memoryview(buffer)[:size]
+
+    def _allocate(self, typecode: str, size: int, fill):
+        if self.backend == "numpy":
+            return np.full(size, fill, dtype=_NUMPY_DTYPES[typecode])
+        return array(typecode, [fill]) * size
+
+    def _grow(self, capacity: int | None = None):
+        capacity = capacity or max(self._capacity * 2, 1)
+        self._steps = self._copy(self._steps, "q", capacity, 0)
+        for name, column in self._columns.items():
+            self._columns[name] = self._copy(column, "d", capacity, NAN)
+
+        self._capacity = capacity
+        self._readonly = False
+
+    def _copy(self, buffer, typecode: str, capacity: int, fill):
+        """Copy the first rows of ``buffer`` into a new writable buffer of ``capacity``."""
+        size = self._size
+        if self.backend == "array" and getattr(buffer, "typecode", None) != typecode:
+            # Read-only memoryviews, possibly of a narrower type
+            copied = array(typecode, buffer[:size])
+            copied.extend(array(typecode, [fill]) * (capacity - size))
+            return copied
+
+        copied = self._allocate(typecode, capacity, fill)
+        copied[:size] = buffer[:size]
+        return copied
@@ -0,0 +1,108 @@
+from collections import deque
+import gc
+import os
+import time
+
+
+class Instrumentation:
+    """
+    Measure logging throughput and process resources as ordinary metrics.
+
+    Used by `RunLogger` when created with ``instrument=True`` or an instance of
+    this class. Each call to `RunLogger.log_metrics` is extended with:
+
+    - ``elapsed``: wall-clock seconds since the first call, a never decreasing
+      column for time-based windows such as ``RunLogger.rolling(..., on="elapsed")``.
+    - ``time_per_step``: wall-clock seconds since the previous call.
+    - ``steps_per_sec``: calls per second over the last ``window`` calls.
+    - ``log_time``: seconds spent inside the previous call to `RunLogger.log_metrics`,
+      including progress bar rendering.
+
+    With ``resources=True``, these are added every ``sample_interval`` seconds:
+
+    - ``rss_mb``: resident memory of the process in MiB.
+    - ``gc_collections``: total garbage collector runs, across generations.
+
+    The first call has no timings besides ``elapsed``, and steps between samples have no resource
+    values; both are stored as missing.
+
+    Parameters
+    ----------
+    window : int, optional
+        Number of calls ``steps_per_sec`` is averaged over.
+    resources : bool, optional
+        Also sample ``rss_mb`` and ``gc_collections``.
+    sample_interval : float, optional
+        Minimum number of seconds between two resource samples.
+
+    Examples
+    --------
+    >>> logger = RunLogger(max_steps=1000, instrument=Instrumentation(resources=True))
+    >>> logger.stats("steps_per_sec").mean
+    """
+
+    def __init__(self, window: int = 50, resources: bool = False, sample_interval: float = 1.0):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if sample_interval < 0:
+            raise ValueError("sample_interval must be non-negative")
+        self.window = window
+        self.resources = resources
+        self.sample_interval = sample_interval
+        self._times = deque(maxlen=window)
+        self._first = None
+        self._started = None
+        self._log_time = None
+        self._next_sample = 0.0
+
+    def start(self) -> dict:
+        """
+        Mark the start of a logging call and return the metrics to log with it.
+        """
+        now = time.perf_counter()
+        self._started = now
+        if self._first is None:
+            self._first = now
+        times = self._times
+        metrics = {"elapsed": now - self._first}
+        if times:
+            metrics["time_per_step"] = now - times[-1]
+            metrics["steps_per_sec"] = len(times) / (now - times[0])
+        if self._log_time is not None:
+            metrics["log_time"] = self._log_time
+        times.append(now)
+
+        if self.resources and now >= self._next_sample:
+            self._next_sample = now + self.sample_interval
+            rss = resident_memory()
+            if rss is not None:
+                metrics["rss_mb"] = rss / 2**20
+            metrics["gc_collections"] = sum(stats["collections"] for stats in gc.get_stats())
+        return metrics
+
+    def stop(self):
+        """
+        Mark the end of the logging call started by the last `start`.
+        """
+        self._log_time = time.perf_counter() - self._started
+
+
+def resident_memory() -> int | None:
+    """
+    Return the resident set size of the current process in bytes.
+
+    Reads ``/proc/self/statm`` on Linux and falls back to ``psutil`` when it is
+    installed. Returns None if neither is available.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
@@ -0,0 +1,134 @@
+import importlib
+
+from .columns import ColumnStore, np
+
+
+def _require(module: str, feature: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        package = module.split(".")[0]
+        raise ImportError(f"{feature} requires {package} to be installed.") from error
+
+
+def _as_numpy(values, copy: bool):
+    if np is None:
+        raise ImportError("Exporting columns requires numpy to be installed.")
+    values = np.asarray(values)
+    return values.copy() if copy else values
+
+
+def to_pandas(store: ColumnStore, copy: bool = False):
+    """
+    Build a `pandas.DataFrame` with a ``step`` column and one column per metric.
+
+    Parameters
+    ----------
+    store : ColumnStore
+        Store to export.
+    copy : bool, optional
+        Copy the columns instead of sharing the store's buffers.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame whose columns are NumPy views of the store unless ``copy`` is True.
+        Missing values are ``NaN``.
+    """
+    pd = _require("pandas", "to_pandas")
+    columns = {"step": _as_numpy(store.steps(), copy)}
+    for name in store.names:
+        columns[name] = _as_numpy(store.column(name), copy)
+    return pd.DataFrame(columns, copy=False)
+
+
+def to_arrow(store: ColumnStore):
+    """
+    Build a `pyarrow.Table` with a ``step`` column and one column per metric.
+
+    The step column and the metric values are wrapped without a Python-level
+    conversion; missing values (``NaN``) become Arrow nulls.
+    """
+    pa = _require("pyarrow", "to_arrow")
+    arrays = [pa.array(_as_numpy(store.steps(), False))]
+    arrays += [
+        pa.array(_as_numpy(store.column(name), False), from_pandas=True) for name in store.names
+    ]
+    return pa.Table.from_arrays(arrays, names=["step", *store.names])
+
+
+def to_parquet(store: ColumnStore, path, **kwargs):
+    """
+    Write the table built by `to_arrow` to a Parquet file.
+
+    ``kwargs`` are passed to `pyarrow.parquet.write_table`, e.g. ``compression``.
+    """
+    pq = _require("pyarrow.parquet", "to_parquet")
+    pq.write_table(to_arrow(store), path, **kwargs)
+
+
+def from_pandas(frame) -> tuple:
+    """
+    Extract steps and metric columns from a `pandas.DataFrame`.
+
+    Steps are read from the ``step`` column, or from the index if there is none.
+    Every other column is converted to float64 NumPy arrays, without copying
+    columns that already have that dtype.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, dict)
+        Steps and a mapping of metric names to values, ready for
+        `RunLogger.log_metrics_many`.
+    """
+    if "step" in frame.columns:
+        steps = frame["step"].to_numpy(dtype="int64")
+        names = [name for name in frame.columns if name != "step"]
+    else:
+        steps = frame.index.to_numpy(dtype="int64")
+        names = list(frame.columns)
+    columns = {str(name): frame[name].to_numpy(dtype="float64", na_value=np.nan) for name in names}
+    return steps, columns
+
+
+def from_arrow(table) -> tuple:
+    """
+    Extract steps and metric columns from a `pyarrow.Table` with a ``step`` column.
+
+    Nulls become ``NaN``. Single-chunk float64 columns without nulls are used
+    without copying.
+
+    Raises
+    ------
+    KeyError
+        If the table has no ``step`` column.
+    """
+    if "step" not in table.column_names:
+        raise KeyError("step")
+    steps = table.column("step").to_numpy().astype("int64", copy=False)
+    columns = {}
+    for name in table.column_names:
+        if name == "step":
+            continue
+        column = table.column(name)
+        if column.null_count:
+            column = column.cast("float64").fill_null(float("nan"))
+        columns[name] = column.to_numpy().astype("float64", copy=False)
+    return steps, columns
+
+
+def from_parquet(path, columns: list[str] | None = None) -> tuple:
+    """
+    Read a Parquet file written by `to_parquet` and extract it with `from_arrow`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        File to read.
+    columns : list of str, optional
+        Metrics to read. The ``step`` column is always read.
+    """
+    pq = _require("pyarrow.parquet", "from_parquet")
+    if columns is not None:
+        columns = ["step", *(name for name in columns if name != "step")]
+    return from_arrow(pq.read_table(path, columns=columns))
@@ -0,0 +1,310 @@
+import time
+
+
+class _MinMaxBuckets:
+    """
+    Pixel-width min/max decimation of a series, updated incrementally.
+
+    The x range ``[origin, origin + width * count)`` is split into ``count``
+    buckets. Each bucket keeps its lowest and highest point, which is all a
+    line needs to look the same at one bucket per pixel column.
+    """
+
+    def __init__(self, origin: float, width: float, count: int):
+        self.origin = origin
+        self.width = width
+        self.buckets = [None] * count
+        self.last_x = None
+
+    def add(self, xs: list, ys: list):
+        origin, width, buckets = self.origin, self.width, self.buckets
+        top = len(buckets) - 1
+        last_x = self.last_x
+        for x, y in zip(xs, ys):
+            if y != y or (last_x is not None and x < last_x):
+                continue
+            last_x = x
+            index = min(int((x - origin) / width), top)
+            bucket = buckets[index]
+            if bucket is None:
+                buckets[index] = [x, y, x, y]
+            elif y < bucket[1]:
+                bucket[0], bucket[1] = x, y
+            elif y > bucket[3]:
+                bucket[2], bucket[3] = x, y
+        self.last_x = last_x
+
+    def widen(self, factor: int):
+        """
+        Make every bucket ``factor`` times wider, merging neighbouring buckets.
+        """
+        merged = [None] * len(self.buckets)
+        for index, bucket in enumerate(self.buckets):
+            if bucket is None:
+                continue
+            target = merged[index // factor]
+            if target is None:
+                merged[index // factor] = bucket
+                continue
+            if bucket[1] < target[1]:
+                target[0], target[1] = bucket[0], bucket[1]
+            if bucket[3] > target[3]:
+                target[2], target[3] = bucket[2], bucket[3]
+        self.buckets = merged
+        self.width *= factor
+
+    def points(self) -> tuple[list, list]:
+        xs, ys = [], []
+        for bucket in self.buckets:
+            if bucket is None:
+                continue
+            low_x, low, high_x, high = bucket
+            if low_x == high_x:
+                xs.append(low_x)
+                ys.append(low)
+            elif low_x < high_x:
+                xs += (low_x, high_x)
+                ys += (low, high)
+            else:
+                xs += (high_x, low_x)
+                ys += (high, low)
+        return xs, ys
+
+    def limits(self) -> tuple[float, float] | None:
+        lows = [bucket[1] for bucket in self.buckets if bucket is not None]
+        if not lows:
+            return None
+        return min(lows), max(bucket[3] for bucket in self.buckets if bucket is not None)
+
+
+class LivePlot:
+    """
+    Live line plot of `RunLogger` metrics that is cheap to refresh on long runs.
+
+    Created with `RunLogger.live_plot`, which refreshes it after every call to
+    `RunLogger.log_metrics`. Refreshes are limited to ``fps`` per second; the
+    calls in between return immediately.
+
+    Each refresh only reads the rows logged since the previous one. Points are
+    decimated into one min/max bucket per pixel column, so each line has at most
+    two points per pixel however long the run is. Lines are drawn with
+    blitting over a cached background. The axes are redrawn in full only when the
+    data leaves the current limits: the x range doubles each time and the y range
+    grows with a margin, so full redraws become rarer as the run grows.
+
+    The figure uses `iragca.matplotlib.Styles.ML` and the `iragca.matplotlib.Color`
+    main palette. Requires matplotlib.
+
+    Parameters
+    ----------
+    logger : RunLogger
+        Logger to plot.
+    metrics : list of str, optional
+        Metrics to plot. Defaults to every metric, including ones logged later.
+    fps : float, optional
+        Maximum number of refreshes per second.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. A new figure is created by default.
+    figsize : tuple of float, optional
+        Size of the new figure.
+
+    Attributes
+    ----------
+    figure : matplotlib.figure.Figure
+    ax : matplotlib.axes.Axes
+    frames : int
+        Number of refreshes drawn so far.
+    redraws : int
+        Number of those refreshes that redrew the whole figure.
+    """
+
+    def __init__(
+        self,
+        logger,
+        metrics: list[str] | None = None,
+        fps: float = 10.0,
+        ax=None,
+        figsize: tuple[float, float] = (8.0, 4.5),
+    ):
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError as error:
+            raise ImportError("LivePlot requires matplotlib to be installed.") from error
+        from iragca.matplotlib import Color, Styles
+
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+
+        self.logger = logger
+        self.metrics = list(metrics) if metrics is not None else None
+        self.interval = 1.0 / fps
+        self.frames = 0
+        self.redraws = 0
+
+        self._style = Styles.ML.value
+        with plt.style.context(self._style):
+            if ax is None:
+                self.figure, self.ax = plt.subplots(figsize=figsize)
+            else:
+                self.figure, self.ax = ax.figure, ax
+            self.ax.set_xlabel("step")
+        self._colors = Color.get_main_colors()
+        self._blitting = self.figure.canvas.supports_blit
+        self._lines = {}
+        self._background = None
+        self._next_frame = 0.0
+        self._reset()
+
+        self.figure.canvas.mpl_connect("resize_event", self._invalidate)
+        if plt.isinteractive():
+            plt.show(block=False)
+
+    def update(self, force: bool = False) -> bool:
+        """
+        Plot the rows logged since the last refresh.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Refresh even if the frame rate cap has not elapsed.
+
+        Returns
+        -------
+        bool
+            Whether a frame was drawn.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_frame:
+            return False
+        self._next_frame = now + self.interval
+
+        steps = self.logger.column("step")
+        size = len(steps)
+        consumed = self._consumed
+        if consumed and (consumed > size or int(steps[consumed - 1]) != self._last_step):
+            # Rows were inserted, dropped or summarized: decimate everything again
+            self._reset()
+            consumed = 0
+        if not size or (consumed == size and not force):
+            return False
+
+        # Re-read the last plotted row, which may have been updated since
+        start = max(consumed - 1, 0)
+        new_steps = steps[start:size].tolist()
+        redraw = self._origin is None
+        if redraw:
+            self._set_x_range(new_steps[0], new_steps[-1])
+        while new_steps[-1] >= self._x_max:
+            self._widen()
+            redraw = True
+
+        logged = self.logger.metrics
+        for name in self.metrics if self.metrics is not None else logged:
+            if name not in logged:
+                continue
+            if name not in self._lines:
+                self._add_line(name)
+                redraw = True
+            values = self.logger.column(name)[start:size].tolist()
+            self._lines[name][1].add(new_steps, values)
+
+        self._consumed = size
+        self._last_step = new_steps[-1]
+        for line, buckets in self._lines.values():
+            line.set_data(*buckets.points())
+
+        if self._update_y_range() or redraw or (self._blitting and self._background is None):
+            self._draw()
+        else:
+            self._blit()
+        self.frames += 1
+        return True
+
+    def close(self):
+        """
+        Stop refreshing from the logger and close the figure.
+        """
+        import matplotlib.pyplot as plt
+
+        if getattr(self.logger, "_plot", None) is self:
+            self.logger._plot = None
+        plt.close(self.figure)
+
+    def _reset(self):
+        self._consumed = 0
+        self._last_step = None
+        self._origin = None
+        self._x_max = None
+        self._y_range = None
+        self._pixels = max(int(self.ax.bbox.width), 1)
+        for name, (line, _) in self._lines.items():
+            self._lines[name] = (line, None)
+
+    def _set_x_range(self, first: int, last: int):
+        span = max(getattr(self.logger, "_max_steps", 1), last - first + 1, 1)
+        self._origin = first
+        self._x_max = first + span
+        width = span / self._pixels
+        for name, (line, _) in self._lines.items():
+            self._lines[name] = (line, _MinMaxBuckets(first, width, self._pixels))
+
+    def _widen(self):
+        self._x_max = self._origin + 2 * (self._x_max - self._origin)
+        for _, buckets in self._lines.values():
+            buckets.widen(2)
+
+    def _add_line(self, name: str):
+        color = self._colors[len(self._lines) % len(self._colors)]
+        with self._plt_style():
+            (line,) = self.ax.plot([], [], color=color, label=name, animated=self._blitting)
+        width = (self._x_max - self._origin) / self._pixels
+        self._lines[name] = (line, _MinMaxBuckets(self._origin, width, self._pixels))
+        self.ax.legend(loc="upper right")
+
+    def _update_y_range(self) -> bool:
+        limits = [buckets.limits() for _, buckets in self._lines.values()]
+        limits = [limit for limit in limits if limit is not None]
+        if not limits:
+            return False
+        low = min(limit[0] for limit in limits)
+        high = max(limit[1] for limit in limits)
+        if self._y_range is not None and self._y_range[0] <= low and high <= self._y_range[1]:
+            return False
+
+        margin = 0.25 * (high - low) or 0.5 * abs(high) or 1.0
+        self._y_range = (low - margin, high + margin)
+        return True
+
+    def _draw(self):
+        self.ax.set_xlim(self._origin, self._x_max)
+        if self._y_range is not None:
+            self.ax.set_ylim(*self._y_range)
+        self.redraws += 1
+        if not self._blitting:
+            self._blit()
+            return
+
+        canvas = self.figure.canvas
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self._blit(restore=False)
+
+    def _blit(self, restore: bool = True):
+        canvas = self.figure.canvas
+        if not self._blitting:
+            canvas.draw_idle()
+        else:
+            if restore:
+                canvas.restore_region(self._background)
+            for line, _ in self._lines.values():
+                self.ax.draw_artist(line)
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+    def _invalidate(self, event=None):
+        self._background = None
+
+    def _plt_style(self):
+        import matplotlib.pyplot as plt
+
+        return plt.style.context(self._style)
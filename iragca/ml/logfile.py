@@ -0,0 +1,224 @@
+import mmap
+import os
+from pathlib import Path
+import struct
+import time
+import weakref
+import zlib
+
+MAGIC = b"IRGLOG\x00\x01"
+
+_FILE_HEADER = struct.Struct("<8sQ")  # magic, max_steps
+_RECORD_HEADER = struct.Struct("<BII")  # kind, payload length, crc32 of payload
+_STEP = struct.Struct("<q")
+_VALUE = struct.Struct("<Hd")  # metric id, value
+
+_METRIC = 1
+_ROW = 2
+
+
+class LogWriter:
+    """
+    Append-only writer for the RunLogger streaming log format.
+
+    The file starts with a fixed header followed by length-prefixed,
+    CRC-checked records. A metric record assigns the next integer id to a
+    metric name; a row record holds a step and ``(metric id, value)`` pairs.
+    Records are encoded into an in-memory buffer and written in batches.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Log file. A new file is created unless ``end`` is given.
+    max_steps : int
+        Stored in the header so the logger can be rebuilt with `RunLogger.open`.
+    names : list of str, optional
+        Metric names already defined in the file, in id order. Used when resuming.
+    end : int, optional
+        Offset of the end of the last valid record when resuming. Anything after
+        it (e.g. a torn record) is truncated before appending.
+    flush_every : int, optional
+        Number of rows buffered in memory before they are written to the file.
+    fsync_interval : float or None, optional
+        Seconds between ``os.fsync`` calls. Rows are also flushed once this much
+        time has passed since the last sync, even before ``flush_every`` rows, so
+        a crash loses at most about ``fsync_interval`` seconds of rows however
+        slowly they are written. ``0`` flushes and syncs every row, None only
+        syncs on `close`.
+
+    Raises
+    ------
+    FileExistsError
+        If ``end`` is not given and ``path`` already contains data.
+    """
+
+    def __init__(
+        self,
+        path,
+        max_steps: int,
+        names: list[str] | None = None,
+        end: int | None = None,
+        flush_every: int = 64,
+        fsync_interval: float | None = 1.0,
+    ):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self._ids = {name: i for i, name in enumerate(names or [])}
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+        if end is None:
+            if self.path.exists() and self.path.stat().st_size:
+                raise FileExistsError(
+                    f"{str(self.path)!r} already contains a log; use RunLogger.open to resume it."
+                )
+            self._file = open(self.path, "wb")
+            self._file.write(_FILE_HEADER.pack(MAGIC, max_steps))
+            self._file.flush()
+        else:
+            self._file = open(self.path, "r+b")
+            self._file.truncate(end)
+            self._file.seek(end)
+
+        self._finalizer = weakref.finalize(self, _flush_and_close, self._file, self._buffer)
+
+    def write(self, step: int, values: dict):
+        """
+        Buffer one row, flushing every ``flush_every`` rows or once ``fsync_interval`` has elapsed.
+        """
+        buffer = self._buffer
+        payload = [_STEP.pack(step)]
+        for name, value in values.items():
+            if value is None:
+                continue
+            metric_id = self._ids.get(name)
+            if metric_id is None:
+                metric_id = self._ids[name] = len(self._ids)
+                _append_record(buffer, _METRIC, name.encode())
+            payload.append(_VALUE.pack(metric_id, value))
+        _append_record(buffer, _ROW, b"".join(payload))
+
+        self._pending += 1
+        if self._pending >= self.flush_every or (
+            self.fsync_interval is not None
+            and time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered rows to the file and fsync if ``fsync_interval`` has elapsed.
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
+        self._pending = 0
+
+        if self.fsync_interval is not None:
+            now = time.monotonic()
+            if now - self._last_sync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_sync = now
+
+    def close(self):
+        """
+        Flush, fsync and close the file.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._finalizer.detach()
+        self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+
+class LogReader:
+    """
+    Sequential reader for files written by `LogWriter`.
+
+    Iterating yields ``(step, values)`` pairs in the order they were written.
+    Reading stops at the first record that is incomplete or fails its CRC
+    check, which is what a crash in the middle of a write leaves behind.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Log file to read.
+
+    Attributes
+    ----------
+    max_steps : int
+        Value stored in the file header.
+    names : list of str
+        Metric names defined so far, in id order.
+    end : int
+        Offset just past the last valid record read so far.
+
+    Raises
+    ------
+    ValueError
+        If the file does not start with a valid header.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            header = file.read(_FILE_HEADER.size)
+        if len(header) < _FILE_HEADER.size or header[:8] != MAGIC:
+            raise ValueError(f"{str(self.path)!r} is not a RunLogger log file.")
+
+        self.max_steps = _FILE_HEADER.unpack(header)[1]
+        self.names = []
+        self.end = _FILE_HEADER.size
+
+    def __iter__(self):
+        with (
+            open(self.path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            size = len(data)
+            offset = self.end
+            names = self.names
+            while offset + _RECORD_HEADER.size <= size:
+                kind, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+                start = offset + _RECORD_HEADER.size
+                stop = start + length
+                if stop > size:
+                    break
+                payload = data[start:stop]
+                if zlib.crc32(payload) != crc:
+                    break
+
+                if kind == _METRIC:
+                    names.append(payload.decode())
+                    self.end = offset = stop
+                elif kind == _ROW:
+                    step = _STEP.unpack_from(payload)[0]
+                    values = {
+                        names[metric_id]: value
+                        for metric_id, value in _VALUE.iter_unpack(payload[_STEP.size :])
+                    }
+                    self.end = offset = stop
+                    yield step, values
+                else:
+                    break
+
+
+def _append_record(buffer: bytearray, kind: int, payload: bytes):
+    buffer += _RECORD_HEADER.pack(kind, len(payload), zlib.crc32(payload))
+    buffer += payload
+
+
+def _flush_and_close(file, buffer: bytearray):
+    if file.closed:
+        return
+    if buffer:
+        file.write(buffer)
+    file.close()
@@ -0,0 +1,69 @@
+import threading
+
+
+class ProgressRenderer:
+    """
+    Render a tqdm progress bar from a background thread at a capped rate.
+
+    The training thread only calls `record`, which stores the latest metrics
+    and a step count. A daemon thread wakes up at most ``refresh_rate`` times
+    per second, advances the bar by the steps recorded since its last wake-up,
+    formats the postfix from the latest metrics and refreshes the display.
+
+    Parameters
+    ----------
+    pbar : tqdm.tqdm
+        Progress bar to drive. It should only be touched by the renderer afterwards.
+    refresh_rate : float
+        Maximum number of refreshes per second.
+    total : int
+        The bar is closed and the thread stops once this many steps are rendered.
+    """
+
+    def __init__(self, pbar, refresh_rate: float, total: int):
+        self.pbar = pbar
+        self.interval = 1.0 / refresh_rate
+        self.total = total
+        self._recorded = 0
+        self._rendered = 0
+        self._latest = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ProgressRenderer", daemon=True)
+        self._thread.start()
+
+    def record(self, steps: int, postfix: dict):
+        """
+        Note ``steps`` more logged steps and the most recent metrics.
+        """
+        self._latest = dict(postfix)
+        self._recorded += steps
+
+    def stop(self):
+        """
+        Render what was recorded so far, close the bar and stop the thread.
+        """
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            if self._render():
+                self._stopped.set()
+        self._render()
+        self.pbar.close()
+
+    def _render(self) -> bool:
+        recorded = self._recorded
+        steps = recorded - self._rendered
+        if steps:
+            self._rendered = recorded
+            self.pbar.update(steps)
+            if self._latest is not None:
+                self.pbar.set_postfix(self._latest, refresh=False)
+            self.pbar.refresh()
+        return self._rendered >= self.total
@@ -0,0 +1,233 @@
+from .columns import ColumnStore, np
+
+ROLLING = ("mean", "std", "min", "max")
+
+
+def _require_numpy(feature: str):
+    if np is None:
+        raise ImportError(f"{feature} requires numpy to be installed.")
+
+
+def row_range(store: ColumnStore, start: int | None = None, stop: int | None = None):
+    """
+    Return the rows ``[first, last)`` holding steps ``start <= step < stop``, by binary search.
+    """
+    first = 0 if start is None else store.locate(start)
+    last = len(store) if stop is None else store.locate(stop)
+    return first, max(first, last)
+
+
+def select(
+    store: ColumnStore,
+    start: int | None = None,
+    stop: int | None = None,
+    metrics: list[str] | None = None,
+) -> dict:
+    """
+    Slice a step range out of a column store.
+
+    Parameters
+    ----------
+    store : ColumnStore
+        Store to read.
+    start, stop : int, optional
+        Step range; ``stop`` is exclusive. Both are located by binary search.
+    metrics : list of str, optional
+        Metrics to return. Defaults to all of them.
+
+    Returns
+    -------
+    dict of numpy.ndarray
+        ``"step"`` and one array per metric. The arrays are views of the store's
+        buffers, with ``NaN`` for missing values.
+
+    Raises
+    ------
+    KeyError
+        If one of ``metrics`` has never been logged.
+    """
+    _require_numpy("select")
+    first, last = row_range(store, start, stop)
+    names = store.names if metrics is None else metrics
+    selected = {"step": np.asarray(store.steps())[first:last]}
+    for name in names:
+        selected[name] = np.asarray(store.column(name))[first:last]
+    return selected
+
+
+def window_start(keys, row: int, window: int | None = None, span: float | None = None) -> int:
+    """
+    Return the first row of the trailing window that ends at ``row``.
+    """
+    if not row:
+        return 0
+    if window is not None:
+        return max(row - window + 1, 0)
+    if row >= len(keys):
+        return row
+    _require_numpy("rolling")
+    keys = np.asarray(keys)
+    return int(np.searchsorted(keys[:row], keys[row] - span, side="right"))
+
+
+def rolling(
+    values,
+    how: str = "mean",
+    window: int | None = None,
+    span: float | None = None,
+    keys=None,
+    min_periods: int = 1,
+):
+    """
+    Trailing rolling statistic of a series, computed with whole-array operations.
+
+    Each output ``i`` summarizes the rows of a window ending at row ``i``: the last
+    ``window`` rows, or the rows whose key is greater than ``keys[i] - span``.
+    Means use running sums, so they take ``O(n)`` time whatever the window.
+    Standard deviations merge power-of-two blocks with a numerically stable
+    update, and minima and maxima use a sparse table; both are built one level
+    at a time, which takes ``O(n log w)`` time and ``O(n)`` memory.
+
+    Parameters
+    ----------
+    values : array-like
+        Series to summarize. ``NaN`` values are ignored.
+    how : {"mean", "std", "min", "max"}, optional
+        Statistic to compute. ``"std"`` is the population standard deviation.
+    window : int, optional
+        Number of rows in each window.
+    span : float, optional
+        Width of each window in units of ``keys``.
+    keys : array-like, optional
+        Non-decreasing keys, such as steps or elapsed seconds. Required with ``span``.
+    min_periods : int, optional
+        Minimum number of non-missing values a window needs; otherwise the
+        result is ``NaN``.
+
+    Returns
+    -------
+    numpy.ndarray
+        One value per row of ``values``.
+
+    Raises
+    ------
+    ValueError
+        If ``how`` is unknown, if not exactly one of ``window`` and ``span`` is
+        given, or if ``keys`` are missing or not sorted.
+    """
+    _require_numpy("rolling")
+    if how not in ROLLING:
+        raise ValueError(f"Unknown statistic {how!r}; expected one of {ROLLING}.")
+    if (window is None) == (span is None):
+        raise ValueError("Pass exactly one of window and span.")
+
+    values = np.asarray(values, dtype="float64")
+    n = len(values)
+    rows = np.arange(n)
+    if window is not None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        left = np.maximum(rows - (window - 1), 0)
+    else:
+        keys = _check_keys(keys, n)
+        left = np.searchsorted(keys, keys - span, side="right")
+        left = np.minimum(left, rows)
+
+    valid = ~np.isnan(values)
+    counts = _window_sums(valid.astype("float64"), left)
+    if how == "mean":
+        # Shifting by the mean keeps the running sums small
+        shift = float(values[valid].mean()) if valid.any() else 0.0
+        centered = np.where(valid, values - shift, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = _window_sums(centered, left) / counts + shift
+    elif how == "std":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.sqrt(np.maximum(_window_m2(values, valid, left) / counts, 0.0))
+    else:
+        fill = np.inf if how == "min" else -np.inf
+        reduce = np.minimum if how == "min" else np.maximum
+        result = _window_extremes(np.where(valid, values, fill), left, reduce)
+
+    result[counts < max(min_periods, 1)] = np.nan
+    return result
+
+
+def _check_keys(keys, n: int):
+    if keys is None:
+        raise ValueError("span requires keys, e.g. the step column.")
+    keys = np.asarray(keys, dtype="float64")
+    if len(keys) != n:
+        raise ValueError(f"Expected {n} keys, got {len(keys)}.")
+    if np.isnan(keys).any() or (np.diff(keys) < 0).any():
+        raise ValueError("Window keys must be non-decreasing and have no missing values.")
+    return keys
+
+
+def _window_sums(values, left):
+    totals = np.concatenate(([0.0], np.cumsum(values)))
+    return totals[1:] - totals[left]
+
+
+def _window_m2(values, valid, left):
+    # Sum of squared deviations of every window, merged from power-of-two
+    # blocks with Chan et al.'s update, which avoids the cancellation of
+    # differences of running sums of squares
+    n = len(values)
+    rows = np.arange(n)
+    lengths = rows - left + 1
+    position = left.copy()
+    count = np.zeros(n)
+    mean = np.zeros(n)
+    m2 = np.zeros(n)
+    # Level k holds the count, mean and m2 of values[j : j + 2**k]
+    block_count = valid.astype("float64")
+    block_mean = np.where(valid, values, 0.0)
+    block_m2 = np.zeros(n)
+    level = 0
+    while n and (lengths >> level).any():
+        half = 1 << level
+        if level:
+            shift = half >> 1
+            block_count, block_mean, block_m2 = _merge_moments(
+                (block_count[:-shift], block_mean[:-shift], block_m2[:-shift]),
+                (block_count[shift:], block_mean[shift:], block_m2[shift:]),
+            )
+        queries = (lengths & half).astype(bool)
+        if queries.any():
+            start = position[queries]
+            count[queries], mean[queries], m2[queries] = _merge_moments(
+                (count[queries], mean[queries], m2[queries]),
+                (block_count[start], block_mean[start], block_m2[start]),
+            )
+            position[queries] += half
+        level += 1
+    return m2
+
+
+def _merge_moments(first, second):
+    count_a, mean_a, m2_a = first
+    count_b, mean_b, m2_b = second
+    count = count_a + count_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(count > 0, count_b / count, 0.0)
+    delta = mean_b - mean_a
+    return count, mean_a + delta * weight, m2_a + m2_b + delta * delta * count_a * weight
+
+
+def _window_extremes(values, left, reduce):
+    n = len(values)
+    rows = np.arange(n)
+    levels = np.floor(np.log2(rows - left + 1)).astype("int64")
+    result = np.empty(n)
+    # table[j] reduces values[j : j + 2**level]
+    table = values
+    for level in range(int(levels.max()) + 1 if n else 0):
+        half = 1 << level
+        if level:
+            table = reduce(table[: -(half >> 1)], table[half >> 1 :])
+        queries = levels == level
+        if queries.any():
+            right = rows[queries]
+            result[queries] = reduce(table[left[queries]], table[right - half + 1])
+    return result
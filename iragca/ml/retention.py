@@ -0,0 +1,261 @@
+from abc import ABC, abstractmethod
+import bisect
+import random
+
+from .columns import ColumnStore
+
+
+class RetentionPolicy(ABC):
+    """
+    Base class for policies that decide which steps a `RunLogger` keeps in memory.
+
+    A policy receives every call to `RunLogger.log_metrics` and writes into
+    the logger's `ColumnStore`, dropping, replacing or summarizing rows so
+    that memory stays bounded. Policies are stateful: use one instance per
+    logger.
+    """
+
+    @abstractmethod
+    def append(self, store: ColumnStore, step: int, values: dict):
+        """
+        Write ``values`` for ``step`` into ``store``, subject to the policy.
+        """
+
+
+class EveryNth(RetentionPolicy):
+    """
+    Keep only steps that are multiples of ``n``.
+
+    Parameters
+    ----------
+    n : int
+        Keep steps where ``step % n == 0``.
+
+    Examples
+    --------
+    >>> logger = RunLogger(max_steps=1000, retention=EveryNth(10))
+    """
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        self.n = n
+
+    def append(self, store: ColumnStore, step: int, values: dict):
+        if step % self.n == 0:
+            store.append(step, values)
+
+
+class Reservoir(RetentionPolicy):
+    """
+    Keep a uniform random sample of at most ``size`` steps (reservoir sampling).
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of retained steps.
+    seed : int, optional
+        Seed for the random number generator.
+    """
+
+    def __init__(self, size: int, seed: int | None = None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._random = random.Random(seed)
+        self._seen = 0
+        self._rejected = None
+
+    def append(self, store: ColumnStore, step: int, values: dict):
+        if step == self._rejected:
+            return
+        if store.index(step) is not None:
+            store.append(step, values)
+            return
+
+        self._seen += 1
+        if len(store) < self.size:
+            store.append(step, values)
+            return
+
+        slot = self._random.randrange(self._seen)
+        if slot < self.size:
+            store.delete_rows(slot, slot + 1)
+            store.append(step, values)
+        else:
+            self._rejected = step
+
+
+class MultiResolution(RetentionPolicy):
+    """
+    Keep recent steps at full resolution and average older steps into buckets.
+
+    Rows are organized in ``levels`` tiers. New steps enter tier 0. Once a tier
+    holds ``recent + bucket`` rows, its oldest ``bucket`` rows are averaged into
+    one row of the next tier, so each tier is ``bucket`` times coarser than the
+    one before it. The last tier averages into itself. Memory is bounded by
+    ``levels * (recent + bucket)`` rows.
+
+    Averages are weighted by the number of raw steps each row summarizes and
+    ignore missing values. An averaged row is stored under the first step it
+    covers.
+
+    Parameters
+    ----------
+    recent : int
+        Number of rows each tier keeps before summarizing.
+    bucket : int, optional
+        Number of rows averaged into one row of the next tier.
+    levels : int, optional
+        Number of tiers.
+
+    Notes
+    -----
+    Steps are expected to arrive roughly in increasing order. A step older than
+    the full-resolution tier is dropped, since that range is already summarized.
+    """
+
+    def __init__(self, recent: int, bucket: int = 10, levels: int = 4):
+        if recent < 1 or bucket < 2 or levels < 1:
+            raise ValueError("recent must be >= 1, bucket >= 2 and levels >= 1")
+        self.recent = recent
+        self.bucket = bucket
+        self.levels = levels
+        self._counts = [0] * levels
+        self._weights = []
+
+    def append(self, store: ColumnStore, step: int, values: dict):
+        full_start = len(store) - self._counts[0]
+        row = store.index(step)
+        if row is not None:
+            if row >= full_start:
+                store.append(step, values)
+            return
+
+        if full_start and step < store.steps()[full_start - 1]:
+            return
+
+        store.append(step, values)
+        self._weights.insert(store.index(step), 1)
+        self._counts[0] += 1
+
+        for tier in range(self.levels):
+            if self._counts[tier] < self.recent + self.bucket:
+                break
+            self._collapse(store, tier)
+
+    def _collapse(self, store: ColumnStore, tier: int):
+        start = sum(self._counts[tier + 1 :])
+        stop = start + self.bucket
+        weights = self._weights[start:stop]
+
+        averaged = {}
+        for name in store.names:
+            column = store.column(name)
+            total = count = 0.0
+            for weight, value in zip(weights, column[start:stop].tolist()):
+                if value == value:
+                    total += weight * value
+                    count += weight
+            if count:
+                averaged[name] = total / count
+
+        first_step = int(store.steps()[start])
+        store.delete_rows(start + 1, stop)
+        store.write_row(start, first_step, averaged)
+        self._weights[start:stop] = [sum(weights)]
+
+        self._counts[tier] -= self.bucket
+        self._counts[min(tier + 1, self.levels - 1)] += 1
+
+
+class LTTB(RetentionPolicy):
+    """
+    Downsample with Largest-Triangle-Three-Buckets to keep the shape of a curve.
+
+    Steps are appended until ``2 * max_points`` rows are held, then the series is
+    reduced to at most ``max_points`` rows chosen by LTTB on ``metric``. Retained rows
+    keep their original values for every metric. The first and last steps are
+    always kept.
+
+    Parameters
+    ----------
+    max_points : int
+        Maximum number of rows kept after each reduction. At least 3.
+    metric : str, optional
+        Metric whose curve guides the selection. Defaults to the first logged metric.
+    """
+
+    def __init__(self, max_points: int, metric: str | None = None):
+        if max_points < 3:
+            raise ValueError("max_points must be at least 3")
+        self.max_points = max_points
+        self.metric = metric
+
+    def append(self, store: ColumnStore, step: int, values: dict):
+        store.append(step, values)
+        if len(store) < 2 * self.max_points:
+            return
+
+        metric = self.metric or store.names[0]
+        x = store.steps().tolist()
+        y = [0.0 if value != value else value for value in store.column(metric).tolist()]
+        store.keep_rows(lttb(x, y, self.max_points))
+
+
+def lttb(x: list, y: list, threshold: int) -> list[int]:
+    """
+    Select at most ``threshold`` indices of a series with Largest-Triangle-Three-Buckets.
+
+    Buckets span equal ranges of ``x`` rather than equal numbers of points, so a
+    series with uneven spacing (such as one that was already downsampled) is
+    reduced evenly across its whole range. For evenly spaced ``x`` this is the
+    classic algorithm.
+
+    Parameters
+    ----------
+    x, y : list of float
+        Coordinates of the series, with ``x`` sorted in ascending order.
+    threshold : int
+        Maximum number of points to keep.
+
+    Returns
+    -------
+    list of int
+        Sorted indices of the selected points, always including the first and last.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    first, last = 1, n - 1
+    width = (x[last] - x[0]) / (threshold - 2)
+    bounds = [first]
+    bounds += [
+        bisect.bisect_left(x, x[0] + k * width, first, last) for k in range(1, threshold - 2)
+    ]
+    bounds.append(last)
+    buckets = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+    selected = [0]
+    a = 0
+    for i, (start, stop) in enumerate(buckets):
+        if i + 1 < len(buckets):
+            next_start, next_stop = buckets[i + 1]
+            span = next_stop - next_start
+            avg_x = sum(x[next_start:next_stop]) / span
+            avg_y = sum(y[next_start:next_stop]) / span
+        else:
+            avg_x, avg_y = x[last], y[last]
+
+        ax, ay = x[a], y[a]
+        best, best_area = start, -1.0
+        for j in range(start, stop):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+
+    selected.append(last)
+    return selected
@@ -1,7 +1,23 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic import Field, validate_call
 from tqdm import tqdm
 from tqdm.notebook import tqdm as nbtqdm
 
+from . import interop, query
+from .collector import MetricCollector
+from .columnfile import read_columns, write_columns
+from .columns import ColumnStore
+from .instrumentation import Instrumentation
+from .liveplot import LivePlot
+from .logfile import LogReader, LogWriter
+from .progress import ProgressRenderer
+from .retention import RetentionPolicy
+from .shards import batches, concat_rows, merge_rows, open_shard
+from .stats import MetricStats
+from .views import HistoryView, MetricView
+
 
 class RunLogger:
     """
@@ -10,7 +26,21 @@ class RunLogger:
     This class provides:
 
     - Metric logging for arbitrary named metrics.
+    - Columnar storage: one contiguous float buffer per metric plus a shared step column,
+      with ``NaN`` marking missing values.
     - Dynamic attribute access, e.g., `logger.loss` → list of all logged loss values.
+    - Cached per-metric views with step-range slicing, e.g., `logger["loss"][100:200]`.
+    - Zero-copy metric reads through `column`.
+    - Vectorized step-range selection and rolling statistics (see `select`, `rolling`).
+    - Optional persistence to an append-only log file that survives crashes (see `open`).
+    - A compact binary column format that loads through memory mapping (see `save`, `load`).
+    - Export to and import from pandas, Arrow and Parquet without per-value conversion.
+    - Streaming merge and concatenation of loggers, dicts and files (see `merge`, `concat`).
+    - Optional retention policies that bound memory on very long runs.
+    - Running statistics per metric (mean, variance, min/max, EMA, quantiles) via `stats`.
+    - Aggregation of metrics from many threads or processes via `collector`.
+    - Optional throughput and memory instrumentation stored as ordinary metrics.
+    - Live metric plots with constant redraw cost via `live_plot`.
     - Optional tqdm progress bar display, with support for both console and Jupyter Notebook environments.
 
     Example usage
@@ -30,7 +60,7 @@ class RunLogger:
     ```
     """
 
-    @validate_call
+    @validate_call(config={"arbitrary_types_allowed": True})
     def __init__(
         self,
         max_steps: int = Field(..., ge=1),
@@ -38,6 +68,15 @@ class RunLogger:
         update_interval: int = Field(1, ge=1),
         notebook: bool = Field(False),
         tqdm_kwargs: dict = Field({}),
+        backend: Literal["auto", "numpy", "array"] = Field("auto"),
+        path: Path | None = Field(None),
+        flush_every: int = Field(64, ge=1),
+        fsync_interval: float | None = Field(1.0, ge=0),
+        retention: RetentionPolicy | None = Field(None),
+        track_stats: bool = Field(True),
+        ema_alpha: float = Field(0.1, gt=0, le=1),
+        refresh_rate: float | None = Field(None, gt=0),
+        instrument: bool | Instrumentation = Field(False),
     ):
         """
         Parameters
@@ -52,13 +91,65 @@ class RunLogger:
             Whether to use `tqdm.notebook.tqdm` or `tqdm.tqdm`.
         tqdm_kwargs : dict
             Key word arguments for `tqdm.tqdm`
+        backend : {"auto", "numpy", "array"}, optional
+            Buffer implementation for metric storage. ``"auto"`` uses NumPy when it is
+            installed and the standard library `array` module otherwise.
+        path : Path, optional
+            If given, every call to `log_metrics` is also appended to this log file.
+            The file must not already contain a log; use `RunLogger.open` to resume one.
+        flush_every : int, optional
+            Number of logged steps buffered in memory before they are written to ``path``.
+        fsync_interval : float or None, optional
+            Seconds between fsyncs of ``path``. Buffered steps are also written once
+            this much time has passed, which bounds how many seconds of logged steps
+            a crash can lose. ``0`` syncs every step, None only syncs when the logger
+            is closed.
+        retention : RetentionPolicy, optional
+            Policy deciding which steps are kept in memory, e.g. `EveryNth`, `Reservoir`,
+            `MultiResolution` or `LTTB` from `iragca.ml.retention`. `steps`, `get_logs`
+            and the metric properties return the retained series. A log file given by
+            ``path`` still receives every step. By default every step is kept.
+        track_stats : bool, optional
+            If True, running statistics are updated for every logged value and are
+            available through `stats`.
+        ema_alpha : float, optional
+            Smoothing factor of the exponential moving average in `stats`.
+        refresh_rate : float, optional
+            Maximum progress bar refreshes per second. When set, the bar is updated and
+            redrawn from a background thread and `log_metrics` only records the values,
+            which keeps rendering off the training thread in very fast loops.
+            ``update_interval`` is ignored in this mode.
+        instrument : bool or Instrumentation, optional
+            Record ``time_per_step``, ``steps_per_sec`` and ``log_time`` with every
+            `log_metrics` call, as ordinary metrics. Pass an `Instrumentation` to
+            change the averaging window or to also sample ``rss_mb`` and
+            ``gc_collections``.
         """
-        self.history = {}
+        self._store = ColumnStore(backend=backend)
+        self._views = {}
+        self._properties = set()
+        if instrument is True:
+            instrument = Instrumentation()
+        self._instrumentation = instrument or None
+        self._plot = None
+        self._retention = retention
+        self._track_stats = track_stats
+        self._ema_alpha = ema_alpha
+        self._stats = {}
+        self._flush_every = flush_every
+        self._fsync_interval = fsync_interval
+        self._writer = (
+            LogWriter(path, max_steps, flush_every=flush_every, fsync_interval=fsync_interval)
+            if path is not None
+            else None
+        )
         self._display_progress = display_progress
         self._max_steps = max_steps
         self.tqdm_kwargs = tqdm_kwargs
         self._notebook = notebook
 
+        self._renderer = None
+
         if self._display_progress:
             self._update_interval = update_interval
             self.pbar = (
@@ -66,6 +157,8 @@ class RunLogger:
                 if notebook
                 else tqdm(total=max_steps, **self.tqdm_kwargs)
             )
+            if refresh_rate is not None:
+                self._renderer = ProgressRenderer(self.pbar, refresh_rate, max_steps)
 
     def log_metrics(self, log_data: dict, step: int):
         """
@@ -82,23 +175,34 @@ class RunLogger:
         -----
         - If metrics already exist for a step, new values will update or
           extend the existing dictionary.
-        - New metric names automatically become accessible as properties,
-          e.g., ``logger.accuracy`` returns a list of accuracy values.
+        - New metric names automatically become accessible as attributes,
+          e.g., ``logger.accuracy`` returns a list of accuracy values, and
+          through `metric`, e.g., ``logger["accuracy"]``.
+        - With ``instrument`` enabled, throughput and resource metrics are
+          added to ``log_data`` (see `Instrumentation`).
         """
-        if step not in self.history:
-            self.history[step] = {}
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            self._log_metrics(log_data, step)
+        else:
+            self._log_metrics({**log_data, **instrumentation.start()}, step)
+            instrumentation.stop()
 
-        # update metrics for this step
-        for key, value in log_data.items():
-            self.history[step][key] = value
+        if self._plot is not None:
+            self._plot.update()
 
-            # Create metric property lazily if not present
-            if not hasattr(self, key):
-                self.add_metric_property(key)
+    def _log_metrics(self, log_data: dict, step: int):
+        self._append(step, log_data)
+        if self._writer is not None:
+            self._writer.write(step, log_data)
 
         if not self._display_progress:
             return
 
+        if self._renderer is not None:
+            self._renderer.record(1, log_data)
+            return
+
         # update progress bar
         self.pbar.update(1)
         if step % self._update_interval == 0:
@@ -108,28 +212,260 @@ class RunLogger:
             self.pbar.close()
             self._display_progress = False
 
+    def log_metrics_many(self, steps, metrics: dict):
+        """
+        Log whole columns of metrics in one operation.
+
+        Parameters
+        ----------
+        steps : sequence of int
+            Steps of the rows to log, e.g. a list or a NumPy array.
+        metrics : dict
+            Mapping of metric names to sequences of the same length as ``steps``.
+            ``None`` and ``NaN`` mark missing values, which leave values already
+            logged at the same step untouched.
+
+        Raises
+        ------
+        ValueError
+            If a column does not have the same length as ``steps``.
+
+        Notes
+        -----
+        When ``steps`` are increasing and come after `last_step`, every column is
+        copied into storage with a single slice assignment and statistics are
+        updated in vectorized form. The progress bar advances once per call.
+
+        Examples
+        --------
+        >>> logger = RunLogger(max_steps=3)
+        >>> logger.log_metrics_many([0, 1, 2], {"loss": [1.0, 0.5, 0.2]})
+        >>> logger.loss
+        [1.0, 0.5, 0.2]
+        """
+        for key, values in metrics.items():
+            if len(values) != len(steps):
+                raise ValueError(
+                    f"Column {key!r} has {len(values)} values but there are {len(steps)} steps."
+                )
+
+        trackers = {}
+        if self._track_stats and len(steps):
+            # Started before storing, so a backfill does not count the batch twice
+            trackers = {key: self._tracked_stats(key) for key in metrics}
+
+        if self._retention is not None or self._writer is not None:
+            # Row-wise policies and the log file need one record per step
+            columns = {key: list(values) for key, values in metrics.items()}
+            for row, step in enumerate(int(step) for step in steps):
+                values = {}
+                for key, column in columns.items():
+                    value = column[row]
+                    if value is not None and value == value:
+                        values[key] = value
+                self._append(step, values, track_stats=False)
+                if self._writer is not None:
+                    self._writer.write(step, values)
+        else:
+            self._store.extend(steps, metrics)
+
+        for key, metric_stats in trackers.items():
+            metric_stats.update_many(metrics[key], steps)
+
+        if not self._display_progress or not len(steps):
+            return
+
+        postfix = {key: values[-1] for key, values in metrics.items()}
+        if self._renderer is not None:
+            self._renderer.record(len(steps), postfix)
+            return
+
+        self.pbar.update(len(steps))
+        self.pbar.set_postfix(postfix, refresh=True)
+        if self.pbar.n >= self._max_steps:
+            self.pbar.close()
+            self._display_progress = False
+
+    def collector(self, **kwargs) -> MetricCollector:
+        """
+        Create a `MetricCollector` that aggregates metrics from many workers into this logger.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments of `MetricCollector`, e.g. ``reduce="mean"`` or ``mode="process"``.
+
+        Returns
+        -------
+        MetricCollector
+            Collector writing to this logger. Hand ``collector.producer()`` to each worker.
+        """
+        return MetricCollector(self, **kwargs)
+
+    def live_plot(self, metrics: list[str] | None = None, fps: float = 10.0, **kwargs) -> LivePlot:
+        """
+        Attach a live plot that is refreshed as metrics are logged.
+
+        The plot is refreshed at most ``fps`` times per second, after calls to
+        `log_metrics`. Only the newly logged rows are read and drawn, so the cost
+        of a refresh does not grow with the length of the run. Call
+        `LivePlot.update` yourself after `log_metrics_many`. Requires matplotlib.
+
+        Parameters
+        ----------
+        metrics : list of str, optional
+            Metrics to plot. Defaults to every metric.
+        fps : float, optional
+            Maximum number of refreshes per second.
+        **kwargs
+            Other `LivePlot` arguments, e.g. ``ax`` or ``figsize``.
+
+        Returns
+        -------
+        LivePlot
+            The attached plot. It replaces any plot attached before; call
+            `LivePlot.close` to detach it.
+
+        Examples
+        --------
+        >>> logger = RunLogger(max_steps=10_000)
+        >>> plot = logger.live_plot(["loss", "val_loss"], fps=5)
+        """
+        self._plot = LivePlot(self, metrics, fps=fps, **kwargs)
+        self._plot.update(force=True)
+        return self._plot
+
+    def _append(self, step: int, values: dict, track_stats: bool = True):
+        if track_stats and self._track_stats:
+            # Before storing, so a backfill does not count the new values twice
+            for key, value in values.items():
+                self._tracked_stats(key).update(value, step)
+
+        if self._retention is None:
+            self._store.append(step, values)
+        else:
+            self._retention.append(self._store, step, values)
+
+    def _tracked_stats(self, name: str) -> MetricStats:
+        """
+        Return the running statistics of a metric, starting them from the stored column.
+
+        Metrics stored before statistics were tracked, such as those of a logger
+        opened with `load`, are backfilled before the first incremental update.
+        """
+        metric_stats = self._stats.get(name)
+        if metric_stats is None:
+            metric_stats = self._stats[name] = self._backfill(name)
+        return metric_stats
+
+    def _backfill(self, name: str) -> MetricStats:
+        metric_stats = MetricStats(self._ema_alpha)
+        if name in self._store and len(self._store):
+            metric_stats.update_many(self._store.column(name), self._store.steps())
+        return metric_stats
+
+    def stats(self, name: str) -> MetricStats:
+        """
+        Return running statistics for a metric.
+
+        Statistics are updated in O(1) as values are logged, so they are cheap
+        enough to check on every step, e.g. for early stopping. They cover every
+        logged value, including steps dropped by a retention policy. For logs
+        opened with `load`, they are computed from the stored column on first use.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+
+        Returns
+        -------
+        MetricStats
+            Count, mean, variance, min/max with their steps, EMA and approximate
+            quantiles of the metric.
+
+        Raises
+        ------
+        KeyError
+            If the metric has never been logged.
+
+        Examples
+        --------
+        >>> logger.stats("val_loss").min_step
+        42
+        >>> logger.stats("val_loss").quantile(0.9)
+        0.83
+        """
+        metric_stats = self._stats.get(name)
+        if metric_stats is None:
+            if name not in self._store:
+                raise KeyError(name)
+            metric_stats = self._backfill(name)
+            if self._track_stats:
+                self._stats[name] = metric_stats
+        return metric_stats
+
+    def metric(self, name: str) -> MetricView:
+        """
+        Return a cached read-only view of a metric.
+
+        The same view object is returned on every call. Its values are converted
+        once and reused until new data is logged, so reading a metric on every step
+        does not rebuild the history each time.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+
+        Returns
+        -------
+        MetricView
+            View indexed by step; slice it to select a step range,
+            e.g. ``logger.metric("loss")[100:200]``.
+
+        Raises
+        ------
+        KeyError
+            If the metric has never been logged.
+        """
+        view = self._views.get(name)
+        if view is None:
+            if name not in self._store:
+                raise KeyError(name)
+            view = self._views[name] = MetricView(self._store, name)
+        return view
+
+    def __getitem__(self, name: str) -> MetricView:
+        """
+        Shorthand for `metric`: ``logger["loss"]``.
+        """
+        return self.metric(name)
+
     def add_metric_property(self, metric_name: str):
         """
-        Dynamically create a read-only property for accessing metric history.
+        Register ``metric_name`` as an attribute of this logger.
+
+        Logged metrics are already available as attributes; registering a name makes
+        it resolve before any value is logged, to a list of ``None`` per step.
 
         Parameters
         ----------
         metric_name : str
-            Name of the metric to expose as a property.
+            Name of the metric to expose as an attribute.
+
+        Raises
+        ------
+        AttributeError
+            If the logger already has an attribute with that name.
 
         Notes
         -----
-        After logging ``loss``, you can access it via ``logger.loss``.
+        Only this instance is affected; the `RunLogger` class is never modified.
         """
         if hasattr(self, metric_name):
             raise AttributeError(f"Attribute {metric_name!r} already exists.")
-
-        def getter(self):
-            if not self.history:
-                return []
-            return [self.history[step].get(metric_name) for step in sorted(self.history.keys())]
-
-        setattr(self.__class__, metric_name, property(getter))
+        self._properties.add(metric_name)
 
     def get_logs(self) -> dict:
         """
@@ -154,27 +490,175 @@ class RunLogger:
                     "metrics": {}
                 }
         """
-        if not self.history:
+        if not len(self._store):
             return {"step": [], "metrics": {}}
 
-        steps = sorted(self.history.keys())
-        first_step = steps[0]
-
         return {
-            "step": steps,
-            **{
-                key: [self.history[step].get(key) for step in steps]
-                for key in self.history[first_step].keys()
-            },
+            "step": self.steps,
+            **{key: self._store.to_list(key) for key in self._store.names},
         }
 
+    def column(self, name: str):
+        """
+        Return the stored values of a metric without converting them to Python objects.
+
+        Parameters
+        ----------
+        name : str
+            Metric name, or ``"step"`` for the step column.
+
+        Returns
+        -------
+        memoryview or numpy.ndarray
+            Values in ascending step order, with ``NaN`` for steps where the metric was
+            not logged. When steps were logged in increasing order this is a zero-copy
+            view of the underlying buffer; copy it if you need a stable snapshot.
+
+        Raises
+        ------
+        KeyError
+            If the metric has never been logged.
+        """
+        if name == "step":
+            return self._store.steps()
+        return self._store.column(name)
+
+    def select(
+        self,
+        start: int | None = None,
+        stop: int | None = None,
+        metrics: list[str] | None = None,
+    ) -> dict:
+        """
+        Return the steps ``start <= step < stop`` as NumPy arrays.
+
+        The range is located by binary search on the step column and the arrays
+        are views of the stored columns, so selecting from a large run costs the
+        same as selecting from a small one. Requires numpy.
+
+        Parameters
+        ----------
+        start, stop : int, optional
+            Step range; ``stop`` is exclusive. Defaults to every step.
+        metrics : list of str, optional
+            Metrics to return. Defaults to all of them.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            ``"step"`` and one array per metric, with ``NaN`` for missing values.
+            Copy them if you keep them while logging continues.
+
+        Raises
+        ------
+        KeyError
+            If one of ``metrics`` has never been logged.
+
+        Examples
+        --------
+        >>> window = logger.select(10_000, 20_000, metrics=["loss"])
+        >>> window["loss"].mean()
+        """
+        return query.select(self._store, start, stop, metrics)
+
+    def rolling(
+        self,
+        name: str,
+        window: int | None = None,
+        how: Literal["mean", "std", "min", "max"] = "mean",
+        span: float | None = None,
+        on: str = "step",
+        min_periods: int = 1,
+        start: int | None = None,
+        stop: int | None = None,
+    ):
+        """
+        Compute a trailing rolling statistic of a metric over the stored columns.
+
+        Windows are either the last ``window`` logged steps or every step whose
+        ``on`` value lies within ``span`` of the current one, e.g. the last 500 steps
+        with ``span=500`` or the last 60 seconds with ``span=60, on="elapsed"``.
+        The ``elapsed`` column is recorded by ``instrument=True`` (see
+        `Instrumentation`); otherwise log your own timestamps as a metric.
+        Missing values are ignored. Requires numpy.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+        window : int, optional
+            Number of logged steps in each window.
+        how : {"mean", "std", "min", "max"}, optional
+            Statistic to compute. ``"std"`` is the population standard deviation.
+        span : float, optional
+            Width of each window, in units of ``on``. Exactly one of ``window``
+            and ``span`` must be given.
+        on : str, optional
+            Column the span is measured on: ``"step"`` or a metric that never
+            decreases and is logged at every step, such as ``elapsed``.
+        min_periods : int, optional
+            Windows with fewer values give ``NaN``.
+        start, stop : int, optional
+            Only return the steps ``start <= step < stop``. Windows at the start of
+            the range still include the earlier steps.
+
+        Returns
+        -------
+        numpy.ndarray
+            One value per step in the range, aligned with ``select(start, stop)["step"]``.
+
+        Raises
+        ------
+        KeyError
+            If ``name`` or ``on`` has never been logged.
+        ValueError
+            If the window is invalid or the ``on`` column decreases.
+
+        Examples
+        --------
+        >>> smoothed = logger.rolling("loss", window=100)
+        >>> worst_recent = logger.rolling("loss", how="max", span=1_000, start=9_000)
+        """
+        values = self.column(name)
+        first, last = query.row_range(self._store, start, stop)
+        keys = self.column(on) if span is not None else None
+
+        context = query.window_start(keys, first, window, span)
+        result = query.rolling(
+            values[context:last],
+            how=how,
+            window=window,
+            span=span,
+            keys=keys[context:last] if keys is not None else None,
+            min_periods=min_periods,
+        )
+        return result[first - context :]
+
+    @property
+    def history(self) -> HistoryView:
+        """
+        HistoryView
+            Read-only mapping of logged metrics by step, e.g. ``{0: {"loss": 1.0}, ...}``.
+            Rows are read from the column store on lookup; missing values are omitted.
+            Use ``dict(logger.history)`` for a copy.
+        """
+        return HistoryView(self._store)
+
+    @property
+    def last_step(self) -> int | None:
+        """
+        int or None
+            Largest recorded step, or None if nothing has been logged.
+        """
+        return self._store.last_step
+
     @property
     def steps(self) -> list[int]:
         """
         List[int]
             Sorted list of recorded step indices.
         """
-        return sorted(self.history.keys())
+        return self._store.steps().tolist()
 
     def __getattr__(self, name):
         """
@@ -195,21 +679,151 @@ class RunLogger:
         AttributeError
             If the metric does not exist.
         """
-        if self.history:
-            steps = sorted(self.history.keys())
-            if name in self.history[steps[0]]:
-                return [self.history[s].get(name) for s in steps]
+        if not name.startswith("_"):
+            if name in self._store:
+                return list(self.metric(name).values)
+            if name in self._properties:
+                return [None] * len(self._store)
 
         raise AttributeError(f"{name!r} not found in RunLogger.")
 
     def __repr__(self) -> str:
-        if not self.history:
+        if not len(self._store):
             return "<RunLogger: empty>"
 
-        steps = sorted(self.history.keys())
-        first_step = steps[0]
-        metrics = list(self.history[first_step].keys())
-        return f"<RunLogger: steps={len(steps)}, metrics={metrics}>"
+        return f"<RunLogger: steps={len(self._store)}, metrics={self._store.names}>"
+
+    def flush(self):
+        """
+        Write buffered log records to the log file, if the logger has one.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """
+        Flush, fsync and close the log file, if the logger has one, and stop
+        background progress rendering.
+
+        The in-memory history stays available after closing.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._renderer is not None:
+            self._renderer.stop()
+            self._renderer = None
+            self._display_progress = False
+
+    def __enter__(self) -> "RunLogger":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @classmethod
+    def open(cls, path: str | Path, **kwargs) -> "RunLogger":
+        """
+        Rebuild a RunLogger from a log file and keep appending to it.
+
+        Parameters
+        ----------
+        path : str or Path
+            Log file written by a logger created with ``path=...``.
+        **kwargs
+            Other `RunLogger` arguments, e.g. ``display_progress``. ``max_steps``
+            defaults to the value stored in the file.
+
+        Returns
+        -------
+        RunLogger
+            Logger holding every complete record in the file. A torn last record,
+            left behind by a crash during a write, is skipped and truncated so
+            logging continues cleanly from `last_step`.
+
+        Raises
+        ------
+        ValueError
+            If ``path`` is not a RunLogger log file.
+
+        Examples
+        --------
+        >>> logger = RunLogger.open("run.irglog")
+        >>> for step in range(logger.last_step + 1, 1000):
+        ...     logger.log_metrics({"loss": 0.1}, step=step)
+        """
+        reader = LogReader(path)
+        kwargs.setdefault("max_steps", reader.max_steps)
+        logger = cls(**kwargs)
+
+        # Replay in column batches; the progress bar is advanced once below
+        display, logger._display_progress = logger._display_progress, False
+        try:
+            for steps, columns in batches(reader):
+                logger.log_metrics_many(steps, columns)
+        finally:
+            logger._display_progress = display
+
+        logger._writer = LogWriter(
+            path,
+            reader.max_steps,
+            names=reader.names,
+            end=reader.end,
+            flush_every=logger._flush_every,
+            fsync_interval=logger._fsync_interval,
+        )
+        if logger._renderer is not None:
+            logger._renderer.record(len(logger._store), None)
+        elif logger._display_progress:
+            logger.pbar.update(len(logger._store))
+        return logger
+
+    def save(self, path: str | Path, dtype: Literal["float64", "float32"] = "float64"):
+        """
+        Save the logs to the binary column format.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file. Overwritten if it exists.
+        dtype : {"float64", "float32"}, optional
+            Precision of the stored metric columns. ``"float32"`` halves the file size.
+        """
+        write_columns(path, self._store, self._max_steps, dtype=dtype)
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs) -> "RunLogger":
+        """
+        Load logs saved with `save` by memory-mapping the file.
+
+        Nothing is copied on load: `column` returns read-only NumPy arrays or
+        memoryviews backed by the mapping, so opening a large log is fast and only
+        the pages that are actually read become resident. The columns are copied
+        into writable buffers the first time new metrics are logged.
+
+        Parameters
+        ----------
+        path : str or Path
+            File written by `save`.
+        **kwargs
+            Other `RunLogger` arguments, e.g. ``backend``. ``max_steps`` defaults to
+            the value stored in the file.
+
+        Returns
+        -------
+        RunLogger
+            Logger backed by the mapped file.
+
+        Raises
+        ------
+        ValueError
+            If ``path`` is not a column file.
+        """
+        store, max_steps = read_columns(path, backend=kwargs.get("backend", "auto"))
+        kwargs.setdefault("max_steps", max_steps)
+        logger = cls(**kwargs)
+        logger._store = store
+        return logger
 
     @classmethod
     def from_dict(cls, logs: dict) -> "RunLogger":
@@ -237,14 +851,200 @@ class RunLogger:
         -----
         This is the inverse of the `get_logs` method.
         'step' key is required in the input dictionary.
+        Columns are ingested in one batch with `log_metrics_many`.
+        """
+        steps = logs.get("step", [])
+        logger = cls(max_steps=len(steps))
+        logger.log_metrics_many(steps, {key: logs[key] for key in logs if key != "step"})
+        return logger
+
+    @classmethod
+    def merge(
+        cls,
+        shards: list,
+        on_conflict: Literal["last", "mean", "error"] = "last",
+        **kwargs,
+    ) -> "RunLogger":
         """
-        max_steps = len(logs.get("step", []))
-        logger = cls(max_steps=max_steps)
+        Merge shards covering overlapping step ranges into one logger.
+
+        Shards are streamed through a k-way merge on step, so nothing is sorted
+        after the fact and files are read lazily: column files are memory-mapped
+        and log files are read record by record. The merged rows are ingested in
+        batches with `log_metrics_many`.
 
-        for i, step in enumerate(logs.get("step", [])):
-            log_data = {key: logs[key][i] for key in logs.keys() if key != "step"}
-            logger.log_metrics(log_data, step)
+        Parameters
+        ----------
+        shards : list
+            `RunLogger` instances, dictionaries in the `get_logs` format, or paths
+            to files written by `save` or by a logger created with ``path=...``.
+        on_conflict : {"last", "mean", "error"}, optional
+            How values logged for the same metric and step by several shards are
+            combined: the value from the last shard in ``shards`` wins, the values
+            are averaged, or a ValueError is raised if they differ.
+        **kwargs
+            Other `RunLogger` arguments. ``max_steps`` defaults to the largest
+            ``max_steps`` of the shards.
 
+        Returns
+        -------
+        RunLogger
+            Logger holding every step of every shard.
+
+        Raises
+        ------
+        ValueError
+            With ``on_conflict="error"`` if shards disagree, if a path is not a
+            RunLogger file, or if a log file was written out of step order.
+
+        Examples
+        --------
+        >>> logger = RunLogger.merge(["node0.irglog", "node1.irglog"], on_conflict="mean")
+        """
+        rows, max_steps = cls._open_shards(shards)
+        return cls._from_rows(merge_rows(rows, on_conflict), max(max_steps, default=1), **kwargs)
+
+    @classmethod
+    def concat(cls, shards: list, renumber: bool = False, **kwargs) -> "RunLogger":
+        """
+        Chain shards that cover consecutive step ranges, e.g. the logs of a resumed run.
+
+        Parameters
+        ----------
+        shards : list
+            As in `merge`, in step order.
+        renumber : bool, optional
+            Shift the steps of each shard so it continues right after the previous
+            one, for shards that each restart counting from zero.
+        **kwargs
+            As in `merge`.
+
+        Raises
+        ------
+        ValueError
+            If, without ``renumber``, a shard starts at or before the last step of
+            the previous shard. Use `merge` for overlapping shards.
+
+        Notes
+        -----
+        ``max_steps`` defaults to the sum of the shards' ``max_steps`` with
+        ``renumber`` and to the largest one otherwise.
+        """
+        rows, max_steps = cls._open_shards(shards)
+        max_steps = sum(max_steps) if renumber else max(max_steps, default=1)
+        return cls._from_rows(concat_rows(rows, renumber), max_steps, **kwargs)
+
+    @classmethod
+    def _open_shards(cls, shards: list) -> tuple[list, list[int]]:
+        rows, max_steps = [], []
+        for shard in shards:
+            if isinstance(shard, RunLogger):
+                shard_rows, shard_max_steps = shard._store.rows(), shard._max_steps
+            else:
+                shard_rows, shard_max_steps = open_shard(shard)
+            rows.append(shard_rows)
+            max_steps.append(shard_max_steps)
+        return rows, max_steps
+
+    @classmethod
+    def _from_rows(cls, rows, max_steps: int, **kwargs) -> "RunLogger":
+        kwargs.setdefault("max_steps", max(max_steps, 1))
+        logger = cls(**kwargs)
+        for steps, columns in batches(rows):
+            logger.log_metrics_many(steps, columns)
+        return logger
+
+    def to_pandas(self, copy: bool = False):
+        """
+        Export the logs as a `pandas.DataFrame` with a ``step`` column.
+
+        Columns are handed to pandas as NumPy arrays over the logger's buffers,
+        without building Python lists. Requires pandas.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            Copy the columns. By default the frame shares memory with the logger,
+            so values logged later for existing steps show up in the frame; pass
+            ``copy=True`` to keep a snapshot while logging continues.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per step, with ``NaN`` where a metric was not logged.
+        """
+        return interop.to_pandas(self._store, copy=copy)
+
+    def to_arrow(self):
+        """
+        Export the logs as a `pyarrow.Table` with a ``step`` column.
+
+        Missing values become Arrow nulls. Requires pyarrow.
+        """
+        return interop.to_arrow(self._store)
+
+    def to_parquet(self, path: str | Path, **kwargs):
+        """
+        Write the logs to a Parquet file. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file.
+        **kwargs
+            Passed to `pyarrow.parquet.write_table`, e.g. ``compression="zstd"``.
+        """
+        interop.to_parquet(self._store, path, **kwargs)
+
+    @classmethod
+    def from_pandas(cls, frame, **kwargs) -> "RunLogger":
+        """
+        Create a RunLogger from a `pandas.DataFrame`, e.g. one made by `to_pandas`.
+
+        Steps are taken from the ``step`` column, or from the index if there is none.
+        Columns are ingested in one batch with `log_metrics_many`.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            Frame with one column per metric.
+        **kwargs
+            Other `RunLogger` arguments. ``max_steps`` defaults to the number of rows.
+        """
+        return cls._from_columns(*interop.from_pandas(frame), **kwargs)
+
+    @classmethod
+    def from_arrow(cls, table, **kwargs) -> "RunLogger":
+        """
+        Create a RunLogger from a `pyarrow.Table` with a ``step`` column.
+
+        Nulls are stored as missing values. ``kwargs`` are as in `from_pandas`.
+        """
+        return cls._from_columns(*interop.from_arrow(table), **kwargs)
+
+    @classmethod
+    def from_parquet(
+        cls, path: str | Path, columns: list[str] | None = None, **kwargs
+    ) -> "RunLogger":
+        """
+        Create a RunLogger from a Parquet file written by `to_parquet`.
+
+        Parameters
+        ----------
+        path : str or Path
+            File to read.
+        columns : list of str, optional
+            Metrics to read; all of them by default.
+        **kwargs
+            As in `from_pandas`.
+        """
+        return cls._from_columns(*interop.from_parquet(path, columns=columns), **kwargs)
+
+    @classmethod
+    def _from_columns(cls, steps, columns: dict, **kwargs) -> "RunLogger":
+        kwargs.setdefault("max_steps", len(steps))
+        logger = cls(**kwargs)
+        logger.log_metrics_many(steps, columns)
         return logger
 
     @property
@@ -253,7 +1053,4 @@ class RunLogger:
         List[str]
             List of all logged metric names.
         """
-        if not self.history:
-            return []
-        first_step = sorted(self.history.keys())[0]
-        return list(self.history[first_step].keys())
+        return self._store.names
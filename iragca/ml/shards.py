@@ -0,0 +1,223 @@
+import heapq
+import math
+from operator import itemgetter
+from pathlib import Path
+
+from . import columnfile, logfile
+from .columnfile import read_columns
+from .columns import ColumnStore, _is_increasing
+from .logfile import LogReader
+
+CONFLICT_POLICIES = ("last", "mean", "error")
+
+
+def open_shard(source) -> tuple:
+    """
+    Return an iterator of ``(step, values)`` pairs in ascending step order for a shard.
+
+    Parameters
+    ----------
+    source : ColumnStore, dict or path
+        A column store, a dictionary in the `RunLogger.get_logs` format, or a file
+        written by `RunLogger.save` or by a logger created with ``path=...``. Files
+        are read lazily: column files are memory-mapped and log files are read
+        record by record.
+
+    Returns
+    -------
+    tuple of (iterator, int)
+        The rows and the ``max_steps`` recorded for the shard.
+
+    Raises
+    ------
+    ValueError
+        If a file is not a RunLogger file. Iterating a log file raises
+        ValueError if its steps were written out of order.
+    TypeError
+        If ``source`` is not a supported shard.
+    """
+    if isinstance(source, ColumnStore):
+        return source.rows(), len(source)
+    if isinstance(source, dict):
+        return _dict_rows(source), len(source.get("step", []))
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as file:
+            magic = file.read(8)
+        if magic == logfile.MAGIC:
+            reader = LogReader(source)
+            return _log_rows(reader), reader.max_steps
+        if magic == columnfile.MAGIC:
+            store, max_steps = read_columns(source)
+            return store.rows(), max_steps
+        raise ValueError(f"{str(source)!r} is not a RunLogger log or column file.")
+    raise TypeError(f"Cannot merge {type(source).__name__!r}; expected a RunLogger, dict or path.")
+
+
+def merge_rows(sources, on_conflict: str = "last"):
+    """
+    Merge sorted row iterators into one sorted stream with a k-way heap merge.
+
+    Each input is consumed once, so merging ``n`` rows from ``k`` shards takes
+    ``O(n log k)`` time and memory proportional to ``k``. Values for the same
+    step and metric coming from several shards are combined with ``on_conflict``;
+    within one shard the last value wins.
+
+    Parameters
+    ----------
+    sources : iterable of iterators
+        Row iterators as returned by `open_shard`, in shard order.
+    on_conflict : {"last", "mean", "error"}, optional
+        ``"last"`` keeps the value of the last shard, ``"mean"`` averages the
+        shards and ``"error"`` raises if the shards disagree.
+
+    Yields
+    ------
+    tuple of (int, dict)
+        Steps in ascending order with their merged values.
+
+    Raises
+    ------
+    ValueError
+        If ``on_conflict`` is unknown, or with ``"error"`` when two shards log
+        different values for the same metric and step.
+    """
+    if on_conflict not in CONFLICT_POLICIES:
+        raise ValueError(
+            f"Unknown on_conflict {on_conflict!r}; expected one of {CONFLICT_POLICIES}."
+        )
+
+    tagged = [_tag(rows, shard) for shard, rows in enumerate(sources)]
+    current, group = None, []
+    for step, shard, values in heapq.merge(*tagged, key=itemgetter(0)):
+        if step != current:
+            if group:
+                yield current, _resolve(current, group, on_conflict)
+            current, group = step, []
+        group.append((shard, values))
+
+    if group:
+        yield current, _resolve(current, group, on_conflict)
+
+
+def concat_rows(sources, renumber: bool = False):
+    """
+    Chain row iterators whose step ranges follow each other.
+
+    Parameters
+    ----------
+    sources : iterable of iterators
+        Row iterators as returned by `open_shard`, in order.
+    renumber : bool, optional
+        Shift the steps of each shard so it starts right after the previous one.
+
+    Raises
+    ------
+    ValueError
+        If, without ``renumber``, a shard starts at or before the last step of
+        the previous one. Use `merge_rows` for overlapping shards.
+    """
+    last = None
+    for rows in sources:
+        offset = None
+        for step, values in rows:
+            if offset is None:
+                offset = 0
+                if last is not None:
+                    if renumber:
+                        offset = last + 1 - step
+                    elif step <= last:
+                        raise ValueError(
+                            f"Shard starts at step {step}, which is not after step {last}; "
+                            "use merge for overlapping shards."
+                        )
+            step += offset
+            last = step
+            yield step, values
+
+
+def batches(rows, size: int = 4096):
+    """
+    Group sorted rows into ``(steps, columns)`` batches for `RunLogger.log_metrics_many`.
+
+    Consecutive rows with the same step are combined, the later values winning.
+    """
+    steps, batch = [], []
+    for step, values in rows:
+        if steps and steps[-1] == step:
+            batch[-1] = {**batch[-1], **values}
+            continue
+        if len(steps) == size:
+            yield steps, _columns(batch)
+            steps, batch = [], []
+        steps.append(step)
+        batch.append(values)
+    if steps:
+        yield steps, _columns(batch)
+
+
+def _tag(rows, shard: int):
+    for step, values in rows:
+        yield step, shard, values
+
+
+def _resolve(step: int, group: list, on_conflict: str) -> dict:
+    if len(group) == 1:
+        return group[0][1]
+
+    reported = {}
+    for shard, values in group:
+        for name, value in values.items():
+            if value is not None and value == value:
+                reported.setdefault(name, {})[shard] = value
+
+    merged = {}
+    for name, by_shard in reported.items():
+        values = list(by_shard.values())
+        if len(values) == 1 or on_conflict == "last":
+            merged[name] = values[-1]
+        elif on_conflict == "mean":
+            merged[name] = math.fsum(values) / len(values)
+        elif len(set(values)) > 1:
+            raise ValueError(f"Conflicting values for {name!r} at step {step}: {values}.")
+        else:
+            merged[name] = values[0]
+    return merged
+
+
+def _columns(batch: list) -> dict:
+    columns = {}
+    for row, values in enumerate(batch):
+        for name, value in values.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * len(batch)
+            column[row] = value
+    return columns
+
+
+def _dict_rows(logs: dict):
+    steps = list(logs.get("step", []))
+    names = [name for name in logs if name != "step"]
+    order = range(len(steps))
+    if not _is_increasing(steps):
+        # Stable, so the last value logged for a repeated step still wins
+        order = sorted(order, key=steps.__getitem__)
+    for row in order:
+        values = {}
+        for name in names:
+            value = logs[name][row]
+            if value is not None and value == value:
+                values[name] = value
+        yield steps[row], values
+
+
+def _log_rows(reader: LogReader):
+    last = None
+    for step, values in reader:
+        if last is not None and step < last:
+            raise ValueError(
+                f"{str(reader.path)!r} has steps out of order ({step} after {last}); "
+                "load it with RunLogger.open and merge the logger instead."
+            )
+        last = step
+        yield step, values
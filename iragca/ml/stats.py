@@ -0,0 +1,310 @@
+import math
+import random
+
+from .columns import np
+
+
+class QuantileSketch:
+    """
+    Bounded-size sketch for approximate quantiles of a stream (KLL).
+
+    Values are kept in levels of compactors. Level ``i`` holds items that each
+    stand for ``2**i`` original values. When a level is full it is sorted and
+    every other item is promoted to the next level, so memory stays around
+    ``3 * k`` items however many values are added.
+
+    Parameters
+    ----------
+    k : int, optional
+        Capacity of the top level. Larger values are more accurate; the rank
+        error is roughly ``1.7 / k``.
+    seed : int, optional
+        Seed for the random compaction offsets.
+
+    Examples
+    --------
+    >>> sketch = QuantileSketch()
+    >>> for value in range(10_000):
+    ...     sketch.add(value)
+    >>> round(sketch.quantile(0.5), -2)
+    5000.0
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self._levels = [[]]
+        self._size = 0
+        self._update_capacities()
+        self._random = random.Random(seed)
+        self._sorted = None
+
+    def add(self, value: float):
+        """
+        Add one value to the sketch.
+        """
+        self._levels[0].append(value)
+        self._size += 1
+        self.count += 1
+        self._sorted = None
+        if self._size >= self._limit:
+            self._compress()
+
+    def quantile(self, q: float) -> float:
+        """
+        Return an approximation of the ``q``-quantile of the values added so far.
+
+        Parameters
+        ----------
+        q : float
+            Quantile between 0 and 1.
+
+        Raises
+        ------
+        ValueError
+            If ``q`` is outside ``[0, 1]`` or the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            raise ValueError("quantile of an empty sketch")
+
+        if self._sorted is None:
+            weighted = sorted(
+                (value, 1 << level) for level, items in enumerate(self._levels) for value in items
+            )
+            total = 0
+            cumulative = []
+            for value, weight in weighted:
+                total += weight
+                cumulative.append((total, value))
+            self._sorted = cumulative
+
+        target = q * self._sorted[-1][0]
+        for rank, value in self._sorted:
+            if rank >= target:
+                return value
+        return self._sorted[-1][1]
+
+    def add_many(self, values):
+        """
+        Add a sequence of values to the sketch.
+
+        The whole batch is placed in the bottom level and compacted in a few
+        large passes instead of one compaction per value.
+        """
+        values = list(values)
+        if not values:
+            return
+        self._levels[0].extend(values)
+        self._size += len(values)
+        self.count += len(values)
+        self._sorted = None
+        while self._size >= self._limit:
+            self._compress()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _update_capacities(self):
+        height = len(self._levels)
+        self._capacities = [
+            max(2, math.ceil(self.k * (2 / 3) ** (height - 1 - level))) for level in range(height)
+        ]
+        self._limit = sum(self._capacities)
+
+    def _compress(self):
+        for level, items in enumerate(self._levels):
+            if len(items) < self._capacities[level]:
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+                self._update_capacities()
+
+            items.sort()
+            # An odd item out stays at this level
+            leftover = [items.pop()] if len(items) % 2 else []
+            promoted = items[self._random.getrandbits(1) :: 2]
+            self._levels[level + 1].extend(promoted)
+            self._size -= len(items) - len(promoted)
+            items[:] = leftover
+            break
+
+
+class MetricStats:
+    """
+    Running statistics for one metric, updated in O(1) per value.
+
+    Tracks the count, mean and variance (Welford's algorithm), the minimum and
+    maximum together with the steps where they occurred, an exponential moving
+    average and a `QuantileSketch` for approximate quantiles. Missing values
+    (``None`` or ``NaN``) are ignored.
+
+    Parameters
+    ----------
+    ema_alpha : float, optional
+        Smoothing factor of the exponential moving average; higher values
+        follow recent values more closely.
+    sketch_size : int, optional
+        ``k`` of the quantile sketch.
+
+    Examples
+    --------
+    >>> stats = logger.stats("loss")
+    >>> if stats.last_step - stats.min_step > patience:
+    ...     break  # no improvement for `patience` steps
+    """
+
+    __slots__ = (
+        "ema_alpha",
+        "count",
+        "mean",
+        "_m2",
+        "min",
+        "min_step",
+        "max",
+        "max_step",
+        "ema",
+        "last",
+        "last_step",
+        "sketch",
+    )
+
+    def __init__(self, ema_alpha: float = 0.1, sketch_size: int = 200):
+        self.ema_alpha = ema_alpha
+        self.count = 0
+        self.mean = math.nan
+        self._m2 = 0.0
+        self.min = math.nan
+        self.min_step = None
+        self.max = math.nan
+        self.max_step = None
+        self.ema = math.nan
+        self.last = math.nan
+        self.last_step = None
+        self.sketch = QuantileSketch(sketch_size)
+
+    def update(self, value, step: int):
+        """
+        Add the value logged at ``step``.
+        """
+        if value is None:
+            return
+        value = float(value)
+        if value != value:
+            return
+
+        self.count += 1
+        if self.count == 1:
+            self.mean = self.min = self.max = self.ema = value
+            self.min_step = self.max_step = step
+        else:
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+            self.ema += self.ema_alpha * (value - self.ema)
+            if value < self.min:
+                self.min, self.min_step = value, step
+            if value > self.max:
+                self.max, self.max_step = value, step
+
+        self.last, self.last_step = value, step
+        self.sketch.add(value)
+
+    def update_many(self, values, steps):
+        """
+        Add a batch of values logged at ``steps``.
+
+        With NumPy installed the count, mean, variance (Chan et al.'s parallel
+        update), min/max and EMA are computed in vectorized form; otherwise the
+        values are added one by one.
+        """
+        if np is None:
+            for value, step in zip(values, steps):
+                self.update(value, step)
+            return
+
+        values = np.asarray(values, dtype="float64")
+        valid = ~np.isnan(values)
+        if not valid.all():
+            values = values[valid]
+            steps = np.asarray(steps)[valid]
+        if not len(values):
+            return
+
+        count = len(values)
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        low, high = int(values.argmin()), int(values.argmax())
+
+        if self.count:
+            total = self.count + count
+            delta = mean - self.mean
+            self._m2 += m2 + delta * delta * self.count * count / total
+            self.mean += delta * count / total
+            self.count = total
+            ema, rest = self.ema, values
+        else:
+            self.count, self.mean, self._m2 = count, mean, m2
+            self.min, self.max = math.inf, -math.inf
+            ema, rest = float(values[0]), values[1:]
+
+        decay = 1 - self.ema_alpha
+        weights = self.ema_alpha * decay ** np.arange(len(rest) - 1, -1, -1, dtype="float64")
+        self.ema = decay ** len(rest) * ema + float((weights * rest).sum())
+
+        if values[low] < self.min:
+            self.min, self.min_step = float(values[low]), int(steps[low])
+        if values[high] > self.max:
+            self.max, self.max_step = float(values[high]), int(steps[high])
+        self.last, self.last_step = float(values[-1]), int(steps[-1])
+        self.sketch.add_many(values.tolist())
+
+    @property
+    def variance(self) -> float:
+        """
+        float
+            Population variance of the values, ``NaN`` if there are none.
+        """
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """
+        float
+            Population standard deviation of the values.
+        """
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate ``q``-quantile of the values, from the bounded-size sketch.
+        """
+        return self.sketch.quantile(q)
+
+    def to_dict(self) -> dict:
+        """
+        Return the statistics as a plain dictionary.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "std": self.std,
+            "min": self.min,
+            "min_step": self.min_step,
+            "max": self.max,
+            "max_step": self.max_step,
+            "ema": self.ema,
+            "last": self.last,
+            "last_step": self.last_step,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricStats: count={self.count}, mean={self.mean:.6g}, std={self.std:.6g}, "
+            f"min={self.min:.6g}@{self.min_step}, max={self.max:.6g}@{self.max_step}, "
+            f"ema={self.ema:.6g}>"
+        )
@@ -0,0 +1,183 @@
+from collections.abc import ItemsView, Mapping
+from numbers import Integral
+
+from .columns import ColumnStore
+
+
+class MetricView:
+    """
+    Read-only view of one metric of a `RunLogger`, optionally limited to a step range.
+
+    Views are returned by `RunLogger.metric` (or ``logger[name]``) and cached by the
+    logger. The rows covered by the view and the converted values are computed on
+    first use and kept until new data is logged, so repeated reads between two
+    logged steps cost nothing.
+
+    Indexing is by step, not by position: ``view[10]`` is the value logged at step 10
+    and ``view[100:200]`` is a view of steps ``100 <= step < 200``.
+
+    Parameters
+    ----------
+    store : ColumnStore
+        Store holding the metric.
+    name : str
+        Metric name.
+    start, stop : int, optional
+        Step range of the view; ``stop`` is exclusive.
+
+    Examples
+    --------
+    >>> loss = logger["loss"]
+    >>> loss[90:100].values
+    [0.12, 0.11, 0.11, 0.1, 0.1, 0.09, 0.1, 0.09, 0.08, 0.08]
+    >>> loss[99]
+    0.08
+    """
+
+    __slots__ = ("name", "start", "stop", "_store", "_version", "_rows", "_values")
+
+    def __init__(
+        self, store: ColumnStore, name: str, start: int | None = None, stop: int | None = None
+    ):
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self._store = store
+        self._version = None
+        self._rows = None
+        self._values = None
+
+    @property
+    def steps(self) -> list[int]:
+        """
+        List[int]
+            Steps covered by the view, in ascending order.
+        """
+        first, last = self._bounds()
+        return self._store.steps()[first:last].tolist()
+
+    @property
+    def values(self) -> list:
+        """
+        List[float]
+            Values of the metric in ascending step order, with ``None`` for missing values.
+            The list is shared between calls until new data is logged; copy it before
+            modifying it.
+        """
+        first, last = self._bounds()
+        if self._values is None:
+            column = self._store.column(self.name)[first:last].tolist()
+            self._values = [None if value != value else value for value in column]
+        return self._values
+
+    def array(self):
+        """
+        Return the values of the view without converting them to Python objects.
+
+        Returns
+        -------
+        memoryview or numpy.ndarray
+            Zero-copy slice of the metric column, with ``NaN`` for missing values.
+        """
+        first, last = self._bounds()
+        return self._store.column(self.name)[first:last]
+
+    def __len__(self) -> int:
+        first, last = self._bounds()
+        return last - first
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step is not None:
+                raise ValueError("MetricView slices select a step range and take no stride.")
+            start, stop = key.start, key.stop
+            if self.start is not None:
+                start = self.start if start is None else max(start, self.start)
+            if self.stop is not None:
+                stop = self.stop if stop is None else min(stop, self.stop)
+            return MetricView(self._store, self.name, start, stop)
+
+        first, last = self._bounds()
+        row = self._store.locate(key)
+        if not first <= row < last or self._store.steps()[row] != key:
+            raise KeyError(key)
+        return self.values[row - first]
+
+    def __repr__(self) -> str:
+        bounds = ""
+        if self.start is not None or self.stop is not None:
+            start = "" if self.start is None else self.start
+            stop = "" if self.stop is None else self.stop
+            bounds = f"[{start}:{stop}]"
+        return f"<MetricView: {self.name}{bounds}, steps={len(self)}>"
+
+    def _bounds(self) -> tuple[int, int]:
+        store = self._store
+        if self._version != store.version:
+            first = 0 if self.start is None else store.locate(self.start)
+            last = len(store) if self.stop is None else store.locate(self.stop)
+            self._rows = (first, max(first, last))
+            self._values = None
+            self._version = store.version
+        return self._rows
+
+
+class HistoryView(Mapping):
+    """
+    Read-only mapping of steps to the metrics logged at them, backed by a column store.
+
+    Returned by `RunLogger.history`. Looking up a step is a binary search of the
+    step column and converts only that row, so ``history[step]`` costs
+    ``O(log n)`` whatever the number of rows. Iteration is in ascending step
+    order. Each row is a new dict holding the non-missing values; changing it
+    does not change the log.
+
+    Parameters
+    ----------
+    store : ColumnStore
+        Store holding the metrics.
+
+    Examples
+    --------
+    >>> logger.history[10]
+    {'loss': 0.42, 'acc': 0.87}
+    >>> 10 in logger.history
+    True
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: ColumnStore):
+        self._store = store
+
+    def __getitem__(self, step: int) -> dict:
+        if not isinstance(step, Integral):
+            raise KeyError(step)
+        values = self._store.row(step)
+        if values is None:
+            raise KeyError(step)
+        return values
+
+    def __contains__(self, step) -> bool:
+        return isinstance(step, Integral) and self._store.index(step) is not None
+
+    def __iter__(self):
+        return iter(self._store.steps().tolist())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def items(self) -> ItemsView:
+        return _HistoryItems(self)
+
+    def __repr__(self) -> str:
+        return f"<HistoryView: steps={len(self)}>"
+
+
+class _HistoryItems(ItemsView):
+    # Converts rows in chunks instead of one lookup per step
+    def __iter__(self):
+        return self._mapping._store.rows()
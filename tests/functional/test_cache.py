@@ -0,0 +1,169 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from iragca.functional import Pipeline, Step, StepCache, stable_hash
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value, scale=1):
+        self.calls += 1
+        return value * scale
+
+
+def test_stable_hash_is_content_based():
+    assert stable_hash({"a": [1, 2.0], "b": {3, 4}}) == stable_hash({"b": {4, 3}, "a": [1, 2.0]})
+    assert stable_hash((1, "a")) != stable_hash([1, "a"])
+    assert stable_hash(1) != stable_hash(1.0) != stable_hash(True)
+    assert stable_hash(("ab", "c")) != stable_hash(("a", "bc"))
+
+
+def test_stable_hash_distinguishes_functions_by_code_and_closure():
+    def make(n):
+        return lambda x: x + n
+
+    assert stable_hash(make(1)) == stable_hash(make(1))
+    assert stable_hash(make(1)) != stable_hash(make(2))
+    assert stable_hash(lambda x: x + 1) != stable_hash(lambda x: x + 2)
+
+
+def test_stable_hash_of_self_referencing_values():
+    def outer(n):
+        def factorial(x):
+            return 1 if x <= 1 else x * factorial(x - 1) * n
+
+        return factorial
+
+    loop = [1]
+    loop.append(loop)
+
+    assert stable_hash(outer(1)) == stable_hash(outer(1)) != stable_hash(outer(2))
+    assert stable_hash(loop) != stable_hash([1, [1]])
+    assert Step(outer(1), cache=True)(3) == 6
+
+    shared = [1]
+    assert stable_hash([shared, shared]) == stable_hash([[1], [1]])
+
+
+def test_stable_hash_is_stable_across_processes():
+    code = "from iragca.functional import stable_hash; print(stable_hash({'a': (1, 'x', None)}))"
+    first = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    second = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert first.stdout == second.stdout == stable_hash({"a": (1, "x", None)}) + "\n"
+
+
+def test_stable_hash_of_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    assert stable_hash(np.arange(4)) == stable_hash(np.arange(4))
+    assert stable_hash(np.arange(4)) != stable_hash(np.arange(4).reshape(2, 2))
+    assert stable_hash(np.arange(4)) != stable_hash(np.arange(4, dtype="float64"))
+    transposed = np.arange(6).reshape(2, 3).T
+    assert stable_hash(transposed) == stable_hash(np.ascontiguousarray(transposed))
+    assert stable_hash(np.array(["2024-01-01"], dtype="datetime64[D]")) != stable_hash(
+        np.array(["2024-01-02"], dtype="datetime64[D]")
+    )
+
+
+def test_cached_step_counts_hits_and_misses():
+    counter = Counter()
+    step = Step(counter, scale=3, cache=True)
+
+    assert [step(x) for x in [1, 2, 1, 1, 2]] == [3, 6, 3, 3, 6]
+    assert counter.calls == 2
+    info = step.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 2, 2)
+    assert repr(Step(abs, cache=True)) == "Step(abs, cache=True)"
+
+
+def test_cache_key_includes_bound_arguments():
+    cache = StepCache()
+    counter = Counter()
+
+    assert Step(counter, scale=2, cache=cache)(5) == 10
+    assert Step(counter, scale=3, cache=cache)(5) == 15
+    assert counter.calls == 2
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("iragca.functional.cache.time.time", lambda: now[0])
+    counter = Counter()
+    step = Step(counter, cache=StepCache(maxsize=2, ttl=10))
+
+    step(1), step(2), step(1), step(3)  # evicts 2, the least recently used
+    assert step.cache_info().currsize == 2
+    step(1)
+    step(2)
+    assert counter.calls == 4
+
+    now[0] += 11
+    step(1)
+    assert counter.calls == 5
+
+
+CALLS = []
+
+
+def record(value, scale):
+    CALLS.append(value)
+    return value * scale
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    Step(record, 2, cache=StepCache(directory=tmp_path))(21)
+    CALLS.clear()
+
+    step = Step(record, 2, cache=StepCache(directory=tmp_path))
+
+    assert step(21) == 42
+    assert CALLS == []
+    assert step.cache_info().disk_hits == 1
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+
+def test_clear_disk(tmp_path):
+    cache = StepCache(directory=tmp_path)
+    step = Step(Counter(), cache=cache)
+    step(1)
+
+    cache.clear(disk=True)
+
+    assert cache.info().currsize == 0
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_pipeline_cache_info_and_compile():
+    counter = Counter()
+    cached = Step(counter, scale=2, cache=True)
+    pipeline = Pipeline([str.strip, int, Pipeline([cached])])
+
+    assert list(pipeline.map([" 1", "2 ", "1"])) == [2, 4, 2]
+    assert pipeline.compile()("2") == 4
+    assert counter.calls == 2
+    assert pipeline.cache_info() == {cached: cached.cache_info()}
+    assert pipeline.cache_info()[cached].hits == 2
+
+
+def test_cache_pickles_without_memory_tier():
+    step = Step(Counter(), cache=True)
+    step(1)
+
+    restored = pickle.loads(pickle.dumps(step))
+
+    assert restored.cache_info().currsize == 0
+    assert restored(1) == 1
+
+
+def test_async_steps_cannot_be_cached():
+    async def fetch(x):
+        return x
+
+    with pytest.raises(ValueError):
+        Step(fetch, cache=True)
@@ -0,0 +1,134 @@
+import io
+
+import pytest
+
+from iragca.functional import CheckpointStore, Pipeline, Step
+from iragca.functional.checkpoint import dump, load
+
+CALLS = []
+
+
+def record(value, name, offset=0):
+    CALLS.append(name)
+    return value + offset
+
+
+def fail_once(value):
+    if not CALLS.count("failed"):
+        CALLS.append("failed")
+        raise RuntimeError("crash")
+    return value
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def make_pipeline(offset=1):
+    return Pipeline(
+        [
+            Step(record, "load", checkpoint=True),
+            Step(record, "features", offset=offset, checkpoint=True),
+            fail_once,
+            Step(record, "train"),
+        ]
+    )
+
+
+def test_dump_and_load_roundtrip():
+    buffer = io.BytesIO()
+    dump({"a": [1, 2], "b": b"xyz"}, buffer)
+    buffer.seek(0)
+
+    assert load(buffer) == {"a": [1, 2], "b": b"xyz"}
+
+
+def test_arrays_use_out_of_band_buffers():
+    np = pytest.importorskip("numpy")
+    array = np.arange(1_000_000, dtype="float64")
+    buffer = io.BytesIO()
+
+    dump({"x": array}, buffer)
+
+    assert buffer.getvalue().endswith(array.tobytes())
+    buffer.seek(0)
+    restored = load(buffer)["x"]
+    np.testing.assert_array_equal(restored, array)
+    assert restored.flags.writeable
+
+
+def test_load_rejects_bad_files():
+    with pytest.raises(ValueError):
+        load(io.BytesIO(b"not a checkpoint"))
+    buffer = io.BytesIO()
+    dump(list(range(100)), buffer)
+    with pytest.raises(ValueError):
+        load(io.BytesIO(buffer.getvalue()[:-5]))
+
+
+def test_run_resumes_after_crash(tmp_path):
+    pipeline = make_pipeline()
+
+    with pytest.raises(RuntimeError):
+        pipeline.run(10, checkpoints=tmp_path)
+    assert CALLS == ["load", "features", "failed"]
+
+    CALLS[:] = ["failed"]
+    assert pipeline.run(10, checkpoints=tmp_path) == 11
+    assert CALLS == ["failed", "train"]
+
+
+def test_changing_a_step_invalidates_later_checkpoints(tmp_path):
+    CALLS.append("failed")
+    make_pipeline(offset=1).run(10, checkpoints=tmp_path)
+
+    CALLS[:] = ["failed"]
+    assert make_pipeline(offset=2).run(10, checkpoints=tmp_path) == 12
+    assert CALLS == ["failed", "features", "train"]
+
+    CALLS[:] = ["failed"]
+    make_pipeline(offset=2).run(11, checkpoints=tmp_path)
+    assert CALLS == ["failed", "load", "features", "train"]
+
+
+def test_editing_step_arguments_in_place_invalidates_checkpoints(tmp_path):
+    CALLS.append("failed")
+    pipeline = make_pipeline(offset=1)
+    assert pipeline.run(10, checkpoints=tmp_path) == 11
+
+    pipeline.steps[1].kwargs["offset"] = 5
+    CALLS[:] = ["failed"]
+    assert pipeline.run(10, checkpoints=tmp_path) == 15
+    assert CALLS == ["failed", "features", "train"]
+
+
+def test_run_with_explicit_key_and_store(tmp_path):
+    store = CheckpointStore(tmp_path)
+    CALLS.append("failed")
+    make_pipeline().run(10, checkpoints=store, key="v1")
+    make_pipeline().run(99, checkpoints=store, key="v1")
+
+    assert store.saved == 2
+    assert store.loaded == 1
+    assert CALLS == ["failed", "load", "features", "train", "train"]
+
+
+def test_corrupt_checkpoint_falls_back_to_earlier_one(tmp_path):
+    store = CheckpointStore(tmp_path)
+    CALLS.append("failed")
+    pipeline = make_pipeline()
+    pipeline.run(10, checkpoints=store)
+
+    latest = max(tmp_path.glob("*.ckpt"), key=lambda path: path.stat().st_mtime_ns)
+    latest.write_bytes(latest.read_bytes()[:10])
+    CALLS[:] = ["failed"]
+
+    assert pipeline.run(10, checkpoints=store) == 11
+    assert CALLS in (["failed", "features", "train"], ["failed", "load", "features", "train"])
+
+
+def test_run_without_checkpoints_is_a_call():
+    CALLS.append("failed")
+    assert make_pipeline().run(1) == 2
+    assert repr(Step(record, "x", checkpoint=True)) == "Step(record, checkpoint=True)"
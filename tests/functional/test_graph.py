@@ -0,0 +1,157 @@
+import inspect
+import pickle
+import threading
+import time
+
+import pytest
+
+from iragca.functional import Graph, Pipeline, Step, branch, merge, parallel
+
+
+def double(x):
+    return x * 2
+
+
+def test_graph_evaluates_shared_nodes_once():
+    calls = []
+
+    def shared(x):
+        calls.append(x)
+        return x + 1
+
+    graph = Graph()
+    source = graph.input()
+    base = graph.add(shared, source)
+    left = graph.add(double, base)
+    right = graph.add(Step(pow, 2), base)
+    graph.add(lambda a, b: a + b, left, right, name="total")
+
+    assert graph(3) == 8 + 16
+    assert calls == [3]
+    assert str(graph).splitlines()[-2] == "  total ⬅ double, pow"
+
+
+def test_graph_outputs_and_pruning():
+    calls = []
+    graph = Graph()
+    a = graph.add(double)
+    b = graph.add(lambda x: calls.append(x) or x, graph.input())
+    c = graph.add(str, a)
+
+    graph.output(a, c)
+    assert graph(2) == (4, "4")
+    graph.output(first=a)
+    assert graph(2) == {"first": 4}
+    assert calls == []  # b is never needed
+    assert b.name == "<lambda>"
+
+
+def test_independent_nodes_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others(x):
+        barrier.wait()
+        return x
+
+    graph = Graph(workers=3)
+    nodes = [graph.add(wait_for_others) for _ in range(3)]
+    graph.output(*nodes)
+
+    assert graph(1) == (1, 1, 1)
+    graph.close()
+
+
+def test_parallel_and_merge_compose_with_pipelines():
+    features = parallel(len, Pipeline([str.upper, str.strip])) | merge(lambda n, text: f"{text}:{n}")
+
+    assert isinstance(features, Pipeline)
+    assert features(" ab ") == "AB:4"
+    assert (str.lower | parallel(a=len, b=str.strip) | merge(lambda a, b: (a, b)))(" X ") == (3, "x")
+
+
+def test_parallel_shares_common_prefixes():
+    calls = []
+
+    def clean(x):
+        calls.append(x)
+        return x.strip()
+
+    step = Step(clean)
+    graph = parallel(Pipeline([step, len]), Pipeline([step, str.upper]))
+
+    assert graph(" ab ") == (2, "AB")
+    assert calls == [" ab "]
+    assert len(graph.nodes) == 4
+
+
+def test_parallel_single_branch_returns_tuple():
+    assert parallel(len)("abc") == (3,)
+
+
+def test_parallel_runs_branches_concurrently():
+    def slow(x):
+        time.sleep(0.05)
+        return x
+
+    graph = parallel(slow, slow, slow, slow)
+    started = time.perf_counter()
+    assert graph(1) == (1, 1, 1, 1)
+    assert time.perf_counter() - started < 0.15
+
+
+def test_graph_errors_propagate():
+    def fail(x):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        parallel(double, fail)(1)
+
+
+def test_branch():
+    route = branch(lambda x: x < 0, abs, otherwise=double)
+
+    assert Pipeline([route, str])(-3) == "3"
+    assert Pipeline([route, str])(3) == "6"
+    assert branch(lambda x: False, abs)(-1) == -1
+
+
+def test_graph_validation():
+    graph = Graph()
+    other = Graph()
+
+    with pytest.raises(ValueError):
+        graph(1)
+    with pytest.raises(ValueError):
+        graph.add(double, other.input())
+    with pytest.raises(TypeError):
+        graph.add(1)
+    with pytest.raises(ValueError):
+        parallel()
+
+
+def test_graph_pickles_for_process_pools():
+    graph = parallel(double, Step(pow, 3))
+    graph(2)
+
+    restored = pickle.loads(pickle.dumps(graph))
+
+    assert restored(2) == (4, 8)
+    results = Pipeline([graph, merge(max)]).map(range(4), executor="process", workers=2)
+    assert list(results) == [0, 2, 8, 27]
+
+
+def test_output_tuple_of_one_node_returns_tuple():
+    graph = Graph()
+    node = graph.add(len, graph.input())
+    assert graph.output(node)("abc") == 3
+    assert graph.output((node,))("abc") == (3,)
+
+    with pytest.raises(ValueError):
+        graph.output((Graph().input(),))
+
+
+def test_merge_and_branch_are_functions():
+    assert inspect.isfunction(merge) and inspect.isfunction(branch)
+    assert repr(merge(max)) == "merge(max)"
+    with pytest.raises(TypeError):
+        merge(1)
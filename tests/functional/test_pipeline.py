@@ -1,6 +1,9 @@
+import asyncio
+import functools
+
 import pytest
 
-from iragca.functional import Pipeline, Step
+from iragca.functional import Pipeline, Step, identity
 
 
 @pytest.mark.parametrize(
@@ -86,3 +89,355 @@ def test_step_call():
     step2 = Step(lambda x, y, z: x * 2 + y + z, y=10, z=20)
     result2 = step2(5)
     assert result2 == 40
+
+
+def test_map_is_lazy():
+    pulled = []
+
+    def source():
+        for value in range(5):
+            pulled.append(value)
+            yield value
+
+    results = Pipeline([lambda x: x * 2]).map(source())
+    assert pulled == []
+
+    assert next(results) == 0
+    assert pulled == [0]
+    assert list(results) == [2, 4, 6, 8]
+
+
+def test_map_with_batches():
+    calls = []
+
+    def double_all(values):
+        calls.append(len(values))
+        return [value * 2 for value in values]
+
+    pipeline = Pipeline(
+        [
+            lambda x: x + 1,
+            Step(double_all, batched=True),
+            Pipeline([lambda x: x - 1, str]),
+        ]
+    )
+
+    assert list(pipeline.map(range(5), batch_size=2)) == ["1", "3", "5", "7", "9"]
+    assert calls == [2, 2, 1]
+    assert list(pipeline.map(range(3))) == ["1", "3", "5"]
+    assert pipeline(4) == "9"
+
+
+def test_map_batched_numpy_step():
+    np = pytest.importorskip("numpy")
+    pipeline = Pipeline([Step(np.asarray, batched=True), Step(np.sqrt, batched=True), float])
+
+    assert list(pipeline.map([1.0, 4.0, 9.0], batch_size=2)) == [1.0, 2.0, 3.0]
+
+
+def test_map_validates_batches():
+    with pytest.raises(ValueError):
+        Pipeline([]).map([1], batch_size=0)
+
+    dropping = Pipeline([Step(lambda values: values[:1], batched=True)])
+    with pytest.raises(ValueError, match="returned 1 results for a batch of 2"):
+        list(dropping.map([1, 2], batch_size=2))
+
+
+def test_batched_step_repr():
+    step = Step(sorted, batched=True, description="sort")
+
+    assert repr(step) == "Step(sorted, batched=True, description='sort')"
+    assert step.kwargs == {}
+
+
+def square(x):
+    return x * x
+
+
+def offset(x, by, scale=1):
+    return (x + by) * scale
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_map_ordered(executor):
+    pipeline = Pipeline([square, Step(offset, 1, scale=2)])
+
+    results = pipeline.map(range(50), executor=executor, workers=2, chunksize=4)
+
+    assert list(results) == [(x * x + 1) * 2 for x in range(50)]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_map_unordered(executor):
+    pipeline = Pipeline([square])
+
+    results = pipeline.map(range(50), executor=executor, workers=3, ordered=False)
+
+    assert sorted(results) == [x * x for x in range(50)]
+
+
+@pytest.mark.parametrize("batch_size", [None, 4])
+def test_parallel_map_compiles_once(monkeypatch, batch_size):
+    from iragca.functional import pipeline as module
+
+    compiled = []
+
+    def compile_and_count(steps, **options):
+        compiled.append(steps)
+        return original(steps, **options)
+
+    original = module._compile
+    monkeypatch.setattr(module, "_compile", compile_and_count)
+    results = Pipeline([square]).map(range(50), executor="thread", workers=4, batch_size=batch_size)
+
+    assert list(results) == [x * x for x in range(50)]
+    assert len(compiled) == 1
+
+
+def test_parallel_map_is_bounded_and_lazy():
+    pulled = []
+
+    def source():
+        for value in range(1000):
+            pulled.append(value)
+            yield value
+
+    results = Pipeline([square]).map(source(), executor="thread", workers=2, chunksize=5)
+    assert pulled == []
+
+    assert next(results) == 0
+    assert len(pulled) <= 5 * (2 * 2 + 1)
+    results.close()
+
+
+def test_parallel_map_propagates_errors():
+    pipeline = Pipeline([lambda x: 1 / x])
+
+    with pytest.raises(ZeroDivisionError):
+        list(pipeline.map([1, 0, 2], executor="thread", workers=2))
+
+
+def test_parallel_map_validates_arguments():
+    pipeline = Pipeline([square])
+
+    with pytest.raises(ValueError):
+        pipeline.map([1], executor="gpu")
+    with pytest.raises(ValueError):
+        pipeline.map([1], executor="thread", workers=0)
+    with pytest.raises(ValueError):
+        pipeline.map([1], executor="thread", chunksize=0)
+
+
+def test_process_map_reports_unpicklable_step(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_cloudpickle(name, *args, **kwargs):
+        if name == "cloudpickle":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_cloudpickle)
+    step = Step(lambda x: x, description="local")
+
+    with pytest.raises(TypeError, match="description='local'"):
+        Pipeline([square, step]).map([1], executor="process")
+
+
+async def add_async(x, n=1):
+    await asyncio.sleep(0)
+    return x + n
+
+
+def test_step_detects_coroutine_functions():
+    assert Step(add_async, n=2).is_async
+    assert Step(functools.partial(add_async, n=2)).is_async
+    assert not Step(square).is_async
+
+
+def test_acall_awaits_async_steps():
+    pipeline = Pipeline([square, Step(add_async, n=2), Pipeline([add_async]), str])
+
+    assert asyncio.run(pipeline.acall(3)) == "12"
+    assert asyncio.run(pipeline.acall(3, offload=True)) == "12"
+
+
+def test_acall_runs_batched_steps_on_single_values():
+    pipeline = Pipeline([Step(lambda batch: [x * 2 for x in batch], batched=True), add_async])
+
+    assert asyncio.run(pipeline.acall(4)) == 9
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+async def numbers(count):
+    for value in range(count):
+        await asyncio.sleep(0)
+        yield value
+
+
+def test_amap_is_ordered_and_bounded():
+    active = peak = 0
+
+    async def slow(x):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001 * (1 + x % 3))
+        active -= 1
+        return x
+
+    pipeline = Pipeline([slow, square])
+    results = asyncio.run(collect(pipeline.amap(numbers(30), concurrency=4)))
+
+    assert results == [x * x for x in range(30)]
+    assert peak == 4
+
+
+def test_amap_unordered_and_sync_iterables():
+    async def run():
+        release = asyncio.Event()
+
+        async def blocked(x):
+            if x == 0:
+                await release.wait()
+            return x
+
+        results = []
+        async for value in Pipeline([blocked]).amap(range(5), concurrency=5, ordered=False):
+            results.append(value)
+            if len(results) == 4:
+                release.set()
+        return results
+
+    results = asyncio.run(run())
+
+    assert sorted(results[:4]) == [1, 2, 3, 4]
+    assert results[4] == 0
+
+
+def test_amap_applies_backpressure():
+    pulled = []
+
+    async def source():
+        for value in range(100):
+            pulled.append(value)
+            yield value
+
+    async def take_two():
+        results = Pipeline([add_async]).amap(source(), concurrency=3)
+        first = [await results.__anext__(), await results.__anext__()]
+        await results.aclose()
+        return first
+
+    assert asyncio.run(take_two()) == [1, 2]
+    # Three scheduled up front, one more once the first result was taken
+    assert len(pulled) == 4
+
+
+def test_amap_cancels_pending_items_on_error():
+    cancelled = []
+
+    async def work(x):
+        if x == 0:
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(collect(Pipeline([work]).amap(range(3), concurrency=3)))
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_amap_validates_concurrency():
+    with pytest.raises(ValueError):
+        Pipeline([square]).amap([1], concurrency=0)
+
+
+def test_compile_flattens_and_drops_identity_steps():
+    pipeline = Pipeline(
+        [
+            identity,
+            Step(offset, 1, scale=2),
+            Pipeline([lambda x: x, square, Pipeline([])]),
+            Step(identity),
+            Step(lambda batch: [x + 1 for x in batch], batched=True),
+            str,
+            Step(str.rjust, 4, "0"),
+        ]
+    )
+
+    compiled = pipeline.compile()
+
+    assert len(compiled.steps) == 5
+    assert [compiled(x) for x in range(5)] == [pipeline(x) for x in range(5)]
+    assert compiled(3) == "0065"
+
+
+def test_compile_handles_non_identifier_kwargs():
+    def pick(value, **kwargs):
+        return kwargs[value]
+
+    compiled = Pipeline([Step(pick, **{"a-b": 1, "class": 2})]).compile()
+
+    assert compiled("a-b") == 1
+    assert compiled("class") == 2
+
+
+def test_compile_empty_pipeline_is_identity():
+    assert Pipeline([]).compile()("test") == "test"
+
+
+def test_compile_with_async_steps():
+    compiled = Pipeline([square, Step(add_async, n=2)]).compile()
+
+    assert asyncio.run(compiled(3)) == 11
+
+
+def test_chaining_is_lazy_and_snapshots_operands():
+    base = Pipeline([lambda x: x + 1])
+    pipeline = base
+    for _ in range(5000):
+        pipeline = pipeline | (lambda x: x + 1)
+    base.add(lambda x: x * 100)
+
+    assert repr(pipeline) == "<Pipeline(5001 steps)>"
+    assert pipeline(0) == 5001
+    assert len(base.steps) == 2
+
+    extended = pipeline | Pipeline([str])
+    pipeline.add(float)
+    assert extended(0) == "5001"
+    assert pipeline(0) == 5001.0
+
+
+def test_chaining_ignores_in_place_edits_of_operands():
+    base = Pipeline([square])
+    chained = base | str
+    base.steps[0] = abs
+    base.steps.insert(0, float)
+    assert chained(3) == "9"
+
+    later = chained | len
+    chained.steps.pop()
+    chained.steps = [abs]
+    assert later(-3) == 1
+    assert (base | str)(-3) == "3.0"
+
+
+def test_chained_pipeline_pickles_its_steps():
+    import pickle
+
+    pipeline = Pipeline([square]) | square | Pipeline([str])
+    restored = pickle.loads(pickle.dumps(pipeline))
+
+    assert restored(2) == "16"
+    assert restored.steps == [square, square, str]
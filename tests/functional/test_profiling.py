@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import pytest
+
+from iragca.functional import Pipeline, Step, StepHook
+
+
+def slow(x):
+    time.sleep(0.002)
+    return x
+
+
+class Recorder(StepHook):
+    def __init__(self):
+        self.events = []
+
+    def before_step(self, index, step, value):
+        self.events.append(("before", index, value))
+
+    def after_step(self, index, step, value, result):
+        self.events.append(("after", index, result))
+
+
+def test_hooks_see_flattened_steps():
+    recorder = Recorder()
+    pipeline = Pipeline([str.strip, Pipeline([int, Step(pow, 2)])]).add_hook(recorder)
+
+    assert pipeline(" 3 ") == 9
+    assert recorder.events == [
+        ("before", 0, " 3 "),
+        ("after", 0, "3"),
+        ("before", 1, "3"),
+        ("after", 1, 3),
+        ("before", 2, 3),
+        ("after", 2, 9),
+    ]
+
+    pipeline.remove_hook(recorder)
+    pipeline(" 4 ")
+    assert len(recorder.events) == 6
+
+
+def test_hooks_apply_to_map_compile_and_batches():
+    recorder = Recorder()
+    doubled = Step(lambda batch: [x * 2 for x in batch], batched=True)
+    pipeline = Pipeline([int, doubled]).add_hook(recorder)
+
+    assert list(pipeline.map(["1", "2", "3"], batch_size=2)) == [2, 4, 6]
+    assert [event for event in recorder.events if event[1] == 1] == [
+        ("before", 1, [1, 2]),
+        ("after", 1, [2, 4]),
+        ("before", 1, [3]),
+        ("after", 1, [6]),
+    ]
+
+    recorder.events.clear()
+    assert pipeline.compile()("5") == 10
+    assert len(recorder.events) == 4
+
+
+def test_hooks_apply_to_async_steps():
+    async def add(x):
+        await asyncio.sleep(0)
+        return x + 1
+
+    recorder = Recorder()
+    pipeline = Pipeline([add, str]).add_hook(recorder)
+
+    assert asyncio.run(pipeline.acall(1)) == "2"
+    assert recorder.events[1] == ("after", 0, 2)
+
+
+def test_profiler_statistics():
+    pipeline = Pipeline([str.strip, slow, Pipeline([len])])
+
+    with pipeline.profile(sizes=True) as profiler:
+        list(pipeline.map([" ab ", "cde"]))
+        pipeline(" f ")
+
+    assert not pipeline._hooks
+    stats = profiler.to_dict()
+    steps = stats["steps"]
+    assert [step["step"] for step in steps] == ["str.strip", "slow", "len"]
+    assert [step["calls"] for step in steps] == [3, 3, 3]
+    assert steps[1]["mean"] >= 0.002
+    assert steps[1]["p95"] >= steps[1]["mean"] * 0.5
+    assert steps[1]["share"] == max(step["share"] for step in steps)
+    assert sum(step["share"] for step in steps) == pytest.approx(1.0)
+    assert stats["total"] == pytest.approx(sum(step["total"] for step in steps))
+    assert steps[2]["out_bytes"] > 0
+
+
+def test_profiler_times_interleaved_amap_items():
+    async def wait(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    async def collect(pipeline):
+        return [result async for result in pipeline.amap(range(6), concurrency=3)]
+
+    pipeline = Pipeline([wait, str])
+    with pipeline.profile() as profiler:
+        assert asyncio.run(collect(pipeline)) == ["0", "1", "2", "3", "4", "5"]
+
+    steps = profiler.to_dict()["steps"]
+    assert [step["calls"] for step in steps] == [6, 6]
+    assert steps[0]["mean"] >= 0.01
+    assert steps[0]["p95"] < 0.5
+
+
+def test_profiler_memory():
+    def allocate(n):
+        return bytearray(n)
+
+    pipeline = Pipeline([allocate])
+    with pipeline.profile(memory=True) as profiler:
+        result = pipeline(1_000_000)
+
+    step = profiler.to_dict()["steps"][0]
+    assert len(result) == 1_000_000
+    assert step["allocated"] >= 1_000_000
+    assert step["peak"] >= 1_000_000
+
+
+def test_profiler_report_uses_arrow_layout():
+    pipeline = Pipeline([str.strip, slow])
+    with pipeline.profile() as profiler:
+        pipeline(" x ")
+
+    lines = str(profiler).splitlines()
+    assert lines[0] == "Pipeline("
+    assert lines[1].startswith("  str.strip  calls=1")
+    assert lines[2] == "    ⬇"
+    assert lines[3].startswith("  slow") and "p95=" in lines[3]
+    assert lines[-1] == ")"
+
+
+def test_profiling_off_keeps_plain_steps():
+    pipeline = Pipeline([slow])
+    profiler = pipeline.profile()
+    profiler.close()
+
+    assert pipeline._run_steps() == [slow]
+    assert profiler.to_dict() == {"total": 0, "steps": []}
@@ -0,0 +1,152 @@
+import threading
+import time
+
+import pytest
+
+from iragca.functional import Pipeline, Step
+
+
+def square(x):
+    return x * x
+
+
+def test_stream_matches_sequential_results():
+    pipeline = Pipeline([square, Pipeline([Step(pow, 1), str])])
+
+    with pipeline.stream(range(200), workers=[1, 3, 2], maxsize=4) as results:
+        assert list(results) == [str(x * x) for x in range(200)]
+
+
+def test_stages_overlap_like_an_assembly_line():
+    def slow(x):
+        time.sleep(0.02)
+        return x
+
+    pipeline = Pipeline([slow, slow, slow])
+    started = time.perf_counter()
+    assert list(pipeline.stream(range(10))) == list(range(10))
+    # Sequentially this takes 30 sleeps; as a pipeline about 12
+    assert time.perf_counter() - started < 0.5
+
+
+def test_unordered_stream():
+    def jitter(x):
+        time.sleep(0.001 * (x % 4))
+        return x
+
+    results = Pipeline([jitter]).stream(range(50), workers=4, ordered=False)
+
+    assert sorted(results) == list(range(50))
+
+
+def test_backpressure_bounds_items_read():
+    pulled = []
+    release = threading.Event()
+
+    def source():
+        for value in range(10_000):
+            pulled.append(value)
+            yield value
+
+    def blocked(x):
+        release.wait()
+        return x
+
+    results = Pipeline([str, blocked]).stream(source(), maxsize=2)
+    time.sleep(0.2)
+
+    # Two queues, one slot each in flight per worker, plus the reorder bound
+    assert len(pulled) <= 2 * 3 + 2 + 1
+    stats = results.stats()
+    assert stats[1]["depth"] == 2
+    release.set()
+    assert next(results) == "0"
+    results.close()
+
+
+def test_stats_and_report_find_the_bottleneck():
+    def slow(x):
+        time.sleep(0.01)
+        return x
+
+    pipeline = Pipeline([str.strip, slow, len])
+    with pipeline.stream([" ab "] * 30, stages=[1, 2], maxsize=8) as results:
+        assert list(results) == [2] * 30
+        stats = results.stats()
+        report = results.report()
+
+    assert [row["stage"] for row in stats] == ["str.strip", "slow | len"]
+    assert [row["items"] for row in stats] == [30, 30]
+    assert stats[1]["mean_depth"] > stats[0]["mean_depth"]
+    assert stats[1]["utilization"] > stats[0]["utilization"]
+    assert report.splitlines()[0] == "Pipeline("
+    assert report.splitlines()[2] == "    ⬇"
+    assert "queue=" in report and "busy=" in report
+
+
+def test_process_stage():
+    results = Pipeline([square, str]).stream(
+        range(20), workers=[2, 1], executor=["process", "thread"]
+    )
+
+    assert list(results) == [str(x * x) for x in range(20)]
+
+
+def test_process_stage_compiles_once_per_worker(monkeypatch, tmp_path):
+    from iragca.functional import pipeline as module
+
+    log = tmp_path / "compiled"
+    original = module._compile
+
+    def compile_and_log(steps, **options):
+        with open(log, "a") as file:
+            file.write("compiled\n")
+        return original(steps, **options)
+
+    # Worker processes are forked, so they inherit the patched module
+    monkeypatch.setattr(module, "_compile", compile_and_log)
+    results = Pipeline([square, str]).stream(range(40), workers=[2, 1], executor="process")
+
+    assert list(results) == [str(x * x) for x in range(40)]
+    # Once per stage when the stream is built, then once in each worker process
+    assert len(log.read_text().splitlines()) <= 2 + 3
+
+
+def test_errors_propagate_and_stop_workers():
+    def fail(x):
+        if x == 25:
+            raise RuntimeError("boom")
+        return x
+
+    results = Pipeline([square, fail]).stream(range(100))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(results)
+
+
+def test_source_errors_propagate():
+    def source():
+        yield 1
+        raise OSError("disk")
+
+    with pytest.raises(OSError, match="disk"):
+        list(Pipeline([square]).stream(source()))
+
+
+def test_stream_validation():
+    pipeline = Pipeline([square, str])
+
+    with pytest.raises(ValueError):
+        pipeline.stream([1], stages=[1])
+    with pytest.raises(ValueError):
+        pipeline.stream([1], workers=[1])
+    with pytest.raises(ValueError):
+        pipeline.stream([1], workers=0)
+    with pytest.raises(ValueError):
+        pipeline.stream([1], executor="gpu")
+    with pytest.raises(ValueError):
+        pipeline.stream([1], maxsize=0)
+
+
+def test_empty_pipeline_streams_inputs():
+    assert list(Pipeline([]).stream([1, 2, 3])) == [1, 2, 3]
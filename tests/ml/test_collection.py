@@ -0,0 +1,107 @@
+import math
+
+import pytest
+
+from iragca.ml import RunCollection, RunLogger
+
+np = pytest.importorskip("numpy")
+
+
+def make_run(losses, start=0):
+    logger = RunLogger(max_steps=100)
+    for step, loss in enumerate(losses, start):
+        logger.log_metrics({"val_loss": loss}, step)
+    return logger
+
+
+@pytest.fixture
+def runs():
+    runs = RunCollection()
+    runs.add(make_run([3.0, 2.0, 2.5]), params={"lr": 0.1, "optimizer": "sgd"})
+    runs.add(make_run([4.0, 1.0, 1.5]), params={"lr": 0.01, "optimizer": "adam"})
+    runs.add(make_run([2.0, 1.8, 1.2]), name="long", params={"lr": 0.001, "optimizer": "adam"})
+    acc_only = RunLogger(max_steps=10)
+    acc_only.log_metrics({"acc": 0.5}, 0)
+    runs.add(acc_only, params={"optimizer": "sgd", "warmup": 5})
+    return runs
+
+
+def test_add_assigns_names_and_params(runs):
+    assert runs.names == ["run-0", "run-1", "long", "run-3"]
+    assert len(runs) == 4
+    assert "long" in runs
+    assert runs.params("run-3") == {"lr": None, "optimizer": "sgd", "warmup": 5}
+    assert runs.params("run-0") == {"lr": 0.1, "optimizer": "sgd", "warmup": None}
+    with pytest.raises(ValueError):
+        runs.add(make_run([1.0]), name="long")
+
+
+def test_history_is_shared_column_view(runs):
+    history = runs.history("run-1")
+
+    assert history["step"].tolist() == [0, 1, 2]
+    assert history["val_loss"].tolist() == [4.0, 1.0, 1.5]
+    assert np.isnan(history["acc"]).all()
+
+
+def test_summaries_precomputed(runs):
+    assert runs.summary("val_loss", "last").tolist()[:3] == [2.5, 1.5, 1.2]
+    assert runs.summary("val_loss", "min_step").tolist()[:3] == [1, 1, 2]
+    assert math.isnan(runs.summary("val_loss", "mean")[3])
+    assert runs.summary("acc", "count").tolist()[3] == 1
+    with pytest.raises(ValueError):
+        runs.summary("val_loss", "median")
+
+
+def test_best_by_summary_and_step(runs):
+    assert runs.best("val_loss", k=2, by="last") == [("long", 1.2), ("run-1", 1.5)]
+    assert runs.best("val_loss", by="min") == [("run-1", 1.0)]
+    assert runs.best("val_loss", k=10, by="max", mode="max")[0] == ("run-1", 4.0)
+    assert runs.best("val_loss", step=0, k=3) == [("long", 2.0), ("run-0", 3.0), ("run-1", 4.0)]
+
+
+def test_filters_on_hyperparameters(runs):
+    assert runs.filter(optimizer="adam") == ["run-1", "long"]
+    assert runs.filter(optimizer=["sgd"], warmup=5) == ["run-3"]
+    assert runs.filter(lr=lambda lr: np.array([x is not None and x < 0.05 for x in lr])) == [
+        "run-1",
+        "long",
+    ]
+    assert runs.best("val_loss", by="last", where={"optimizer": "sgd"}) == [("run-0", 2.5)]
+    with pytest.raises(KeyError):
+        runs.filter(momentum=0.9)
+
+
+def test_numeric_params_are_vectorized():
+    runs = RunCollection()
+    for lr in [0.1, 0.01, 0.001]:
+        runs.add(make_run([lr]), params={"lr": lr})
+
+    assert runs.filter(lr=lambda lr: lr < 0.05) == ["run-1", "run-2"]
+
+
+def test_grows_past_initial_capacity():
+    runs = RunCollection()
+    for index in range(5):
+        runs.add(make_run([float(index)] * 300, start=index))
+
+    assert runs.history("run-4")["step"][0] == 4
+    at_step = runs.at_step("val_loss", 3)
+    assert at_step[:4].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert math.isnan(at_step[4])
+
+
+def test_at_step_searches_each_run():
+    runs = RunCollection()
+    sparse = RunLogger(max_steps=100)
+    for step in range(0, 100, 10):
+        sparse.log_metrics({"val_loss": float(step)}, step)
+    runs.add(sparse)
+    runs.add(make_run([1.0, 2.0, 3.0], start=19))
+
+    assert runs.at_step("val_loss", 20).tolist() == [20.0, 2.0]
+    assert np.isnan(runs.at_step("val_loss", 15)).all()
+    assert np.isnan(runs.at_step("val_loss", 500)).all()
+
+    runs.add(make_run([7.0], start=20))
+    assert runs.at_step("val_loss", 20).tolist() == [20.0, 2.0, 7.0]
@@ -0,0 +1,109 @@
+import multiprocessing
+import threading
+
+import pytest
+
+from iragca.ml import MetricCollector, RunLogger
+
+
+def produce(producer, value, steps=100):
+    with producer:
+        for step in range(steps):
+            producer.log_metrics({"loss": float(value)}, step=step)
+
+
+def test_threads_are_reduced_per_step():
+    logger = RunLogger(max_steps=100)
+    with MetricCollector(logger, reduce="mean", batch_size=7) as collector:
+        threads = [
+            threading.Thread(target=produce, args=(collector.producer(), value))
+            for value in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert logger.steps == list(range(100))
+    assert logger.loss == [1.5] * 100
+
+
+@pytest.mark.parametrize("reduce,expected", [("sum", 6.0), ("max", 3.0), ("min", 0.0)])
+def test_reducers(reduce, expected):
+    logger = RunLogger(max_steps=10)
+    with logger.collector(reduce=reduce) as collector:
+        for value in range(4):
+            produce(collector.producer(), value, steps=10)
+
+    assert logger.loss == [expected] * 10
+
+
+def test_flush_writes_unfinished_steps():
+    logger = RunLogger(max_steps=10)
+    collector = MetricCollector(logger, batch_size=1)
+    producer = collector.producer()
+    collector.producer()  # a second worker that has not reported yet
+
+    producer.log_metrics({"loss": 1.0}, step=0)
+    producer.log_metrics({"loss": 2.0}, step=1)
+    collector.flush(timeout=5)
+
+    assert logger.loss == [1.0, 2.0]
+    collector.close()
+
+
+def test_producer_copies_buffered_metrics():
+    logger = RunLogger(max_steps=10)
+    collector = MetricCollector(logger, batch_size=10)
+    producer = collector.producer()
+
+    log_data = {"loss": 1.0}
+    producer.log_metrics(log_data, step=0)
+    log_data["loss"] = 2.0
+    producer.log_metrics(log_data, step=1)
+    producer.close()
+    collector.close()
+
+    assert logger.loss == [1.0, 2.0]
+
+
+def test_late_metrics_keep_values_already_written():
+    logger = RunLogger(max_steps=10)
+    collector = MetricCollector(logger, batch_size=1)
+    first = collector.producer()
+    first.log_metrics({"loss": 1.0, "acc": 0.5}, step=0)
+    first.log_metrics({"loss": 2.0, "acc": 0.6}, step=1)
+    collector.flush(timeout=5)
+
+    second = collector.producer()
+    second.log_metrics({"acc": 0.7}, step=0)
+    second.log_metrics({"loss": 4.0}, step=1)
+    collector.flush(timeout=5)
+
+    assert logger.loss == [1.0, 4.0]
+    assert logger.acc == [0.7, 0.6]
+    collector.close()
+
+
+def test_processes():
+    context = multiprocessing.get_context("fork")
+    logger = RunLogger(max_steps=100)
+    with MetricCollector(logger, reduce="mean", mode="process", context=context) as collector:
+        workers = [
+            context.Process(target=produce, args=(collector.producer(), value))
+            for value in (1, 3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    assert logger.loss == [2.0] * 100
+
+
+def test_invalid_arguments():
+    logger = RunLogger(max_steps=10)
+    with pytest.raises(ValueError):
+        MetricCollector(logger, reduce="median")
+    with pytest.raises(ValueError):
+        MetricCollector(logger, mode="cluster")
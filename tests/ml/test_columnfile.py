@@ -0,0 +1,95 @@
+import pytest
+
+from iragca.ml import RunLogger
+from iragca.ml.columnfile import read_columns, write_columns
+from iragca.ml.columns import ColumnStore
+
+
+@pytest.fixture(params=["array", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def make_store(backend):
+    store = ColumnStore(backend=backend)
+    for step in range(5):
+        store.append(step, {"loss": 1.0 / (step + 1)})
+    store.append(4, {"acc": 0.9})
+    return store
+
+
+def test_round_trip(tmp_path, backend):
+    path = tmp_path / "run.irgcol"
+    write_columns(path, make_store(backend), max_steps=10)
+
+    store, max_steps = read_columns(path, backend=backend)
+
+    assert max_steps == 10
+    assert store.names == ["loss", "acc"]
+    assert store.steps().tolist() == [0, 1, 2, 3, 4]
+    assert store.to_list("loss") == [1.0, 0.5, 1.0 / 3, 0.25, 0.2]
+    assert store.to_list("acc") == [None, None, None, None, 0.9]
+
+
+def test_float32_columns(tmp_path, backend):
+    path = tmp_path / "run.irgcol"
+    write_columns(path, make_store(backend), max_steps=10, dtype="float32")
+
+    store, _ = read_columns(path, backend=backend)
+
+    assert store.column("loss").tolist() == pytest.approx([1.0, 0.5, 1.0 / 3, 0.25, 0.2])
+    assert path.stat().st_size < 200
+
+
+def test_columns_are_read_only_views(tmp_path, backend):
+    path = tmp_path / "run.irgcol"
+    write_columns(path, make_store(backend), max_steps=10)
+
+    store, _ = read_columns(path, backend=backend)
+    column = store.column("loss")
+
+    with pytest.raises((TypeError, ValueError)):
+        column[0] = 5.0
+
+
+def test_write_after_load_copies(tmp_path, backend):
+    path = tmp_path / "run.irgcol"
+    write_columns(path, make_store(backend), max_steps=10, dtype="float32")
+    size = path.stat().st_size
+
+    store, _ = read_columns(path, backend=backend)
+    store.append(0, {"loss": 5.0})
+    store.append(5, {"loss": 0.1})
+
+    assert store.to_list("loss")[0] == 5.0
+    assert store.steps().tolist() == [0, 1, 2, 3, 4, 5]
+    assert path.stat().st_size == size
+    assert read_columns(path, backend=backend)[0].column("loss")[0] == 1.0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "run.irgcol"
+    path.write_bytes(b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        read_columns(path)
+
+
+def test_logger_save_and_load(tmp_path, backend):
+    path = tmp_path / "run.irgcol"
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics({"loss": 1.0, "acc": 0.5}, step=0)
+    logger.log_metrics({"loss": 0.8, "acc": 0.6}, step=1)
+    logger.save(path)
+
+    loaded = RunLogger.load(path, backend=backend)
+
+    assert loaded.steps == [0, 1]
+    assert loaded.loss == [1.0, 0.8]
+    assert loaded.metrics == ["loss", "acc"]
+    assert loaded.column("acc").tolist() == [0.5, 0.6]
+
+    loaded.log_metrics({"loss": 0.7}, step=2)
+    assert loaded.acc == [0.5, 0.6, None]
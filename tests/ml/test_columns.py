@@ -0,0 +1,115 @@
+import math
+
+import pytest
+
+from iragca.ml.columns import ColumnStore
+
+
+@pytest.fixture(params=["array", "numpy"])
+def store(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return ColumnStore(backend=request.param, capacity=2)
+
+
+def test_append_creates_and_updates_rows(store):
+    assert store.append(0, {"loss": 1.0})
+    assert not store.append(0, {"acc": 0.5})
+
+    assert len(store) == 1
+    assert store.names == ["loss", "acc"]
+    assert store.row(0) == {"loss": 1.0, "acc": 0.5}
+
+
+def test_missing_values_are_nan(store):
+    store.append(0, {"loss": 1.0})
+    store.append(1, {"acc": 0.5})
+
+    assert math.isnan(store.column("loss")[1])
+    assert math.isnan(store.column("acc")[0])
+    assert store.to_list("acc") == [None, 0.5]
+
+
+def test_growth_keeps_existing_views_valid(store):
+    store.append(0, {"loss": 1.0})
+    view = store.column("loss")
+
+    for step in range(1, 100):
+        store.append(step, {"loss": float(step)})
+
+    assert view.tolist() == [1.0]
+    assert len(store.column("loss")) == 100
+    assert store.steps().tolist() == list(range(100))
+
+
+def test_column_is_zero_copy_view(store):
+    store.append(0, {"loss": 1.0})
+    store.append(1, {"loss": 2.0})
+    view = store.column("loss")
+
+    store.append(1, {"loss": 3.0})
+
+    assert view.tolist() == [1.0, 3.0]
+
+
+def test_out_of_order_steps_are_read_sorted(store):
+    store.append(2, {"loss": 0.2})
+    store.append(0, {"loss": 0.0})
+    store.append(1, {"loss": 0.1})
+
+    assert store.steps().tolist() == [0, 1, 2]
+    assert store.to_list("loss") == [0.0, 0.1, 0.2]
+    assert [step for step, _ in store.rows()] == [0, 1, 2]
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        ColumnStore(backend="cuda")
+
+
+def test_out_of_order_step_is_inserted_in_place(store):
+    for step in (0, 10, 20):
+        store.append(step, {"loss": float(step)})
+    store.append(5, {"acc": 0.5})
+    store.append(10, {"acc": 1.0})
+
+    assert store.steps().tolist() == [0, 5, 10, 20]
+    assert store.to_list("loss") == [0.0, None, 10.0, 20.0]
+    assert store.to_list("acc") == [None, 0.5, 1.0, None]
+    assert store.row(5) == {"acc": 0.5}
+    assert store.row(7) is None
+    assert store.last_step == 20
+
+
+def test_delete_and_keep_rows(store):
+    for step in range(6):
+        store.append(step, {"loss": float(step)})
+
+    store.delete_rows(1, 3)
+    assert store.steps().tolist() == [0, 3, 4, 5]
+
+    store.keep_rows([0, 2])
+    assert store.steps().tolist() == [0, 4]
+    assert store.to_list("loss") == [0.0, 4.0]
+
+    # Freed slots are reset so new rows start out missing
+    store.append(6, {"acc": 1.0})
+    assert store.to_list("loss") == [0.0, 4.0, None]
+
+
+def test_extend_appends_columns(store):
+    store.append(0, {"loss": 1.0})
+
+    assert store.extend([1, 2, 3], {"loss": [0.5, 0.4, 0.3], "acc": [0.1, None, 0.3]}) == 3
+    assert store.steps().tolist() == [0, 1, 2, 3]
+    assert store.to_list("acc") == [None, 0.1, None, 0.3]
+
+    # Overlapping steps fall back to row-wise merging
+    assert store.extend([3, 4], {"acc": [0.9, 1.0]}) == 1
+    assert store.to_list("acc") == [None, 0.1, None, 0.9, 1.0]
+    assert store.to_list("loss") == [1.0, 0.5, 0.4, 0.3, None]
+
+    # Missing values do not overwrite values already stored
+    store.extend([1, 2], {"loss": [None, 0.2], "acc": [0.8, float("nan")]})
+    assert store.to_list("loss") == [1.0, 0.5, 0.2, 0.3, None]
+    assert store.to_list("acc") == [None, 0.8, None, 0.9, 1.0]
@@ -0,0 +1,75 @@
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from iragca.ml import Instrumentation, RunLogger
+from iragca.ml.instrumentation import resident_memory
+
+
+def test_timings_stored_as_metrics():
+    logger = RunLogger(max_steps=10, instrument=True)
+    for step in range(5):
+        logger.log_metrics({"loss": 1.0}, step)
+
+    assert logger.metrics == ["loss", "elapsed", "time_per_step", "steps_per_sec", "log_time"]
+    assert logger.elapsed[0] == 0.0
+    assert logger.elapsed == sorted(logger.elapsed)
+    assert logger.time_per_step[0] is None
+    assert logger.log_time[0] is None
+    assert all(value > 0 for value in logger.time_per_step[1:])
+    assert all(value > 0 for value in logger.steps_per_sec[1:])
+    assert all(value > 0 for value in logger.log_time[1:])
+
+
+def test_steps_per_sec_uses_window(monkeypatch):
+    clock = iter([0.0, 1.0, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5])
+    monkeypatch.setattr("iragca.ml.instrumentation.time.perf_counter", lambda: next(clock))
+    instrumentation = Instrumentation(window=2)
+
+    measured = []
+    for _ in range(4):
+        measured.append(instrumentation.start())
+        instrumentation.stop()
+
+    assert measured[1] == {
+        "elapsed": 2.0,
+        "time_per_step": 2.0,
+        "steps_per_sec": 0.5,
+        "log_time": 1.0,
+    }
+    assert measured[3]["steps_per_sec"] == 2 / 2.0
+    assert measured[3]["time_per_step"] == 1.0
+
+
+def test_resources_sampled_at_interval():
+    instrumentation = Instrumentation(resources=True, sample_interval=3600)
+
+    first = instrumentation.start()
+    second = instrumentation.start()
+
+    assert first["gc_collections"] >= 0
+    assert "gc_collections" not in second
+    if resident_memory() is not None:
+        assert first["rss_mb"] > 0
+        assert "rss_mb" not in second
+
+
+def test_instrumentation_in_progress_postfix(monkeypatch):
+    mock_pbar = MagicMock()
+    monkeypatch.setattr("iragca.ml.runlogger.tqdm", lambda total: mock_pbar)
+
+    logger = RunLogger(max_steps=10, display_progress=True, instrument=True)
+    logger.log_metrics({"loss": 1.0}, 0)
+    logger.log_metrics({"loss": 0.5}, 1)
+
+    postfix = mock_pbar.set_postfix.call_args.args[0]
+    assert postfix["loss"] == 0.5
+    assert not math.isnan(postfix["steps_per_sec"])
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Instrumentation(window=0)
+    with pytest.raises(ValueError):
+        Instrumentation(sample_interval=-1)
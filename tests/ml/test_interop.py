@@ -0,0 +1,83 @@
+import math
+
+import pytest
+
+from iragca.ml import RunLogger
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(params=["array", "numpy"])
+def logger(request):
+    logger = RunLogger(max_steps=10, backend=request.param)
+    for step in range(5):
+        logger.log_metrics({"loss": 1.0 / (step + 1)}, step)
+    logger.log_metrics({"acc": 0.9}, 4)
+    return logger
+
+
+def test_to_pandas(logger):
+    frame = logger.to_pandas()
+
+    assert list(frame.columns) == ["step", "loss", "acc"]
+    assert frame["step"].tolist() == [0, 1, 2, 3, 4]
+    assert frame["loss"].tolist() == logger.loss
+    assert frame["acc"].isna().sum() == 4
+
+
+def test_to_pandas_shares_memory_unless_copied(logger):
+    shared = logger.to_pandas()
+    snapshot = logger.to_pandas(copy=True)
+
+    logger.log_metrics({"loss": 42.0}, 4)
+
+    assert shared["loss"].iloc[-1] == 42.0
+    assert snapshot["loss"].iloc[-1] == 0.2
+
+
+def test_pandas_round_trip(logger):
+    restored = RunLogger.from_pandas(logger.to_pandas())
+
+    assert restored.get_logs() == logger.get_logs()
+
+
+def test_from_pandas_uses_index_without_step_column():
+    frame = pd.DataFrame({"loss": [0.3, 0.2]}, index=[10, 20])
+
+    logger = RunLogger.from_pandas(frame, backend="array")
+
+    assert logger.steps == [10, 20]
+    assert logger.loss == [0.3, 0.2]
+
+
+def test_to_arrow_uses_nulls(logger):
+    table = logger.to_arrow()
+
+    assert table.column_names == ["step", "loss", "acc"]
+    assert table.column("acc").null_count == 4
+    assert table.column("step").to_pylist() == [0, 1, 2, 3, 4]
+
+
+def test_arrow_round_trip(logger):
+    restored = RunLogger.from_arrow(logger.to_arrow())
+
+    assert restored.get_logs() == logger.get_logs()
+
+
+def test_from_arrow_requires_step_column():
+    with pytest.raises(KeyError):
+        RunLogger.from_arrow(pa.table({"loss": [1.0]}))
+
+
+def test_parquet_round_trip(logger, tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "run.parquet"
+
+    logger.to_parquet(path)
+    restored = RunLogger.from_parquet(path)
+    partial = RunLogger.from_parquet(path, columns=["acc"])
+
+    assert restored.get_logs() == logger.get_logs()
+    assert partial.metrics == ["acc"]
+    assert math.isclose(partial.acc[-1], 0.9)
@@ -0,0 +1,102 @@
+import pytest
+
+from iragca.ml import RunLogger
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from iragca.matplotlib import Color  # noqa: E402
+from iragca.ml.liveplot import _MinMaxBuckets  # noqa: E402
+
+
+@pytest.fixture
+def logger():
+    logger = RunLogger(max_steps=100)
+    yield logger
+    if logger._plot is not None:
+        logger._plot.close()
+
+
+def test_buckets_keep_min_and_max_per_pixel():
+    buckets = _MinMaxBuckets(origin=0, width=10, count=3)
+    buckets.add(list(range(30)), [float(x % 10) for x in range(30)])
+
+    xs, ys = buckets.points()
+
+    assert xs == [0, 9, 10, 19, 20, 29]
+    assert ys == [0.0, 9.0] * 3
+    assert buckets.limits() == (0.0, 9.0)
+
+
+def test_buckets_widen_merges_neighbours():
+    buckets = _MinMaxBuckets(origin=0, width=1, count=4)
+    buckets.add([0, 1, 2, 3], [3.0, 1.0, 4.0, 2.0])
+
+    buckets.widen(2)
+    buckets.add([4, 7], [0.0, 5.0])
+
+    assert buckets.points() == ([0, 1, 2, 3, 4, 7], [3.0, 1.0, 4.0, 2.0, 0.0, 5.0])
+
+
+def test_live_plot_draws_logged_metrics(logger):
+    plot = logger.live_plot(fps=1e9)
+    for step in range(10):
+        logger.log_metrics({"loss": 1.0 / (step + 1), "acc": step / 10}, step)
+
+    lines = {line.get_label(): line for line in plot.ax.get_lines()}
+    assert set(lines) == {"loss", "acc"}
+    assert list(lines["loss"].get_xdata()) == list(range(10))
+    assert lines["loss"].get_color() == Color.BLUE.value
+    assert plot.frames == 10
+
+
+def test_points_bounded_by_pixel_width(logger):
+    plot = logger.live_plot(["loss"], fps=1e9)
+    pixels = int(plot.ax.bbox.width)
+
+    logger.log_metrics_many(list(range(100_000)), {"loss": [float(i % 7) for i in range(100_000)]})
+    plot.update(force=True)
+
+    (line,) = plot.ax.get_lines()
+    assert len(line.get_xdata()) <= 2 * pixels
+    assert min(line.get_ydata()) == 0.0
+    assert max(line.get_ydata()) == 6.0
+
+
+def test_full_redraws_are_rare(logger):
+    plot = logger.live_plot(["loss"], fps=1e9)
+    for step in range(2000):
+        logger.log_metrics({"loss": 1.0 / (step + 1)}, step)
+
+    assert plot.frames == 2000
+    assert plot.redraws < 15
+    assert plot.ax.get_xlim()[1] > 1999
+
+
+def test_frame_rate_cap(logger):
+    plot = logger.live_plot(fps=1e-3)
+    for step in range(10):
+        logger.log_metrics({"loss": 1.0}, step)
+
+    assert plot.frames == 0
+    assert plot.update(force=True)
+    assert len(plot.ax.get_lines()[0].get_xdata()) == 10
+
+
+def test_out_of_order_rows_are_redrawn(logger):
+    plot = logger.live_plot(fps=1e9)
+    logger.log_metrics({"loss": 1.0}, 0)
+    logger.log_metrics({"loss": 3.0}, 2)
+    logger.log_metrics({"loss": 2.0}, 1)
+
+    assert list(plot.ax.get_lines()[0].get_xdata()) == [0, 1, 2]
+
+
+def test_close_detaches(logger):
+    plot = logger.live_plot()
+    plot.close()
+
+    logger.log_metrics({"loss": 1.0}, 0)
+
+    assert logger._plot is None
+    assert plot.frames == 0
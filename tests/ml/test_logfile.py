@@ -0,0 +1,151 @@
+import pytest
+
+from iragca.ml import RunLogger
+from iragca.ml.logfile import LogReader, LogWriter
+
+
+def test_writer_reader_round_trip(tmp_path):
+    path = tmp_path / "run.irglog"
+    writer = LogWriter(path, max_steps=10, flush_every=2)
+    writer.write(0, {"loss": 1.0})
+    writer.write(1, {"loss": 0.5, "acc": 0.7})
+    writer.write(2, {"acc": None})
+    writer.close()
+
+    reader = LogReader(path)
+    assert list(reader) == [(0, {"loss": 1.0}), (1, {"loss": 0.5, "acc": 0.7}), (2, {})]
+    assert reader.max_steps == 10
+    assert reader.names == ["loss", "acc"]
+    assert reader.end == path.stat().st_size
+
+
+def test_writer_buffers_until_flush_every(tmp_path):
+    path = tmp_path / "run.irglog"
+    writer = LogWriter(path, max_steps=10, flush_every=3, fsync_interval=None)
+    writer.write(0, {"loss": 1.0})
+    writer.write(1, {"loss": 1.0})
+    assert list(LogReader(path)) == []
+
+    writer.write(2, {"loss": 1.0})
+    assert len(list(LogReader(path))) == 3
+    writer.close()
+
+
+def test_writer_flushes_slow_rows_after_fsync_interval(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("iragca.ml.logfile.time.monotonic", lambda: now[0])
+    path = tmp_path / "run.irglog"
+    writer = LogWriter(path, max_steps=10, flush_every=64, fsync_interval=5.0)
+    writer.write(0, {"loss": 1.0})
+    assert list(LogReader(path)) == []
+
+    now[0] = 6.0
+    writer.write(1, {"loss": 0.5})
+    assert len(list(LogReader(path))) == 2
+    writer.close()
+
+
+def test_writer_refuses_existing_log(tmp_path):
+    path = tmp_path / "run.irglog"
+    LogWriter(path, max_steps=10).close()
+
+    with pytest.raises(FileExistsError):
+        LogWriter(path, max_steps=10)
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-log"
+    path.write_bytes(b"hello world, this is not a log")
+
+    with pytest.raises(ValueError):
+        LogReader(path)
+
+
+def test_reader_stops_at_corrupt_record(tmp_path):
+    path = tmp_path / "run.irglog"
+    writer = LogWriter(path, max_steps=10)
+    writer.write(0, {"loss": 1.0})
+    writer.write(1, {"loss": 0.5})
+    writer.close()
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF  # corrupt the last value
+    path.write_bytes(bytes(data))
+
+    assert list(LogReader(path)) == [(0, {"loss": 1.0})]
+
+
+def test_logger_persists_and_resumes(tmp_path):
+    path = tmp_path / "run.irglog"
+    with RunLogger(max_steps=100, path=path) as logger:
+        for step in range(5):
+            logger.log_metrics({"loss": 1.0 / (step + 1)}, step=step)
+
+    resumed = RunLogger.open(path)
+    assert resumed.steps == [0, 1, 2, 3, 4]
+    assert resumed.loss == [1.0, 0.5, 1.0 / 3, 0.25, 0.2]
+    assert resumed.last_step == 4
+
+    resumed.log_metrics({"loss": 0.1, "acc": 0.9}, step=5)
+    resumed.close()
+
+    reopened = RunLogger.open(path)
+    assert reopened.steps == list(range(6))
+    assert reopened.acc == [None] * 5 + [0.9]
+    reopened.close()
+
+
+def test_open_replays_in_batches(tmp_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    path = tmp_path / "run.irglog"
+    with RunLogger(max_steps=10_000, path=path) as logger:
+        for step in [0, 2, 1, 2]:
+            logger.log_metrics({"loss": float(step)}, step=step)
+        logger.log_metrics({"acc": 0.5}, step=0)
+        logger.log_metrics_many(list(range(3, 10_000)), {"loss": [1.0] * 9_997})
+
+    calls = []
+    original = RunLogger.log_metrics_many
+    monkeypatch.setattr(
+        RunLogger,
+        "log_metrics_many",
+        lambda self, steps, metrics: calls.append(len(steps)) or original(self, steps, metrics),
+    )
+    mock_pbar = MagicMock()
+    monkeypatch.setattr("iragca.ml.runlogger.tqdm", lambda total: mock_pbar)
+    resumed = RunLogger.open(path, display_progress=True)
+
+    assert 0 < len(calls) < 10
+    assert resumed.loss[:3] == [0.0, 1.0, 2.0]
+    assert resumed.history[0] == {"loss": 0.0, "acc": 0.5}
+    assert resumed.stats("loss").count == 10_001
+    mock_pbar.update.assert_called_once_with(10_000)
+    resumed.close()
+
+
+def test_logger_skips_torn_last_record(tmp_path):
+    path = tmp_path / "run.irglog"
+    logger = RunLogger(max_steps=100, path=path)
+    for step in range(3):
+        logger.log_metrics({"loss": float(step)}, step=step)
+    logger.close()
+
+    # Simulate a crash in the middle of writing a record
+    with open(path, "ab") as file:
+        file.write(b"\x02\x40\x00\x00")
+
+    resumed = RunLogger.open(path)
+    assert resumed.steps == [0, 1, 2]
+    resumed.log_metrics({"loss": 3.0}, step=3)
+    resumed.close()
+
+    assert RunLogger.open(path).loss == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_logger_path_refuses_existing_log(tmp_path):
+    path = tmp_path / "run.irglog"
+    RunLogger(max_steps=10, path=path).close()
+
+    with pytest.raises(FileExistsError):
+        RunLogger(max_steps=10, path=path)
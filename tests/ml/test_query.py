@@ -0,0 +1,142 @@
+import math
+import random
+
+import pytest
+
+from iragca.ml import RunLogger
+from iragca.ml.query import rolling
+
+np = pytest.importorskip("numpy")
+
+
+def naive(values, keys, how, window=None, span=None, min_periods=1):
+    result = []
+    for i in range(len(values)):
+        if window is not None:
+            rows = range(max(i - window + 1, 0), i + 1)
+        else:
+            rows = [j for j in range(i + 1) if keys[j] > keys[i] - span]
+        present = [values[j] for j in rows if not math.isnan(values[j])]
+        if len(present) < min_periods or not present:
+            result.append(math.nan)
+        elif how == "mean":
+            result.append(sum(present) / len(present))
+        elif how == "std":
+            mean = sum(present) / len(present)
+            result.append(math.sqrt(sum((v - mean) ** 2 for v in present) / len(present)))
+        else:
+            result.append(min(present) if how == "min" else max(present))
+    return result
+
+
+@pytest.fixture
+def series():
+    rng = random.Random(0)
+    values = [rng.gauss(100.0, 1.0) for _ in range(300)]
+    for row in rng.sample(range(300), 30):
+        values[row] = math.nan
+    keys = sorted(rng.sample(range(1000), 300))
+    return values, keys
+
+
+@pytest.mark.parametrize("how", ["mean", "std", "min", "max"])
+@pytest.mark.parametrize("window", [1, 7, 64, 1000])
+def test_rolling_window_matches_naive(series, how, window):
+    values, keys = series
+
+    result = rolling(values, how, window=window)
+
+    np.testing.assert_allclose(result, naive(values, keys, how, window=window), atol=1e-9)
+
+
+@pytest.mark.parametrize("how", ["mean", "std", "min", "max"])
+@pytest.mark.parametrize("span", [1, 10, 75.5])
+def test_rolling_span_matches_naive(series, how, span):
+    values, keys = series
+
+    result = rolling(values, how, span=span, keys=keys, min_periods=2)
+
+    expected = naive(values, keys, how, span=span, min_periods=2)
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+
+def test_rolling_std_has_no_cancellation():
+    rng = np.random.default_rng(1)
+    values = rng.normal(1e6, 1e3, 5_000)
+    values[rng.random(5_000) < 0.5] = np.nan
+
+    result = rolling(values, "std", window=3)
+
+    for row in range(len(values)):
+        window = values[max(row - 2, 0) : row + 1]
+        window = window[~np.isnan(window)]
+        if len(window) == 1:
+            assert result[row] == 0.0
+        elif len(window):
+            assert result[row] == pytest.approx(window.std(), rel=1e-9)
+
+
+def test_rolling_validates_arguments(series):
+    values, keys = series
+
+    with pytest.raises(ValueError):
+        rolling(values, "median", window=3)
+    with pytest.raises(ValueError):
+        rolling(values, window=3, span=3, keys=keys)
+    with pytest.raises(ValueError):
+        rolling(values, span=3)
+    with pytest.raises(ValueError):
+        rolling(values, span=3, keys=keys[::-1])
+    with pytest.raises(ValueError):
+        rolling(values, window=0)
+
+
+@pytest.fixture(params=["array", "numpy"])
+def logger(request):
+    logger = RunLogger(max_steps=100, backend=request.param)
+    logger.log_metrics_many(
+        list(range(0, 200, 2)),
+        {"loss": [float(i) for i in range(100)], "elapsed": [i * 0.5 for i in range(100)]},
+    )
+    return logger
+
+
+def test_select_range(logger):
+    selected = logger.select(10, 20, metrics=["loss"])
+
+    assert set(selected) == {"step", "loss"}
+    assert selected["step"].tolist() == [10, 12, 14, 16, 18]
+    assert selected["loss"].tolist() == [5.0, 6.0, 7.0, 8.0, 9.0]
+    assert len(logger.select()["elapsed"]) == 100
+    with pytest.raises(KeyError):
+        logger.select(metrics=["acc"])
+
+
+def test_rolling_on_logger(logger):
+    assert logger.rolling("loss", window=3)[:4].tolist() == [0.0, 0.5, 1.0, 2.0]
+    assert logger.rolling("loss", how="max", span=5).tolist()[-1] == 99.0
+    assert logger.rolling("loss", how="min", span=5)[-1] == 97.0
+
+
+def test_rolling_range_keeps_earlier_context(logger):
+    full = logger.rolling("loss", window=10)
+    partial = logger.rolling("loss", window=10, start=50, stop=60)
+    timed = logger.rolling("loss", span=2.0, on="elapsed", start=50)
+
+    assert partial.tolist() == full[25:30].tolist()
+    assert timed[0] == np.mean([21.0, 22.0, 23.0, 24.0, 25.0][1:])
+    assert len(timed) == 75
+
+
+def test_rolling_range_past_the_last_step_is_empty(logger):
+    assert len(logger.rolling("loss", window=2, start=500)) == 0
+    assert len(logger.rolling("loss", span=2, start=500)) == 0
+
+
+def test_rolling_on_instrumented_elapsed():
+    logger = RunLogger(max_steps=10, instrument=True)
+    for step in range(5):
+        logger.log_metrics({"loss": float(step)}, step)
+
+    assert logger.elapsed[0] == 0.0
+    assert logger.rolling("loss", span=3600, on="elapsed").tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
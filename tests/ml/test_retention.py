@@ -0,0 +1,105 @@
+import math
+
+import pytest
+
+from iragca.ml import LTTB, EveryNth, MultiResolution, Reservoir, RetentionPolicy, RunLogger
+from iragca.ml.retention import lttb
+
+
+def test_incomplete_policy_fails_on_creation():
+    class Incomplete(RetentionPolicy):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_every_nth():
+    logger = RunLogger(max_steps=100, retention=EveryNth(10))
+    for step in range(100):
+        logger.log_metrics({"loss": float(step)}, step=step)
+
+    assert logger.steps == list(range(0, 100, 10))
+    assert logger.loss == [float(step) for step in range(0, 100, 10)]
+
+
+def test_reservoir_is_bounded_and_consistent():
+    logger = RunLogger(max_steps=10_000, retention=Reservoir(50, seed=0))
+    for step in range(10_000):
+        logger.log_metrics({"loss": float(step)}, step=step)
+        logger.log_metrics({"acc": float(step)}, step=step)
+
+    steps = logger.steps
+    assert len(steps) == 50
+    assert steps == sorted(steps)
+    assert logger.loss == [float(step) for step in steps]
+    assert logger.acc == logger.loss
+    assert steps[-1] > 5_000  # later steps are sampled too
+
+
+def test_multi_resolution_bounds_memory_and_averages():
+    policy = MultiResolution(recent=10, bucket=5, levels=2)
+    logger = RunLogger(max_steps=10_000, retention=policy)
+    for step in range(10_000):
+        logger.log_metrics({"loss": float(step)}, step=step)
+
+    assert len(logger.steps) <= 2 * (10 + 5)
+    assert logger.steps[-10:] == list(range(9_990, 10_000))
+    assert logger.steps == sorted(logger.steps)
+
+    # The first tier-1 row averages the five oldest steps
+    first_bucket = MultiResolution(recent=10, bucket=5, levels=2)
+    small = RunLogger(max_steps=100, retention=first_bucket)
+    for step in range(15):
+        small.log_metrics({"loss": float(step)}, step=step)
+    assert small.steps[0] == 0
+    assert small.loss[0] == pytest.approx(2.0)
+    assert small.steps[1:] == list(range(5, 15))
+
+
+def test_multi_resolution_weights_coarser_tiers():
+    logger = RunLogger(max_steps=1000, retention=MultiResolution(recent=2, bucket=2, levels=3))
+    for step in range(1000):
+        logger.log_metrics({"loss": 1.0}, step=step)
+
+    assert all(value == 1.0 for value in logger.loss)
+    assert len(logger.steps) <= 3 * 4
+
+
+def test_lttb_policy_keeps_shape():
+    logger = RunLogger(max_steps=10_000, retention=LTTB(100))
+    for step in range(10_000):
+        logger.log_metrics({"loss": math.sin(step / 500)}, step=step)
+
+    steps = logger.steps
+    assert len(steps) < 200
+    assert steps[0] == 0 and steps[-1] == 9_999
+    # Peaks and troughs survive repeated reductions
+    assert max(logger.loss) > 0.85
+    assert min(logger.loss) < -0.85
+
+
+def test_lttb_function():
+    x = list(range(10))
+    y = [0, 0, 0, 10, 0, 0, 0, 0, 0, 0]
+
+    selected = lttb(x, y, 4)
+
+    assert selected[0] == 0 and selected[-1] == 9
+    assert 3 in selected
+    assert lttb(x, y, 20) == x
+
+
+def test_retained_series_round_trip_get_logs():
+    logger = RunLogger(max_steps=100, retention=EveryNth(2))
+    for step in range(6):
+        logger.log_metrics({"loss": float(step)}, step=step)
+
+    assert logger.get_logs() == {"step": [0, 2, 4], "loss": [0.0, 2.0, 4.0]}
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        EveryNth(0)
+    with pytest.raises(ValueError):
+        LTTB(2)
@@ -26,6 +26,27 @@ def test_log_single_step_metrics():
     assert logger.acc == [0.9]
 
 
+def test_history_is_a_read_only_mapping():
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics({"loss": 0.5}, step=0)
+    logger.log_metrics({"loss": 0.4, "acc": 0.8}, step=2)
+    history = logger.history
+
+    assert list(history) == [0, 2]
+    assert len(history) == 2
+    assert 2 in history and 1 not in history and "loss" not in history
+    assert dict(history.items()) == {0: {"loss": 0.5}, 2: {"loss": 0.4, "acc": 0.8}}
+    with pytest.raises(KeyError):
+        history[1]
+    with pytest.raises(TypeError):
+        history[3] = {"loss": 0.1}
+
+    history[0]["loss"] = 9.0
+    logger.log_metrics({"loss": 0.3}, step=3)
+    assert logger.history[0] == {"loss": 0.5}
+    assert len(history) == 3
+
+
 def test_log_multiple_steps():
     logger = RunLogger(max_steps=10)
     logger.log_metrics({"loss": 0.5}, 0)
@@ -173,3 +194,133 @@ def test_metrics_property():
     assert "loss" in logger.metrics
     assert "acc" in logger.metrics
     assert len(logger.metrics) == 2
+
+
+@pytest.mark.parametrize("backend", ["array", "numpy"])
+def test_column_returns_buffer_view(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    logger = RunLogger(max_steps=10, backend=backend)
+    logger.log_metrics({"loss": 1.0}, step=0)
+    logger.log_metrics({"acc": 0.5}, step=1)
+
+    assert logger.column("step").tolist() == [0, 1]
+    assert logger.column("loss")[0] == 1.0
+    assert logger.column("loss")[1] != logger.column("loss")[1]  # NaN marks missing
+    assert logger.acc == [None, 0.5]
+
+
+def test_column_unknown_metric_raises():
+    logger = RunLogger(max_steps=10)
+
+    with pytest.raises(KeyError):
+        logger.column("loss")
+
+
+def test_log_metrics_many():
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics({"loss": 1.0}, step=0)
+    logger.log_metrics_many([1, 2, 3], {"loss": [0.5, 0.4, 0.3], "acc": [0.1, None, 0.3]})
+
+    assert logger.steps == [0, 1, 2, 3]
+    assert logger.loss == [1.0, 0.5, 0.4, 0.3]
+    assert logger.acc == [None, 0.1, None, 0.3]
+    assert logger.stats("loss").min_step == 3
+    assert logger.stats("acc").count == 2
+
+
+def test_log_metrics_many_out_of_order_merges():
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics_many([0, 2, 4], {"loss": [1.0, 0.8, 0.6]})
+    logger.log_metrics_many([3, 2], {"acc": [0.3, 0.2]})
+
+    assert logger.steps == [0, 2, 3, 4]
+    assert logger.loss == [1.0, 0.8, None, 0.6]
+    assert logger.acc == [None, 0.2, 0.3, None]
+
+
+def test_log_metrics_many_numpy_columns():
+    np = pytest.importorskip("numpy")
+    logger = RunLogger(max_steps=1000)
+    steps = np.arange(1000)
+    loss = np.linspace(1.0, 0.0, 1000)
+
+    logger.log_metrics_many(steps, {"loss": loss})
+
+    assert np.array_equal(logger.column("loss"), loss)
+    assert logger.stats("loss").mean == pytest.approx(loss.mean())
+    assert logger.stats("loss").variance == pytest.approx(loss.var())
+
+
+def test_log_metrics_many_length_mismatch():
+    logger = RunLogger(max_steps=10)
+
+    with pytest.raises(ValueError):
+        logger.log_metrics_many([0, 1], {"loss": [1.0]})
+
+
+def test_log_metrics_many_length_mismatch_writes_nothing(tmp_path):
+    from iragca.ml import EveryNth
+
+    for logger in [
+        RunLogger(max_steps=10, retention=EveryNth(1)),
+        RunLogger(max_steps=10, path=tmp_path / "run.irglog"),
+    ]:
+        with pytest.raises(ValueError):
+            logger.log_metrics_many([0, 1], {"loss": [1.0, 2.0], "acc": [1.0]})
+        with pytest.raises(ValueError):
+            logger.log_metrics_many([0, 1], {"loss": [1.0, 2.0, 3.0]})
+        assert logger.steps == []
+        logger.close()
+
+
+def test_log_metrics_many_advances_progress_once():
+    logger = RunLogger(max_steps=10, display_progress=True)
+    logger.pbar = MagicMock()
+    logger.pbar.n = 0
+
+    logger.log_metrics_many([0, 1, 2], {"loss": [1.0, 0.5, 0.2]})
+
+    logger.pbar.update.assert_called_once_with(3)
+    logger.pbar.set_postfix.assert_called_once()
+
+
+def test_refresh_rate_renders_off_thread(monkeypatch):
+    mock_pbar = MagicMock()
+    monkeypatch.setattr("iragca.ml.runlogger.tqdm", lambda total: mock_pbar)
+
+    logger = RunLogger(max_steps=1000, display_progress=True, refresh_rate=1000)
+    for step in range(100):
+        logger.log_metrics({"loss": float(step)}, step)
+    logger.close()
+
+    rendered = sum(call.args[0] for call in mock_pbar.update.call_args_list)
+    assert rendered == 100
+    assert mock_pbar.update.call_count < 100
+    mock_pbar.set_postfix.assert_called_with({"loss": 99.0}, refresh=False)
+    mock_pbar.close.assert_called_once()
+
+
+def test_refresh_rate_closes_at_max_steps(monkeypatch):
+    mock_pbar = MagicMock()
+    monkeypatch.setattr("iragca.ml.runlogger.tqdm", lambda total: mock_pbar)
+
+    logger = RunLogger(max_steps=10, display_progress=True, refresh_rate=200)
+    logger.log_metrics_many(list(range(10)), {"loss": [0.1] * 10})
+    logger._renderer._thread.join(timeout=5)
+
+    assert not logger._renderer.running
+    mock_pbar.close.assert_called_once()
+
+
+def test_progress_renderer_copies_postfix():
+    from iragca.ml.progress import ProgressRenderer
+
+    mock_pbar = MagicMock()
+    renderer = ProgressRenderer(mock_pbar, refresh_rate=1000, total=10)
+    postfix = {"loss": 1.0}
+    renderer.record(1, postfix)
+    postfix["loss"] = 2.0
+    renderer.stop()
+
+    mock_pbar.set_postfix.assert_called_with({"loss": 1.0}, refresh=False)
@@ -0,0 +1,125 @@
+import pytest
+
+from iragca.ml import RunLogger
+from iragca.ml.shards import batches, concat_rows, merge_rows
+
+
+def make_logger(steps, **values):
+    logger = RunLogger(max_steps=100)
+    for row, step in enumerate(steps):
+        logger.log_metrics({name: column[row] for name, column in values.items()}, step)
+    return logger
+
+
+def test_merge_rows_interleaves_shards():
+    first = iter([(0, {"a": 1.0}), (2, {"a": 3.0})])
+    second = iter([(1, {"a": 2.0}), (3, {"a": 4.0})])
+
+    assert list(merge_rows([first, second])) == [
+        (0, {"a": 1.0}),
+        (1, {"a": 2.0}),
+        (2, {"a": 3.0}),
+        (3, {"a": 4.0}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [("last", {"a": 3.0, "b": 1.0}), ("mean", {"a": 2.0, "b": 1.0})],
+)
+def test_merge_rows_conflicts(policy, expected):
+    first = iter([(0, {"a": 1.0, "b": 1.0})])
+    second = iter([(0, {"a": 3.0})])
+
+    assert list(merge_rows([first, second], policy)) == [(0, expected)]
+
+
+def test_merge_rows_error_on_disagreement():
+    agreeing = merge_rows([iter([(0, {"a": 1.0})]), iter([(0, {"a": 1.0})])], "error")
+    disagreeing = merge_rows([iter([(0, {"a": 1.0})]), iter([(0, {"a": 2.0})])], "error")
+
+    assert list(agreeing) == [(0, {"a": 1.0})]
+    with pytest.raises(ValueError, match="Conflicting"):
+        list(disagreeing)
+
+
+def test_merge_rows_unknown_policy():
+    with pytest.raises(ValueError):
+        list(merge_rows([], "first"))
+
+
+def test_concat_rows_rejects_overlap_and_renumbers():
+    shards = [[(0, {}), (1, {})], [(0, {}), (1, {})]]
+
+    with pytest.raises(ValueError, match="overlapping"):
+        list(concat_rows(map(iter, shards)))
+    assert [step for step, _ in concat_rows(map(iter, shards), renumber=True)] == [0, 1, 2, 3]
+
+
+def test_batches_combine_repeated_steps():
+    rows = [(0, {"a": 1.0}), (0, {"b": 2.0}), (1, {"a": 3.0}), (2, {"b": 4.0})]
+
+    assert list(batches(rows, size=2)) == [
+        ([0, 1], {"a": [1.0, 3.0], "b": [2.0, None]}),
+        ([2], {"b": [4.0]}),
+    ]
+
+
+def test_merge_loggers_and_dicts():
+    first = make_logger([0, 2, 4], loss=[1.0, 0.8, 0.6])
+    second = make_logger([1, 3], loss=[0.9, 0.7], acc=[0.1, 0.2])
+    third = {"step": [5, 4], "loss": [0.5, 0.0]}
+
+    merged = RunLogger.merge([first, second, third], on_conflict="mean")
+
+    assert merged.steps == [0, 1, 2, 3, 4, 5]
+    assert merged.loss == [1.0, 0.9, 0.8, 0.7, 0.3, 0.5]
+    assert merged.acc == [None, 0.1, None, 0.2, None, None]
+    assert merged.stats("loss").count == 6
+
+
+def test_merge_files_lazily(tmp_path):
+    with RunLogger(max_steps=50, path=tmp_path / "a.irglog") as logger:
+        for step in range(0, 10, 2):
+            logger.log_metrics({"loss": float(step)}, step)
+            logger.log_metrics({"acc": 0.5}, step)
+    make_logger([1, 3], loss=[1.0, 3.0]).save(tmp_path / "b.irgcol")
+
+    merged = RunLogger.merge([tmp_path / "a.irglog", str(tmp_path / "b.irgcol")])
+
+    assert merged.steps == [0, 1, 2, 3, 4, 6, 8]
+    assert merged.loss == [0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 8.0]
+    assert merged.acc == [0.5, None, 0.5, None, 0.5, 0.5, 0.5]
+    assert merged._max_steps == 100
+
+
+def test_merge_rejects_unsorted_log_file(tmp_path):
+    with RunLogger(max_steps=10, path=tmp_path / "a.irglog") as logger:
+        logger.log_metrics({"loss": 1.0}, 5)
+        logger.log_metrics({"loss": 2.0}, 1)
+
+    with pytest.raises(ValueError, match="out of order"):
+        RunLogger.merge([tmp_path / "a.irglog"])
+
+
+def test_merge_rejects_unknown_sources(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("not a log")
+
+    with pytest.raises(ValueError):
+        RunLogger.merge([path])
+    with pytest.raises(TypeError):
+        RunLogger.merge([[1, 2, 3]])
+
+
+def test_concat_resumed_runs():
+    first = make_logger([0, 1], loss=[1.0, 0.9])
+    second = make_logger([0, 1], loss=[0.8, 0.7])
+
+    chained = RunLogger.concat([first, second], renumber=True)
+
+    assert chained.steps == [0, 1, 2, 3]
+    assert chained.loss == [1.0, 0.9, 0.8, 0.7]
+    assert chained._max_steps == 200
+    with pytest.raises(ValueError):
+        RunLogger.concat([first, second])
@@ -0,0 +1,132 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from iragca.ml import RunLogger
+from iragca.ml.stats import MetricStats, QuantileSketch
+
+
+def test_metric_stats_matches_batch_computation():
+    values = [random.Random(0).gauss(0, 1) for _ in range(1000)]
+    stats = MetricStats(ema_alpha=0.5)
+    for step, value in enumerate(values):
+        stats.update(value, step)
+
+    assert stats.count == 1000
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.variance == pytest.approx(statistics.pvariance(values))
+    assert stats.min == min(values)
+    assert stats.min_step == values.index(min(values))
+    assert stats.max_step == values.index(max(values))
+    assert stats.last == values[-1]
+
+
+def test_metric_stats_ema():
+    stats = MetricStats(ema_alpha=0.5)
+    for step, value in enumerate([0.0, 1.0, 1.0]):
+        stats.update(value, step)
+
+    assert stats.ema == pytest.approx(0.75)
+
+
+def test_metric_stats_skips_missing_values():
+    stats = MetricStats()
+    stats.update(None, 0)
+    stats.update(math.nan, 1)
+    assert stats.count == 0
+    assert math.isnan(stats.mean)
+
+    stats.update(2.0, 2)
+    assert stats.to_dict()["min_step"] == 2
+
+
+def test_quantile_sketch_is_bounded_and_accurate():
+    sketch = QuantileSketch(k=200, seed=0)
+    values = list(range(100_000))
+    random.Random(1).shuffle(values)
+    for value in values:
+        sketch.add(value)
+
+    assert len(sketch) < 3 * 200
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert sketch.quantile(q) == pytest.approx(q * 100_000, abs=2_000)
+
+
+def test_quantile_sketch_errors():
+    sketch = QuantileSketch()
+    with pytest.raises(ValueError):
+        sketch.quantile(0.5)
+    sketch.add(1.0)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_logger_stats():
+    logger = RunLogger(max_steps=10, ema_alpha=0.5)
+    for step, loss in enumerate([1.0, 0.5, 0.7]):
+        logger.log_metrics({"loss": loss}, step=step)
+
+    stats = logger.stats("loss")
+    assert stats.min == 0.5 and stats.min_step == 1
+    assert stats.max == 1.0 and stats.max_step == 0
+    assert stats.mean == pytest.approx(2.2 / 3)
+    assert stats.quantile(0.5) == 0.7
+
+    with pytest.raises(KeyError):
+        logger.stats("acc")
+
+
+def test_logger_stats_computed_for_loaded_logs(tmp_path):
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics({"loss": 1.0}, step=0)
+    logger.log_metrics({"loss": 0.5}, step=1)
+    logger.save(tmp_path / "run.irgcol")
+
+    loaded = RunLogger.load(tmp_path / "run.irgcol")
+
+    assert loaded.stats("loss").min_step == 1
+    assert loaded.stats("loss").count == 2
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_logging_after_load_backfills_stats(tmp_path, batch):
+    logger = RunLogger(max_steps=10)
+    for step, loss in enumerate([3.0, 1.0, 2.0]):
+        logger.log_metrics({"loss": loss}, step=step)
+    logger.save(tmp_path / "run.irgcol")
+
+    loaded = RunLogger.load(tmp_path / "run.irgcol")
+    if batch:
+        loaded.log_metrics_many([3], {"loss": [4.0]})
+    else:
+        loaded.log_metrics({"loss": 4.0}, step=3)
+
+    stats = loaded.stats("loss")
+    assert stats.count == 4
+    assert stats.mean == 2.5
+    assert (stats.min_step, stats.max_step, stats.last_step) == (1, 3, 3)
+
+
+def test_empty_batch_creates_no_stats():
+    logger = RunLogger(max_steps=10)
+    logger.log_metrics_many([], {"loss": []})
+
+    with pytest.raises(KeyError):
+        logger.stats("loss")
+
+
+@pytest.mark.parametrize("first", [0, 10])
+def test_update_many_matches_update(first):
+    values = [random.Random(2).uniform(-5, 5) for _ in range(500)]
+    values[7] = math.nan
+    one, many = MetricStats(ema_alpha=0.3), MetricStats(ema_alpha=0.3)
+    for step, value in enumerate(values):
+        one.update(value, step)
+    for step, value in enumerate(values[:first]):
+        many.update(value, step)
+    many.update_many(values[first:], list(range(first, len(values))))
+
+    for key, value in one.to_dict().items():
+        assert many.to_dict()[key] == pytest.approx(value)
@@ -0,0 +1,84 @@
+import pytest
+
+from iragca.ml import MetricView, RunLogger
+
+
+@pytest.fixture(params=["array", "numpy"])
+def logger(request):
+    logger = RunLogger(max_steps=100, backend=request.param)
+    for step in range(0, 20, 2):
+        logger.log_metrics({"loss": float(step)}, step)
+    return logger
+
+
+def test_metric_returns_cached_view(logger):
+    view = logger.metric("loss")
+
+    assert isinstance(view, MetricView)
+    assert logger["loss"] is view
+    assert view.values is view.values
+    assert view.values == [float(step) for step in range(0, 20, 2)]
+
+
+def test_view_invalidated_by_new_data(logger):
+    view = logger["loss"]
+    before = view.values
+
+    logger.log_metrics({"loss": 100.0}, 20)
+
+    assert view.values is not before
+    assert view.values[-1] == 100.0
+    assert len(view) == 11
+
+
+def test_view_indexed_by_step(logger):
+    view = logger["loss"]
+
+    assert view[4] == 4.0
+    with pytest.raises(KeyError):
+        view[3]
+
+
+def test_view_slices_by_step_range(logger):
+    window = logger["loss"][4:10]
+
+    assert window.steps == [4, 6, 8]
+    assert window.values == [4.0, 6.0, 8.0]
+    assert window[5:][:9].steps == [6, 8]
+    assert list(window.array()) == [4.0, 6.0, 8.0]
+    with pytest.raises(KeyError):
+        window[12]
+
+    logger.log_metrics({"loss": 5.0}, 5)
+    assert window.steps == [4, 5, 6, 8]
+
+
+def test_view_rejects_stride(logger):
+    with pytest.raises(ValueError):
+        logger["loss"][::2]
+
+
+def test_missing_values_are_none(logger):
+    logger.log_metrics({"acc": 0.5}, 2)
+
+    assert logger["acc"].values == [None, 0.5] + [None] * 8
+    assert repr(logger["acc"][2:4]) == "<MetricView: acc[2:4], steps=1>"
+
+
+def test_unknown_metric_raises_key_error(logger):
+    with pytest.raises(KeyError):
+        logger.metric("accuracy")
+
+
+def test_metric_attributes_do_not_leak_between_loggers():
+    first = RunLogger(max_steps=10)
+    first.log_metrics({"only_on_first": 1.0}, 0)
+    first.add_metric_property("registered")
+
+    second = RunLogger(max_steps=10)
+
+    assert first.registered == [None]
+    assert "only_on_first" not in vars(RunLogger)
+    assert "registered" not in vars(RunLogger)
+    assert not hasattr(second, "only_on_first")
+    assert not hasattr(second, "registered")